@@ -15,14 +15,16 @@ from app.core.config import settings
 from app.core.database import Base
 from app.models import (
     User, Category, Expense, ExpenseImage, IncomeRecord,
-    ChatHistory, Plan, Subscription, UsageLog, Notification, NotificationSetting
+    ChatHistory, ChatSession, Plan, Subscription, UsageLog, UsageCounter, Notification, NotificationSetting,
+    Job
 )
 
 # Alembic Config object
 config = context.config
 
-# Override sqlalchemy.url from settings
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+# Override sqlalchemy.url from settings (scripts migrating a scratch DB pass database_url)
+database_url = config.attributes.get("database_url", settings.DATABASE_URL)
+config.set_main_option("sqlalchemy.url", database_url.replace("%", "%%"))
 
 # Setup logging
 if config.config_file_name is not None:
@@ -0,0 +1,75 @@
+"""Composite indexes for hot query shapes
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # user_id 단일 인덱스는 아래 복합 인덱스의 선두 컬럼으로 대체됨
+    op.drop_index('ix_expenses_user_id', table_name='expenses')
+    op.drop_index('ix_income_records_user_id', table_name='income_records')
+    op.drop_index('ix_chat_histories_user_id', table_name='chat_histories')
+    op.drop_index('ix_usage_logs_user_id', table_name='usage_logs')
+
+    # Expenses - LedgerService 기간 조회/집계, ExpenseService.get_list 정렬 (date DESC, id DESC)
+    # PostgreSQL에서는 INCLUDE 컬럼으로 집계 쿼리를 index-only scan으로 처리
+    op.create_index(
+        'ix_expenses_user_date',
+        'expenses',
+        ['user_id', 'date', 'id'],
+        postgresql_include=['amount', 'is_deductible', 'category_id'],
+    )
+
+    # Income Records - LedgerService 기간 조회/집계
+    op.create_index(
+        'ix_income_records_user_date',
+        'income_records',
+        ['user_id', 'date'],
+        postgresql_include=['amount'],
+    )
+
+    # Usage Logs - UserService.get_usage_info (user_id, year_month 별 action_type 집계)
+    op.create_index(
+        'ix_usage_logs_user_month_action',
+        'usage_logs',
+        ['user_id', 'year_month', 'action_type'],
+    )
+
+    # Chat Histories - ChatService.get_history (최신순, 세션 필터)
+    op.create_index(
+        'ix_chat_histories_user_created',
+        'chat_histories',
+        ['user_id', 'created_at'],
+    )
+    op.create_index(
+        'ix_chat_histories_user_session_created',
+        'chat_histories',
+        ['user_id', 'session_id', 'created_at'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_chat_histories_user_session_created', table_name='chat_histories')
+    op.drop_index('ix_chat_histories_user_created', table_name='chat_histories')
+    op.drop_index('ix_usage_logs_user_month_action', table_name='usage_logs')
+    op.drop_index('ix_income_records_user_date', table_name='income_records')
+    op.drop_index('ix_expenses_user_date', table_name='expenses')
+
+    op.create_index('ix_usage_logs_user_id', 'usage_logs', ['user_id'])
+    op.create_index('ix_chat_histories_user_id', 'chat_histories', ['user_id'])
+    op.create_index('ix_income_records_user_id', 'income_records', ['user_id'])
+    op.create_index('ix_expenses_user_id', 'expenses', ['user_id'])
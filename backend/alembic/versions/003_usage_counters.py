@@ -0,0 +1,46 @@
+"""Usage counters
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Usage Counters table
+    op.create_table(
+        'usage_counters',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('year_month', sa.String(7), nullable=False),
+        sa.Column('action_type', sa.String(30), nullable=False),
+        sa.Column('used', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'year_month', 'action_type')
+    )
+
+    # 기존 사용량 로그에서 카운터 백필
+    op.execute(
+        """
+        INSERT INTO usage_counters (user_id, year_month, action_type, used, updated_at)
+        SELECT user_id, year_month, action_type, COUNT(*), CURRENT_TIMESTAMP
+        FROM usage_logs
+        GROUP BY user_id, year_month, action_type
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('usage_counters')
@@ -0,0 +1,26 @@
+"""Chat history cached input tokens
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('chat_histories', sa.Column('cached_input_tokens', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('chat_histories', 'cached_input_tokens')
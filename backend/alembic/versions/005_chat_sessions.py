@@ -0,0 +1,37 @@
+"""Chat sessions
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Chat Sessions table (rolling summary per session)
+    op.create_table(
+        'chat_sessions',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('session_id', sa.String(100), nullable=False),
+        sa.Column('summary', sa.Text(), nullable=True),
+        sa.Column('summarized_until_id', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'session_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('chat_sessions')
@@ -0,0 +1,27 @@
+"""Chat history stage timings
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Per-stage latency breakdown (tracing) for each chat answer
+    op.add_column('chat_histories', sa.Column('timings', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('chat_histories', 'timings')
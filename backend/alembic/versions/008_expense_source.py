@@ -0,0 +1,34 @@
+"""Expense source and linked chat columns
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 모델에는 있지만 001에 빠진 컬럼 (init_db의 create_all로 만든 DB에는 이미 있음)
+    columns = {column['name'] for column in sa.inspect(op.get_bind()).get_columns('expenses')}
+    if 'source' not in columns:
+        op.add_column('expenses', sa.Column('source', sa.String(20), nullable=False, server_default='manual'))
+        op.create_index('ix_expenses_source', 'expenses', ['source'])
+    if 'linked_chat_id' not in columns:
+        op.add_column('expenses', sa.Column('linked_chat_id', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('expenses', 'linked_chat_id')
+    op.drop_index('ix_expenses_source', table_name='expenses')
+    op.drop_column('expenses', 'source')
@@ -2,12 +2,12 @@
 Chat API endpoints
 """
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.security import get_current_user
-from app.models.user import User
+from app.core.security import get_current_principal, UserPrincipal
+from app.core.warmup import require_ai_ready
 from app.schemas.chat import (
     ChatRequest,
     ChatResponse,
@@ -16,14 +16,17 @@ from app.schemas.chat import (
     FeedbackRequest,
 )
 from app.services.chat_service import ChatService
+from app.services.category_registry import category_registry
+from app.services.session_memory import needs_summary, refresh_summary
 
 router = APIRouter(prefix="/chat", tags=["AI 상담"])
 
 
-@router.post("/ask", response_model=ChatResponse)
+@router.post("/ask", response_model=ChatResponse, dependencies=[Depends(require_ai_ready)])
 async def ask_question(
     request: ChatRequest,
-    current_user: User = Depends(get_current_user),
+    background_tasks: BackgroundTasks,
+    current_user: UserPrincipal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -41,6 +44,12 @@ async def ask_question(
         session_id=request.session_id,
         channel="web"
     )
+
+    # 오래된 턴은 응답 후 세션 요약으로 압축
+    session_id = response.get("session_id")
+    if session_id and needs_summary(current_user.id, session_id):
+        background_tasks.add_task(refresh_summary, current_user.id, session_id)
+
     return ChatResponse(**response)
 
 
@@ -49,7 +58,7 @@ async def get_chat_history(
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
     session_id: Optional[str] = None,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -67,12 +76,12 @@ async def get_chat_history(
         session_id=session_id
     )
 
-    # Convert to response items
+    # Convert to response items (category names from registry, no lazy load)
+    await category_registry.ensure_loaded(db)
     history_items = []
     for item in items:
-        category_name = None
-        if item.category:
-            category_name = item.category.name
+        category = category_registry.get(item.category_id)
+        category_name = category.name if category else None
 
         history_items.append(ChatHistoryItem(
             id=item.id,
@@ -96,7 +105,7 @@ async def get_chat_history(
 @router.post("/feedback")
 async def add_feedback(
     request: FeedbackRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """
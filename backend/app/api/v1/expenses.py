@@ -4,12 +4,12 @@ Expense API endpoints
 from datetime import date
 from decimal import Decimal
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File, Form
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import get_db
-from app.core.security import get_current_user
-from app.models.user import User
+from app.core.security import get_current_principal, UserPrincipal
 from app.schemas.expense import (
     ExpenseCreate,
     ExpenseUpdate,
@@ -18,49 +18,51 @@ from app.schemas.expense import (
     ClassifyRequest,
     ClassifyResponse,
     CategoryInfo,
+    ExpenseImportResponse,
+    ExpenseBulkUpdate,
+    ExpenseBulkConfirm,
+    ExpenseBulkResult,
 )
+from app.services.category_registry import category_registry
 from app.services.expense_service import ExpenseService
+from app.services.expense_import import ExpenseImportService, IMPORT_EXTENSIONS
 
 router = APIRouter(prefix="/expenses", tags=["지출 관리"])
 
 
-def _expense_to_response(expense) -> ExpenseResponse:
-    """Convert expense model to response"""
-    category = None
-    if expense.category:
-        category = CategoryInfo(
-            id=expense.category.id,
-            code=expense.category.code,
-            name=expense.category.name,
-            is_deductible=expense.category.is_deductible
-        )
+def _category_info(category_id: Optional[int]) -> Optional[CategoryInfo]:
+    """Category from the in-memory registry (no relationship load)"""
+    entry = category_registry.get(category_id)
+    if not entry:
+        return None
+    return CategoryInfo(
+        id=entry.id,
+        code=entry.code,
+        name=entry.name,
+        is_deductible=entry.is_deductible
+    )
 
-    ai_category = None
-    if expense.ai_category:
-        ai_category = CategoryInfo(
-            id=expense.ai_category.id,
-            code=expense.ai_category.code,
-            name=expense.ai_category.name,
-            is_deductible=expense.ai_category.is_deductible
-        )
 
+def _expense_to_response(expense, classification_job_id: Optional[str] = None) -> ExpenseResponse:
+    """Convert expense model to response"""
     return ExpenseResponse(
         id=expense.id,
         date=expense.date,
         description=expense.description,
         amount=expense.amount,
         vat_amount=expense.vat_amount,
-        category=category,
+        category=_category_info(expense.category_id),
         payment_method=expense.payment_method,
         evidence_type=expense.evidence_type,
         vendor=expense.vendor,
         memo=expense.memo,
         is_deductible=expense.is_deductible,
         ai_classified=expense.ai_classified,
-        ai_category=ai_category,
+        ai_category=_category_info(expense.ai_category_id),
         ai_confidence=float(expense.ai_confidence) if expense.ai_confidence else None,
         ai_reason=expense.ai_reason,
         is_confirmed=expense.is_confirmed,
+        classification_job_id=classification_job_id,
         created_at=expense.created_at,
         updated_at=expense.updated_at
     )
@@ -69,7 +71,7 @@ def _expense_to_response(expense) -> ExpenseResponse:
 @router.post("", response_model=ExpenseResponse, status_code=status.HTTP_201_CREATED)
 async def create_expense(
     request: ExpenseCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -84,13 +86,93 @@ async def create_expense(
     - **evidence_type**: 증빙유형 (none, card, cash_receipt, tax_invoice)
     - **vendor**: 가맹점 (선택)
     - **memo**: 메모 (선택)
+    - **auto_classify**: 계정과목 미지정 시 AI 분류를 백그라운드로 실행 (classification_job_id로 조회)
+    """
+    expense_service = ExpenseService(db)
+    try:
+        expense, job = await expense_service.create(current_user.id, request)
+        return _expense_to_response(expense, job.id if job else None)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.post("/import", response_model=ExpenseImportResponse, status_code=status.HTTP_201_CREATED)
+async def import_expenses(
+    file: UploadFile = File(...),
+    auto_classify: bool = Form(True),
+    current_user: UserPrincipal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    카드 명세서 일괄 등록 (CSV, XLSX)
+
+    - **file**: 카드사 명세서 (이용일자/이용금액/가맹점명 등 헤더 자동 인식)
+    - **auto_classify**: 등록한 지출의 AI 분류를 백그라운드로 실행 (classification_job_ids로 조회)
+
+    기존 지출과 날짜, 금액, 가맹점이 같은 행은 건너뜁니다.
+    """
+    filename = file.filename or ""
+    if not filename.lower().endswith(IMPORT_EXTENSIONS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="CSV 또는 XLSX 파일만 등록할 수 있습니다"
+        )
+    if file.size and file.size > settings.IMPORT_MAX_FILE_MB * 1024 * 1024:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"파일 크기는 {settings.IMPORT_MAX_FILE_MB}MB 이하여야 합니다"
+        )
+
+    import_service = ExpenseImportService(db)
+    try:
+        summary = await import_service.import_statement(
+            user_id=current_user.id,
+            file=file.file,
+            filename=filename,
+            auto_classify=auto_classify
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return ExpenseImportResponse(**summary)
+
+
+@router.patch("/bulk", response_model=ExpenseBulkResult)
+async def bulk_update_expenses(
+    request: ExpenseBulkUpdate,
+    current_user: UserPrincipal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    지출 일괄 수정
+
+    - **ids**: 지출 ID 목록 (최대 1000건)
+    - **category_id**: 계정과목 (선택, 경비인정 여부도 함께 변경)
+    - **is_deductible**: 경비인정 여부 (선택)
+    - **is_confirmed**: 확정 여부 (선택)
     """
     expense_service = ExpenseService(db)
     try:
-        expense = await expense_service.create(current_user.id, request)
-        return _expense_to_response(expense)
+        result = await expense_service.bulk_update(current_user.id, request)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return ExpenseBulkResult(**result)
+
+
+@router.post("/bulk/confirm", response_model=ExpenseBulkResult)
+async def bulk_confirm_expenses(
+    request: ExpenseBulkConfirm,
+    current_user: UserPrincipal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    지출 일괄 확정
+
+    계정과목이 없는 지출은 AI 분류 결과를 계정과목으로 확정합니다.
+    """
+    expense_service = ExpenseService(db)
+    result = await expense_service.bulk_confirm(current_user.id, request.ids)
+    return ExpenseBulkResult(**result)
 
 
 @router.get("", response_model=ExpenseList)
@@ -101,7 +183,7 @@ async def get_expenses(
     end_date: Optional[date] = None,
     category_id: Optional[int] = None,
     is_deductible: Optional[bool] = None,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -137,7 +219,7 @@ async def get_expenses(
 @router.get("/{expense_id}", response_model=ExpenseResponse)
 async def get_expense(
     expense_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """지출 상세 조회"""
@@ -157,7 +239,7 @@ async def get_expense(
 async def update_expense(
     expense_id: int,
     request: ExpenseUpdate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """지출 수정"""
@@ -176,7 +258,7 @@ async def update_expense(
 @router.delete("/{expense_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_expense(
     expense_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """지출 삭제"""
@@ -193,7 +275,7 @@ async def delete_expense(
 @router.post("/{expense_id}/classify", response_model=ExpenseResponse)
 async def classify_expense(
     expense_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """AI 지출 분류 (기존 지출)"""
@@ -212,7 +294,7 @@ async def classify_expense(
 @router.post("/classify", response_model=ClassifyResponse)
 async def classify_description(
     request: ClassifyRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -0,0 +1,150 @@
+"""
+Job API endpoints - 백그라운드 작업 (AI 분류, 장부 내보내기)
+"""
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.security import get_current_principal, UserPrincipal
+from app.models.job import Job
+from app.schemas.job import JobResponse
+from app.schemas.ledger import ExportRequest
+from app.services.expense_service import ExpenseService
+from app.services.job_queue import (
+    job_queue, result_path, result_expired, CLASSIFY_EXPENSE, EXPORT_LEDGER, SUCCEEDED
+)
+from app.services.user_service import UserService
+
+router = APIRouter(prefix="/jobs", tags=["백그라운드 작업"])
+
+
+def _job_to_response(job: Job) -> JobResponse:
+    """Convert job model to response"""
+    download_url = None
+    if job.type == EXPORT_LEDGER and job.status == SUCCEEDED and not result_expired(job):
+        download_url = f"{settings.API_V1_PREFIX}/jobs/{job.id}/download"
+
+    return JobResponse(
+        id=job.id,
+        type=job.type,
+        status=job.status,
+        attempts=job.attempts,
+        max_attempts=job.max_attempts,
+        result=job.result,
+        error=job.error,
+        download_url=download_url,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at
+    )
+
+
+@router.post("/expenses/{expense_id}/classify", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def enqueue_classify_expense(
+    expense_id: int,
+    current_user: UserPrincipal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db)
+):
+    """AI 지출 분류 (백그라운드) - 작업 ID를 반환하고 GET /jobs/{job_id}로 결과를 조회합니다"""
+    expense_service = ExpenseService(db)
+    if not await expense_service.exists(expense_id, current_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="지출 내역을 찾을 수 없습니다"
+        )
+
+    job = await job_queue.enqueue(db, current_user.id, CLASSIFY_EXPENSE, {"expense_id": expense_id})
+    return _job_to_response(job)
+
+
+@router.post("/ledger/export", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def enqueue_export_ledger(
+    request: ExportRequest,
+    current_user: UserPrincipal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    장부 내보내기 (백그라운드)
+
+    - **start_date**: 시작일
+    - **end_date**: 종료일
+    - **format**: 파일 형식 (excel, csv)
+
+    완료 후 GET /jobs/{job_id}/download로 파일을 받습니다.
+    """
+    if request.format not in ("excel", "csv"):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="지원하지 않는 파일 형식입니다"
+        )
+    if request.end_date < request.start_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="종료일이 시작일보다 빠릅니다"
+        )
+
+    # Pre-check only: usage is consumed when the export actually runs
+    user_service = UserService(db)
+    if not await user_service.check_usage_limit(current_user.id, "export"):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="이번 달 내보내기 횟수를 모두 사용하셨습니다"
+        )
+
+    job = await job_queue.enqueue(db, current_user.id, EXPORT_LEDGER, {
+        "start_date": request.start_date.isoformat(),
+        "end_date": request.end_date.isoformat(),
+        "format": request.format,
+    })
+    return _job_to_response(job)
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: str,
+    current_user: UserPrincipal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db)
+):
+    """작업 상태 조회"""
+    job = await job_queue.get(db, job_id, current_user.id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="작업을 찾을 수 없습니다"
+        )
+    return _job_to_response(job)
+
+
+@router.get("/{job_id}/download")
+async def download_job_result(
+    job_id: str,
+    current_user: UserPrincipal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_db)
+):
+    """내보내기 작업 결과 파일 다운로드"""
+    job = await job_queue.get(db, job_id, current_user.id)
+    if not job or job.type != EXPORT_LEDGER:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="작업을 찾을 수 없습니다"
+        )
+    if job.status != SUCCEEDED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="작업이 아직 완료되지 않았습니다"
+        )
+
+    path = result_path(job.id, job.result["extension"])
+    if result_expired(job) or not path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="결과 파일이 만료되었습니다"
+        )
+
+    return FileResponse(
+        path,
+        media_type=job.result["media_type"],
+        filename=job.result["filename"]
+    )
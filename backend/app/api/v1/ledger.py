@@ -4,18 +4,20 @@ Ledger and Dashboard API endpoints
 from datetime import date
 from calendar import monthrange
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
+from fastapi.responses import StreamingResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
+import asyncio
 import io
 
+from app.core.config import settings
 from app.core.database import get_db
-from app.core.security import get_current_user
-from app.models.user import User
+from app.core.security import get_current_principal, UserPrincipal
 from app.schemas.ledger import (
     LedgerResponse, DashboardResponse, ExportRequest
 )
-from app.services.ledger_service import LedgerService
+from app.services.ledger_service import LedgerService, render_export, EXPORT_MEDIA_TYPES
+from app.services.category_registry import category_registry
 from app.services.user_service import UserService
 
 router = APIRouter(tags=["장부/통계"])
@@ -25,7 +27,7 @@ router = APIRouter(tags=["장부/통계"])
 async def get_ledger(
     year: int = Query(..., ge=2020, le=2100),
     month: Optional[int] = Query(None, ge=1, le=12),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -61,7 +63,7 @@ async def export_ledger(
     year: int = Query(..., ge=2020, le=2100),
     month: Optional[int] = Query(None, ge=1, le=12),
     format: str = Query("excel", pattern="^(excel|csv)$"),
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -96,72 +98,17 @@ async def export_ledger(
         end_date=end_date
     )
 
-    if format == "csv":
-        # Generate CSV
-        output = io.StringIO()
-        output.write("날짜,내용,수입,지출,계정과목,증빙유형,경비인정\n")
-        for entry in entries:
-            deductible = "O" if entry.is_deductible else ("X" if entry.is_deductible is False else "-")
-            output.write(f"{entry.date},{entry.description},{entry.income},{entry.expense},{entry.category_name or ''},{entry.evidence_type},{deductible}\n")
-
-        output.write(f"\n요약\n")
-        output.write(f"총 수입,{summary.total_income}\n")
-        output.write(f"총 지출,{summary.total_expense}\n")
-        output.write(f"경비인정액,{summary.deductible_expense}\n")
-        output.write(f"순이익,{summary.net_income}\n")
-        output.write(f"예상세금,{summary.estimated_tax}\n")
-
-        content = output.getvalue().encode('utf-8-sig')
-        media_type = "text/csv"
-        filename = f"{filename}.csv"
+    # Workbook build/save is CPU-bound, keep it off the event loop
+    content, extension = await asyncio.to_thread(render_export, entries, summary, format)
+    media_type = EXPORT_MEDIA_TYPES[extension]
+    filename = f"{filename}.{extension}"
 
-    else:
-        # Generate Excel using openpyxl if available, otherwise fallback to CSV
-        try:
-            from openpyxl import Workbook
-            from openpyxl.utils.dataframe import dataframe_to_rows
-
-            wb = Workbook()
-            ws = wb.active
-            ws.title = "간편장부"
-
-            # Headers
-            ws.append(["날짜", "내용", "수입", "지출", "계정과목", "증빙유형", "경비인정"])
-
-            # Data
-            for entry in entries:
-                deductible = "O" if entry.is_deductible else ("X" if entry.is_deductible is False else "-")
-                ws.append([
-                    str(entry.date),
-                    entry.description,
-                    float(entry.income),
-                    float(entry.expense),
-                    entry.category_name or "",
-                    entry.evidence_type,
-                    deductible
-                ])
-
-            # Summary
-            ws.append([])
-            ws.append(["요약"])
-            ws.append(["총 수입", float(summary.total_income)])
-            ws.append(["총 지출", float(summary.total_expense)])
-            ws.append(["경비인정액", float(summary.deductible_expense)])
-            ws.append(["순이익", float(summary.net_income)])
-            ws.append(["예상세금", float(summary.estimated_tax)])
-
-            output = io.BytesIO()
-            wb.save(output)
-            content = output.getvalue()
-            media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            filename = f"{filename}.xlsx"
-
-        except ImportError:
-            # Fallback to CSV if openpyxl not available
-            return await export_ledger(year, month, "csv", current_user, db)
-
-    # Log usage
-    await user_service.log_usage(current_user.id, "export")
+    # Consume usage atomically (committed by get_db)
+    if not await user_service.consume_usage(current_user.id, "export"):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="이번 달 내보내기 횟수를 모두 사용하셨습니다"
+        )
 
     return StreamingResponse(
         io.BytesIO(content),
@@ -172,7 +119,7 @@ async def export_ledger(
 
 @router.get("/dashboard", response_model=DashboardResponse)
 async def get_dashboard(
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -185,29 +132,39 @@ async def get_dashboard(
     return DashboardResponse(**data)
 
 
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check (weak comparison: W/ prefix ignored, lists and * accepted)"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
 @router.get("/categories")
-async def get_categories(db: AsyncSession = Depends(get_db)):
+async def get_categories(request: Request, db: AsyncSession = Depends(get_db)):
     """
     계정과목 목록 조회
 
     지출 분류에 사용할 수 있는 계정과목 목록을 반환합니다.
     """
-    from sqlalchemy import select
-    from app.models.category import Category
-
-    result = await db.execute(
-        select(Category).order_by(Category.sort_order)
+    await category_registry.ensure_loaded(db)
+
+    headers = {
+        "Cache-Control": f"public, max-age={settings.CATEGORIES_CACHE_MAX_AGE_SECONDS}",
+        "ETag": category_registry.etag,
+    }
+    if _etag_matches(request.headers.get("if-none-match"), category_registry.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return Response(
+        content=category_registry.json,
+        media_type="application/json",
+        headers=headers,
     )
-    categories = result.scalars().all()
-
-    return [
-        {
-            "id": cat.id,
-            "code": cat.code,
-            "name": cat.name,
-            "name_en": cat.name_en,
-            "description": cat.description,
-            "is_deductible": cat.is_deductible
-        }
-        for cat in categories
-    ]
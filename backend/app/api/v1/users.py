@@ -5,7 +5,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
-from app.core.security import get_current_user
+from app.core.security import get_current_user, get_current_principal, UserPrincipal
 from app.models.user import User
 from app.schemas.user import (
     UserResponse,
@@ -23,7 +23,7 @@ router = APIRouter(prefix="/users", tags=["사용자"])
 
 @router.get("/me", response_model=UserWithSubscription)
 async def get_me(
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -101,7 +101,7 @@ async def update_business_info(
 
 @router.get("/me/dashboard", response_model=UserDashboard)
 async def get_dashboard(
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -123,7 +123,7 @@ async def get_dashboard(
 
 @router.get("/me/usage", response_model=UsageInfo)
 async def get_usage(
-    current_user: User = Depends(get_current_user),
+    current_user: UserPrincipal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """
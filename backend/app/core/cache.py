@@ -0,0 +1,59 @@
+"""
+In-process cache utilities
+"""
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+# Sentinel for "not cached" (None is a valid cached value)
+MISSING = object()
+
+# name -> cache, for hit ratio metrics (/metrics)
+caches: Dict[str, "TTLCache"] = {}
+
+
+class TTLCache:
+    """Small in-process cache with per-entry expiry and a size bound"""
+
+    def __init__(self, ttl: float, maxsize: int = 10000, name: Optional[str] = None):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+        if name:
+            caches[name] = self
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Any:
+        """Get cached value, or default if missing/expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._data.pop(key, None)
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Cache value for ttl seconds (default: cache ttl)"""
+        if key not in self._data and len(self._data) >= self.maxsize:
+            # Evict the oldest entry (dicts keep insertion order)
+            self._data.pop(next(iter(self._data)), None)
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single entry"""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
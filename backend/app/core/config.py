@@ -23,23 +23,50 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str = "sqlite+aiosqlite:///./taxaigent.db"
+    DB_ECHO: bool = False
+    # Connection pool (PostgreSQL, 워커당 설정)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    # SQLite
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KB: int = 20000
 
     # JWT
     JWT_SECRET_KEY: str = "your-super-secret-key-change-in-production"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24  # 24 hours
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # bcrypt 해싱 스레드 수 (동시 로그인 처리량 상한)
+    PASSWORD_HASH_WORKERS: int = 2
 
     # Kakao OAuth
     KAKAO_CLIENT_ID: Optional[str] = None
     KAKAO_CLIENT_SECRET: Optional[str] = None
     KAKAO_REDIRECT_URI: str = "http://localhost:3001/api/auth/callback/kakao"
 
+    # Outbound HTTP client (shared connection pool)
+    HTTP_CLIENT_HTTP2: bool = True
+    HTTP_CLIENT_MAX_CONNECTIONS: int = 100
+    HTTP_CLIENT_MAX_KEEPALIVE: int = 20
+    HTTP_CLIENT_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_CLIENT_TIMEOUT: float = 10.0
+    HTTP_CLIENT_CONNECT_TIMEOUT: float = 5.0
+    # 동일 카카오 액세스 토큰 재사용 시 프로필 조회 생략
+    KAKAO_PROFILE_CACHE_TTL_SECONDS: int = 60
+
     # LLM APIs
     GEMINI_API_KEY: Optional[str] = None
     GEMINI_MODEL: str = "gemini-2.0-flash-lite"
+    # 명시적 context cache TTL (0 = system instruction + implicit prefix 캐싱만 사용)
+    GEMINI_CONTEXT_CACHE_TTL_SECONDS: int = 0
     OPENAI_API_KEY: Optional[str] = None
     OPENAI_MODEL: str = "gpt-4o-mini"
+    # OpenAI 호환 엔드포인트 (벤치마크용 가짜 서버 등, 미설정 시 api.openai.com)
+    OPENAI_BASE_URL: Optional[str] = None
 
     # Pinecone
     PINECONE_API_KEY: Optional[str] = None
@@ -49,8 +76,77 @@ class Settings(BaseSettings):
     # Redis
     REDIS_URL: Optional[str] = None
 
+    # Cache
+    # 요금제 한도 캐시 (시드 외 DB 직접 수정은 워커별로 최대 TTL만큼 늦게 반영)
+    PLAN_CACHE_TTL_SECONDS: int = 300
+    SUBSCRIPTION_CACHE_TTL_SECONDS: int = 60
+    # 인증 사용자 캐시 (상태 변경은 워커별로 최대 TTL만큼 늦게 반영될 수 있음)
+    USER_CACHE_TTL_SECONDS: int = 30
+    # /categories 응답 브라우저/CDN 캐시 (ETag로 재검증)
+    CATEGORIES_CACHE_MAX_AGE_SECONDS: int = 86400
+
     # Embedding
     EMBEDDING_MODEL: str = "nlpai-lab/KoE5"
+    # torch | onnx | onnx-int8 (onnx는 scripts/export_onnx_embedding.py 실행 필요)
+    EMBEDDING_BACKEND: str = "torch"
+    EMBEDDING_ONNX_DIR: str = "data/onnx/koe5"
+    EMBEDDING_ONNX_THREADS: int = 0  # 0 = onnxruntime 기본값 (코어 수)
+    EMBEDDING_MAX_LENGTH: int = 512
+    EMBEDDING_BATCH_SIZE: int = 32
+    # FAISS 인덱스 저장 위치 (미설정 시 data/vector_store, 다른 임베딩 모델은 별도 디렉터리 사용)
+    VECTOR_STORE_DIR: Optional[str] = None
+    # RAG 컨텍스트 토큰 예산
+    RAG_CONTEXT_MAX_TOKENS: int = 1200
+    RAG_CONTEXT_DOC_MAX_TOKENS: int = 400
+    RAG_CONTEXT_DEDUPE_OVERLAP: float = 0.6
+    # 상담 세션 메모리 (최근 N턴 원문 + 이전 대화 요약)
+    SESSION_HISTORY_TURNS: int = 4
+    SESSION_SUMMARY_BATCH: int = 4
+    SESSION_TURN_MAX_TOKENS: int = 200
+    SESSION_SUMMARY_MAX_TOKENS: int = 400
+    SESSION_CACHE_TTL_SECONDS: int = 600
+    SESSION_CACHE_MAXSIZE: int = 10000
+    # 임베딩/검색 사이드카 (Unix socket, 설정 시 워커는 모델/인덱스를 로드하지 않음)
+    EMBEDDING_SIDECAR_SOCKET: Optional[str] = None
+    EMBEDDING_SIDECAR_MAX_BATCH: int = 64
+    EMBEDDING_SIDECAR_MAX_WAIT_MS: float = 5.0
+    EMBEDDING_SIDECAR_CONNECT_TIMEOUT: float = 300.0
+    EMBEDDING_SIDECAR_REQUEST_TIMEOUT: float = 30.0
+    # 백그라운드 작업 큐 (AI 분류, 장부 내보내기)
+    JOB_QUEUE_REDIS: bool = False  # True + REDIS_URL: 워커 간 Redis 리스트로 분배 (기본: 프로세스 내 큐)
+    JOB_CLASSIFY_CONCURRENCY: int = 4  # 작업 유형별 동시 실행 수 (워커 프로세스당)
+    JOB_EXPORT_CONCURRENCY: int = 2
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETRY_BACKOFF_SECONDS: float = 2.0  # 재시도 간격 (시도마다 2배)
+    JOB_TIMEOUT_SECONDS: float = 120.0
+    JOB_RESULT_DIR: str = "data/jobs"  # 내보내기 결과 파일
+    JOB_RESULT_TTL_SECONDS: int = 86400  # 결과 파일 보관 기간 (이후 삭제, 작업은 expired 표시)
+    JOB_MAINTENANCE_INTERVAL_SECONDS: float = 300.0  # 만료 결과 정리/유실 작업 복구 주기 (프로세스 내 큐는 시작 직후만 복구)
+    # 카드 명세서 일괄 등록 (CSV/XLSX)
+    IMPORT_MAX_FILE_MB: int = 20
+    IMPORT_MAX_ROWS: int = 50000
+    IMPORT_CHUNK_SIZE: int = 1000  # 검증/INSERT 단위 (행)
+    IMPORT_CLASSIFY_JOB_SIZE: int = 200  # 분류 작업 1건당 지출 수
+    IMPORT_CLASSIFY_BATCH_SIZE: int = 20  # LLM 호출 1회에 분류할 항목 수
+    # 시작 시 모델/인덱스 백그라운드 로딩 (False면 첫 요청에서 로딩)
+    AI_WARMUP_ON_STARTUP: bool = True
+    AI_WARMUP_RETRY_AFTER_SECONDS: int = 10
+
+    # Tracing (요청별 단계 시간 측정, OTLP JSON 호환 출력)
+    TRACING_ENABLED: bool = True
+    # none | stdout | file (none이어도 상담 내역에 단계별 시간은 저장됨)
+    TRACING_EXPORTER: str = "none"
+    TRACING_FILE: str = "logs/traces.jsonl"
+    TRACING_MIN_DURATION_MS: float = 0.0  # 이보다 빠른 요청은 내보내지 않음
+
+    # Prometheus /metrics (워커 프로세스별 값, 스크레이프 시 워커 구분 필요)
+    METRICS_ENABLED: bool = True
+    # 이벤트 루프 지연 샘플링 주기
+    LOOP_MONITOR_INTERVAL_SECONDS: float = 0.5
+    # 이 시간 이상 루프가 응답하지 않으면 스택과 함께 기록 (0 = watchdog 비활성화)
+    LOOP_BLOCK_THRESHOLD_MS: int = 200
+    # asyncio debug 모드 (slow callback 경고, 개발 환경용)
+    LOOP_ASYNCIO_DEBUG: bool = False
 
     # CORS
     CORS_ORIGINS: list[str] = ["http://localhost:3000", "http://127.0.0.1:3000"]
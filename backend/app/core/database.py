@@ -1,19 +1,105 @@
 """
 Database configuration and session management
 """
+import time
+from sqlalchemy import event, exc
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.config import settings
+from app.core.tracing import instrument_engine
+
+
+class PoolStats:
+    """Connection acquisition statistics (per process)"""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, wait_seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += wait_seconds
+        if wait_seconds > self.wait_seconds_max:
+            self.wait_seconds_max = wait_seconds
+
+
+pool_stats = PoolStats()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each connection checkout waited"""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            pool_stats.timeouts += 1
+            raise
+        finally:
+            pool_stats.record(time.perf_counter() - start)
+
+
+def _is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _engine_kwargs(url: str) -> dict:
+    """Engine options for the configured backend"""
+    kwargs = {
+        # SQL 로그는 DEBUG와 분리 (운영에서 전체 쿼리 로깅 방지)
+        "echo": settings.DB_ECHO,
+        "future": True,
+    }
+
+    if _is_sqlite(url):
+        # aiosqlite: file DB는 NullPool, memory DB는 StaticPool (dialect 기본값)
+        return kwargs
+
+    kwargs.update(
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+
+    if "+asyncpg" in url:
+        # asyncpg prepared statement cache (PgBouncer transaction mode에서는 0)
+        kwargs["connect_args"] = {"statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE}
+
+    return kwargs
 
 
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    future=True,
+    **_engine_kwargs(settings.DATABASE_URL),
 )
 
+
+# SQL 실행별 db.query span
+instrument_engine(engine.sync_engine)
+
+
+if _is_sqlite(settings.DATABASE_URL):
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):  # noqa: ARG001
+        """SQLite tuning: WAL for concurrent readers, relaxed fsync, busy wait"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute(f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KB}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -45,6 +131,29 @@ async def get_db() -> AsyncSession:
             await session.close()
 
 
+def get_pool_stats() -> dict:
+    """Connection pool metrics for sizing the pool per worker"""
+    pool = engine.sync_engine.pool
+    stats = {"pool_class": type(pool).__name__}
+
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update(
+            pool_size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=pool.overflow(),
+        )
+
+    stats.update(
+        checkouts=pool_stats.checkouts,
+        timeouts=pool_stats.timeouts,
+        wait_ms_avg=round(pool_stats.wait_seconds_total / pool_stats.checkouts * 1000, 3)
+        if pool_stats.checkouts else 0.0,
+        wait_ms_max=round(pool_stats.wait_seconds_max * 1000, 3),
+    )
+    return stats
+
+
 async def init_db():
     """Initialize database tables"""
     async with engine.begin() as conn:
@@ -0,0 +1,62 @@
+"""
+Shared outbound HTTP client - 프로세스 전역 커넥션 풀
+"""
+from typing import Optional
+import httpx
+
+from app.core.config import settings
+
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    """HTTP/2 requires the optional h2 package (httpx[http2])"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def _build_client() -> httpx.AsyncClient:
+    """Create pooled keep-alive client from settings"""
+    http2 = settings.HTTP_CLIENT_HTTP2 and _http2_available()
+    if settings.HTTP_CLIENT_HTTP2 and not http2:
+        print("h2 package not installed, outbound HTTP client falls back to HTTP/1.1")
+
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE,
+            keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            settings.HTTP_CLIENT_TIMEOUT,
+            connect=settings.HTTP_CLIENT_CONNECT_TIMEOUT,
+        ),
+    )
+
+
+async def init_http_client() -> None:
+    """Create shared client (called from FastAPI lifespan)"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+
+
+async def close_http_client() -> None:
+    """Close shared client and its pooled connections"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get shared client (created lazily outside of lifespan, e.g. in scripts)"""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = _build_client()
+    return _client
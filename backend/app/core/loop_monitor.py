@@ -0,0 +1,136 @@
+"""
+Loop monitor - 이벤트 루프 지연 측정 / 블로킹 감지
+주기적으로 sleep한 뒤 실제로 깨어난 시각과의 차이(lag)를 기록합니다. lag가 크면 루프를 막는 동기 호출이 있다는 뜻입니다.
+별도 watchdog 스레드가 루프에 ping을 보내고, 임계값 안에 응답이 없으면 그 순간 루프 스레드의 스택을 기록합니다.
+"""
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Deque, Optional
+
+from app.core.config import settings
+from app.core.metrics import event_loop_lag, registry
+
+
+# 블로킹 스택 출력 시 표시할 최대 프레임 수 (안쪽부터)
+STACK_LIMIT = 25
+
+
+class LoopMonitor:
+    """Samples event loop lag and reports blocking callbacks (per process)"""
+
+    def __init__(self):
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.blocks = 0
+        self.recent_blocks: Deque[dict] = deque(maxlen=20)
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    async def _sample(self) -> None:
+        interval = settings.LOOP_MONITOR_INTERVAL_SECONDS
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(interval)
+            lag = max(0.0, time.perf_counter() - start - interval)
+            self.last_lag = lag
+            if lag > self.max_lag:
+                self.max_lag = lag
+            event_loop_lag.observe(lag)
+
+    def _watch(self, loop: asyncio.AbstractEventLoop, loop_thread_id: int) -> None:
+        """Watchdog thread: ping the loop, capture its stack when the ping is late"""
+        threshold = settings.LOOP_BLOCK_THRESHOLD_MS / 1000
+        pong = threading.Event()
+
+        while not self._stop.wait(threshold / 2):
+            pong.clear()
+            try:
+                loop.call_soon_threadsafe(pong.set)
+            except RuntimeError:
+                return  # loop closed
+            start = time.perf_counter()
+            if pong.wait(threshold):
+                continue
+
+            # 블로킹 중: 지금 실행 중인 코드의 스택을 캡처
+            frame = sys._current_frames().get(loop_thread_id)
+            stack = "".join(traceback.format_stack(frame, limit=STACK_LIMIT)) if frame else ""
+            while not pong.wait(threshold) and not self._stop.is_set():
+                pass
+            blocked_ms = (time.perf_counter() - start) * 1000
+
+            self.blocks += 1
+            self.recent_blocks.append({
+                "at": time.time(),
+                "blocked_ms": round(blocked_ms, 1),
+                "stack": stack,
+            })
+            print(f"Event loop blocked for {blocked_ms:.0f}ms (threshold {settings.LOOP_BLOCK_THRESHOLD_MS}ms):\n{stack}")
+
+    def start(self) -> None:
+        """Start sampling and the watchdog on the running loop (called from FastAPI lifespan)"""
+        loop = asyncio.get_running_loop()
+
+        if settings.LOOP_ASYNCIO_DEBUG:
+            # asyncio 자체 slow callback 경고 (logging 'asyncio' 로거, 오버헤드가 있어 개발용)
+            loop.set_debug(True)
+            loop.slow_callback_duration = settings.LOOP_BLOCK_THRESHOLD_MS / 1000 or 0.1
+
+        if settings.LOOP_MONITOR_INTERVAL_SECONDS > 0 and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._sample())
+
+        if settings.LOOP_BLOCK_THRESHOLD_MS > 0 and self._watchdog is None:
+            self._stop.clear()
+            self._watchdog = threading.Thread(
+                target=self._watch,
+                args=(loop, threading.get_ident()),
+                name="loop-watchdog",
+                daemon=True,
+            )
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stop.set()
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+            self._watchdog = None
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def to_dict(self, include_stacks: bool = False) -> dict:
+        """Lag and block counters (blocking stacks expose source paths, so only on request)"""
+        data = {
+            "lag_ms_last": round(self.last_lag * 1000, 3),
+            "lag_ms_max": round(self.max_lag * 1000, 3),
+            "block_threshold_ms": settings.LOOP_BLOCK_THRESHOLD_MS,
+            "blocks": self.blocks,
+        }
+        if include_stacks:
+            data["recent_blocks"] = list(self.recent_blocks)
+        return data
+
+
+loop_monitor = LoopMonitor()
+
+registry.gauge(
+    "event_loop_lag_last_seconds", "Most recent loop lag sample",
+    lambda: [((), loop_monitor.last_lag)],
+)
+registry.gauge(
+    "event_loop_lag_max_seconds", "Largest loop lag since start",
+    lambda: [((), loop_monitor.max_lag)],
+)
+registry.gauge(
+    "event_loop_blocks_total", "Times the loop did not answer the watchdog within the threshold",
+    lambda: [((), loop_monitor.blocks)], kind="counter",
+)
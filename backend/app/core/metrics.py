@@ -0,0 +1,308 @@
+"""
+Metrics - Prometheus 텍스트 형식 메트릭
+핫패스에서는 카운터/히스토그램 버킷 증가만 수행하고, 풀/캐시 같은 상태값은 /metrics 수집 시점에 읽습니다.
+"""
+import bisect
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+
+
+# 초 단위 기본 버킷 (HTTP/LLM 지연)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# 임베딩/FAISS/이벤트 루프 지연처럼 짧은 구간
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """Base class: name, help text and label names"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    def collect(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    """Monotonic counter"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}" for labels, value in items]
+
+
+class Histogram(Metric):
+    """Fixed-bucket histogram (cumulative buckets rendered at scrape time)"""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (+Inf last), sum]
+        self._values: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def time(self, *labels: str) -> "_Timer":
+        """Context manager observing elapsed seconds"""
+        return _Timer(self, labels)
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            items = [(labels, list(counts), total) for labels, (counts, total) in self._values.items()]
+
+        lines = []
+        for labels, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="' + _number(bound) + '"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class _Timer:
+    def __init__(self, histogram: Histogram, labels: LabelValues):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(time.perf_counter() - self.start, *self.labels)
+        return False
+
+
+class GaugeCollector(Metric):
+    """Gauge (or counter) whose samples are read from a callback at scrape time"""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        callback: Callable[[], Iterable[Tuple[LabelValues, float]]],
+        labelnames: Sequence[str] = (),
+        kind: str = "gauge",
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.kind = kind
+        self.callback = callback
+
+    def collect(self) -> List[str]:
+        try:
+            samples = list(self.callback())
+        except Exception as e:
+            print(f"Metric collection failed ({self.name}): {e}")
+            return []
+        return [f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}" for labels, value in samples]
+
+
+class MetricsRegistry:
+    """All metrics exposed by this process"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets=LATENCY_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge(self, name: str, documentation: str, callback, labelnames: Sequence[str] = (), kind: str = "gauge") -> GaugeCollector:
+        return self.register(GaugeCollector(name, documentation, callback, labelnames, kind))
+
+    def render(self) -> str:
+        """Prometheus text exposition format 0.0.4"""
+        lines = []
+        for metric in self._metrics.values():
+            samples = metric.collect()
+            if samples:
+                lines.extend(metric.header())
+                lines.extend(samples)
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# =============================================================================
+# Hot-path metrics
+# =============================================================================
+
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template",
+    ("method", "route", "status"),
+)
+embedding_batch_size = registry.histogram(
+    "embedding_batch_size", "Texts per embedding call", ("backend",), buckets=SIZE_BUCKETS,
+)
+embedding_duration = registry.histogram(
+    "embedding_duration_seconds", "Embedding call latency", ("backend",), buckets=FAST_BUCKETS,
+)
+vector_search_duration = registry.histogram(
+    "vector_search_duration_seconds", "Vector index search latency", ("store",), buckets=FAST_BUCKETS,
+)
+llm_request_duration = registry.histogram(
+    "llm_request_duration_seconds", "LLM request latency", ("provider", "model"),
+)
+llm_tokens = registry.counter(
+    "llm_tokens_total", "LLM tokens by kind (input, cached_input, output)", ("provider", "model", "kind"),
+)
+llm_errors = registry.counter(
+    "llm_errors_total", "Failed LLM requests (before fallback)", ("provider", "model"),
+)
+event_loop_lag = registry.histogram(
+    "event_loop_lag_seconds", "Delay of the loop lag sampler wake-up", buckets=FAST_BUCKETS,
+)
+
+
+def _pool_samples():
+    from app.core.database import get_pool_stats
+
+    stats = get_pool_stats()
+    for key in ("pool_size", "checked_out", "checked_in", "overflow"):
+        if key in stats:
+            yield (key,), stats[key]
+
+
+def _pool_wait_samples():
+    from app.core.database import pool_stats
+
+    yield ("checkouts",), pool_stats.checkouts
+    yield ("timeouts",), pool_stats.timeouts
+
+
+def _cache_samples(attribute: str):
+    def samples():
+        from app.core.cache import caches
+
+        for name, cache in list(caches.items()):
+            if attribute == "hit_ratio":
+                lookups = cache.hits + cache.misses
+                yield (name,), cache.hits / lookups if lookups else 0.0
+            elif attribute == "size":
+                yield (name,), len(cache)
+            else:
+                yield (name,), getattr(cache, attribute)
+    return samples
+
+
+def _parse_samples(attribute: str):
+    def samples():
+        from app.services.structured_output import parse_stats
+
+        for name, stats in list(parse_stats.items()):
+            yield (name,), getattr(stats, attribute)
+    return samples
+
+
+registry.gauge("db_pool_connections", "Connection pool state", _pool_samples, ("state",))
+registry.gauge("db_pool_checkouts_total", "Pool checkouts and timeouts", _pool_wait_samples, ("event",), kind="counter")
+registry.gauge("cache_hits_total", "In-process cache hits", _cache_samples("hits"), ("cache",), kind="counter")
+registry.gauge("cache_misses_total", "In-process cache misses", _cache_samples("misses"), ("cache",), kind="counter")
+registry.gauge("cache_hit_ratio", "In-process cache hit ratio since start", _cache_samples("hit_ratio"), ("cache",))
+registry.gauge("cache_entries", "In-process cache entries", _cache_samples("size"), ("cache",))
+registry.gauge("llm_structured_output_total", "Structured output parse attempts", _parse_samples("total"), ("output",), kind="counter")
+registry.gauge("llm_structured_output_failure_ratio", "Structured output parse failure ratio", _parse_samples("failure_rate"), ("output",))
+
+
+# =============================================================================
+# HTTP middleware
+# =============================================================================
+
+class MetricsMiddleware:
+    """ASGI middleware recording request latency by route template (not raw path)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            # 라우트 템플릿 기준 (/expenses/{expense_id}) - 경로별 라벨 폭증 방지
+            route_path: Optional[str] = getattr(route, "path", None) or "unmatched"
+            http_request_duration.observe(
+                time.perf_counter() - start, scope["method"], route_path, str(status_code)
+            )
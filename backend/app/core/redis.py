@@ -0,0 +1,63 @@
+"""
+Redis client (optional - REDIS_URL 설정 시에만 사용)
+"""
+from typing import Optional
+
+from app.core.config import settings
+
+
+_client = None
+
+
+def get_redis():
+    """Get shared async Redis client, or None if Redis is not configured"""
+    global _client
+    if not settings.REDIS_URL:
+        return None
+
+    if _client is None:
+        import redis.asyncio as redis
+        _client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+    return _client
+
+
+async def close_redis() -> None:
+    """Close shared Redis client"""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
+
+
+async def redis_get(key: str) -> Optional[str]:
+    """GET that treats Redis errors as a cache miss"""
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        return await client.get(key)
+    except Exception as e:
+        print(f"Redis get error: {e}")
+        return None
+
+
+async def redis_set(key: str, value: str, ttl: int) -> None:
+    """SETEX that ignores Redis errors"""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        await client.set(key, value, ex=ttl)
+    except Exception as e:
+        print(f"Redis set error: {e}")
+
+
+async def redis_delete(key: str) -> None:
+    """DEL that ignores Redis errors"""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        await client.delete(key)
+    except Exception as e:
+        print(f"Redis delete error: {e}")
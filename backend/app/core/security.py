@@ -1,6 +1,10 @@
 """
 Security utilities - JWT, Password hashing
 """
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from typing import Optional, Any
 from jose import JWTError, jwt
@@ -10,14 +14,42 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from app.core.cache import TTLCache, MISSING
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.redis import redis_get, redis_set, redis_delete
 from app.models.user import User
 
 # JWT Bearer scheme
 security = HTTPBearer()
 
 
+@dataclass(frozen=True)
+class UserPrincipal:
+    """Slim authenticated user record (cached per user id)"""
+    id: int
+    status: str
+    is_admin: bool
+    business_type: Optional[str]
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserPrincipal":
+        return cls(
+            id=user.id,
+            status=user.status,
+            is_admin=user.is_admin,
+            business_type=user.business_type,
+        )
+
+
+# user_id -> UserPrincipal (None if user does not exist)
+_principal_cache = TTLCache(ttl=settings.USER_CACHE_TTL_SECONDS, name="user_principal")
+
+
+def _principal_redis_key(user_id: int) -> str:
+    return f"user_principal:{user_id}"
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against hashed password"""
     return bcrypt.checkpw(
@@ -34,6 +66,25 @@ def get_password_hash(password: str) -> str:
     ).decode('utf-8')
 
 
+# Bounded thread pool for bcrypt (bcrypt releases the GIL while hashing)
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token"""
     to_encode = data.copy()
@@ -67,44 +118,115 @@ def decode_token(token: str) -> Optional[dict]:
         return None
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db)
-) -> User:
-    """Get current authenticated user from JWT token"""
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    token = credentials.credentials
+
+def _get_user_id_from_token(token: str) -> int:
+    """Decode access token and return user id (raises 401)"""
     payload = decode_token(token)
 
     if payload is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     # Check token type
     if payload.get("type") != "access":
-        raise credentials_exception
+        raise _credentials_exception()
 
-    user_id: int = payload.get("sub")
+    user_id = payload.get("sub")
     if user_id is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
-    # Get user from database
-    result = await db.execute(select(User).where(User.id == int(user_id)))
-    user = result.scalar_one_or_none()
+    return int(user_id)
 
-    if user is None:
-        raise credentials_exception
 
-    if user.status != "active":
+def _check_active(status_value: str) -> None:
+    if status_value != "active":
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="User account is disabled"
         )
 
+
+async def _cache_principal(principal: UserPrincipal) -> None:
+    _principal_cache.set(principal.id, principal)
+    await redis_set(
+        _principal_redis_key(principal.id),
+        json.dumps(asdict(principal)),
+        settings.USER_CACHE_TTL_SECONDS
+    )
+
+
+async def invalidate_user_principal(user_id: int) -> None:
+    """Drop cached principal (call on user updates and status changes)"""
+    _principal_cache.invalidate(user_id)
+    await redis_delete(_principal_redis_key(user_id))
+
+
+async def get_current_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+) -> UserPrincipal:
+    """
+    Get current authenticated user as a cached UserPrincipal.
+
+    Use this instead of get_current_user when the handler only needs the id
+    (or status/admin/business type): cache hits need no database query.
+    """
+    user_id = _get_user_id_from_token(credentials.credentials)
+
+    # In-process cache
+    principal = _principal_cache.get(user_id)
+
+    # Redis cache (shared between workers)
+    if principal is MISSING:
+        cached = await redis_get(_principal_redis_key(user_id))
+        if cached is not None:
+            principal = UserPrincipal(**json.loads(cached))
+            _principal_cache.set(user_id, principal)
+
+    # Database
+    if principal is MISSING:
+        result = await db.execute(
+            select(User.id, User.status, User.is_admin, User.business_type)
+            .where(User.id == user_id)
+        )
+        row = result.one_or_none()
+        if row is None:
+            raise _credentials_exception()
+        principal = UserPrincipal(
+            id=row.id,
+            status=row.status,
+            is_admin=row.is_admin,
+            business_type=row.business_type,
+        )
+        await _cache_principal(principal)
+
+    _check_active(principal.status)
+    return principal
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """Get current authenticated user (ORM object) from JWT token"""
+    user_id = _get_user_id_from_token(credentials.credentials)
+
+    # Get user from database
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
+
+    if user is None:
+        raise _credentials_exception()
+
+    _check_active(user.status)
+    await _cache_principal(UserPrincipal.from_user(user))
+
     return user
 
 
@@ -8,7 +8,8 @@ from app.models.category import Category
 from app.models.plan import Plan
 from app.models.user import User
 from app.models.plan import Subscription
-from app.core.security import get_password_hash
+from app.core.security import get_password_hash_async
+from app.services.user_service import invalidate_plan_cache, invalidate_subscription_cache
 
 
 # 관리자 계정 초기 데이터
@@ -115,6 +116,7 @@ async def seed_plans(db: AsyncSession):
         db.add(plan)
 
     await db.commit()
+    invalidate_plan_cache()
     print(f"Seeded {len(PLANS_DATA)} plans")
 
 
@@ -133,7 +135,7 @@ async def seed_admin(db: AsyncSession):
     # 관리자 계정 생성
     admin = User(
         email=ADMIN_DATA["email"],
-        password_hash=get_password_hash(ADMIN_DATA["password"]),
+        password_hash=await get_password_hash_async(ADMIN_DATA["password"]),
         name=ADMIN_DATA["name"],
         is_admin=ADMIN_DATA["is_admin"],
         business_type=ADMIN_DATA["business_type"],
@@ -158,6 +160,7 @@ async def seed_admin(db: AsyncSession):
         db.add(subscription)
 
     await db.commit()
+    invalidate_subscription_cache(admin.id)
     print(f"Seeded admin user: {ADMIN_DATA['email']}")
 
 
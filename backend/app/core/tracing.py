@@ -0,0 +1,304 @@
+"""
+Tracing - 요청 단위 경량 트레이싱
+요청마다 contextvar로 span을 수집하고 OpenTelemetry(OTLP JSON) 호환 형식으로 stdout/파일에 내보냅니다.
+"""
+import asyncio
+import functools
+import json
+import os
+import queue
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from app.core.config import settings
+
+
+@dataclass
+class Span:
+    """One timed operation within a trace"""
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_ns: int
+    end_ns: int = 0
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1_000_000
+
+    def to_otlp(self) -> dict:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 2 if self.parent_id is None else 1,  # SERVER / INTERNAL
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": 2, "message": self.error} if self.error else {"code": 1},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+class Trace:
+    """Spans collected for one request (shared by tasks/threads copied from its context)"""
+
+    def __init__(self, name: str):
+        self.trace_id = secrets.token_hex(16)
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+        self._tokens = None
+        self.root = Span(name, self.trace_id, secrets.token_hex(8), None, time.time_ns())
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def timings(self) -> Dict[str, Any]:
+        """Per-stage breakdown: total ms and count by span name (nested spans are inclusive)"""
+        stages: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            stage = stages.setdefault(span.name, {"ms": 0.0, "count": 0})
+            stage["ms"] += span.duration_ms
+            stage["count"] += 1
+        for stage in stages.values():
+            stage["ms"] = round(stage["ms"], 2)
+        return stages
+
+    def to_otlp(self) -> dict:
+        with self._lock:
+            spans = [self.root] + list(self.spans)
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [
+                    _otlp_attribute("service.name", settings.APP_NAME),
+                    _otlp_attribute("service.version", settings.APP_VERSION),
+                    _otlp_attribute("process.pid", os.getpid()),
+                ]},
+                "scopeSpans": [{
+                    "scope": {"name": "app.core.tracing"},
+                    "spans": [span.to_otlp() for span in spans],
+                }],
+            }]
+        }
+
+
+def _otlp_attribute(key: str, value: Any) -> dict:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("current_trace", default=None)
+_current_span_id: ContextVar[Optional[str]] = ContextVar("current_span_id", default=None)
+
+
+def current_trace() -> Optional[Trace]:
+    """Trace of the request being handled (None outside requests)"""
+    return _current_trace.get()
+
+
+def current_timings() -> Optional[Dict[str, Any]]:
+    """Stage breakdown of the current trace so far"""
+    trace = _current_trace.get()
+    return trace.timings() if trace else None
+
+
+@contextmanager
+def span(name: str, **attributes):
+    """Time a block as a child of the current span (no-op outside a trace)"""
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    current = Span(name, trace.trace_id, secrets.token_hex(8), _current_span_id.get(), time.time_ns(), attributes=attributes)
+    token = _current_span_id.set(current.span_id)
+    try:
+        yield current
+    except BaseException as e:
+        current.error = type(e).__name__
+        raise
+    finally:
+        _current_span_id.reset(token)
+        current.end_ns = time.time_ns()
+        trace.add(current)
+
+
+def traced(name: str):
+    """Decorator form of span() for sync and async functions"""
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def start_trace(name: str, **attributes) -> Trace:
+    """Begin a trace for the current context (call finish_trace with the result)"""
+    trace = Trace(name)
+    trace.root.attributes.update(attributes)
+    trace._tokens = (_current_trace.set(trace), _current_span_id.set(trace.root.span_id))
+    return trace
+
+
+def finish_trace(trace: Trace, error: Optional[str] = None) -> None:
+    """End the root span, restore the context and export"""
+    trace.root.end_ns = time.time_ns()
+    trace.root.error = error
+    trace_token, span_token = trace._tokens
+    _current_span_id.reset(span_token)
+    _current_trace.reset(trace_token)
+    exporter.export(trace)
+
+
+# =============================================================================
+# Exporter
+# =============================================================================
+
+class TraceExporter:
+    """Writes OTLP JSON lines from a background thread (never blocks the event loop)"""
+
+    def __init__(self):
+        self._queue: "queue.SimpleQueue[Optional[dict]]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return settings.TRACING_EXPORTER in ("stdout", "file")
+
+    def export(self, trace: Trace) -> None:
+        if not self.enabled:
+            return
+        if trace.root.duration_ms < settings.TRACING_MIN_DURATION_MS:
+            return
+        self._ensure_thread()
+        self._queue.put(trace.to_otlp())
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="trace-exporter", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        output = None
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            line = json.dumps(item, ensure_ascii=False)
+            try:
+                if settings.TRACING_EXPORTER == "stdout":
+                    print(line, flush=True)
+                    continue
+                if output is None:
+                    path = Path(settings.TRACING_FILE)
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    output = open(path, "a", encoding="utf-8")
+                output.write(line + "\n")
+                if self._queue.empty():
+                    output.flush()
+            except Exception as e:
+                print(f"Trace export failed: {e}")
+        if output is not None:
+            output.close()
+
+    def close(self) -> None:
+        """Flush pending traces (called on shutdown)"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+            self._thread = None
+
+
+exporter = TraceExporter()
+
+
+# =============================================================================
+# Instrumentation
+# =============================================================================
+
+def instrument_engine(engine) -> None:
+    """Record a db.query span per executed SQL statement"""
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+        if _current_trace.get() is not None:
+            conn.info.setdefault("trace_query_start", []).append(time.time_ns())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+        trace = _current_trace.get()
+        starts = conn.info.get("trace_query_start")
+        if trace is None or not starts:
+            return
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else ""
+        trace.add(Span(
+            "db.query", trace.trace_id, secrets.token_hex(8), _current_span_id.get(), starts.pop(), time.time_ns(),
+            attributes={"db.operation": operation, "db.statement": statement[:200]},
+        ))
+
+
+class TracingMiddleware:
+    """ASGI middleware: one trace per HTTP request, trace id returned in X-Trace-Id"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not settings.TRACING_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        trace = start_trace(
+            f"{scope['method']} {scope['path']}",
+            **{"http.method": scope["method"], "http.target": scope["path"]},
+        )
+
+        async def send_with_trace_id(message):
+            if message["type"] == "http.response.start":
+                trace.root.attributes["http.status_code"] = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"x-trace-id", trace.trace_id.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        error = None
+        try:
+            await self.app(scope, receive, send_with_trace_id)
+        except BaseException as e:
+            error = type(e).__name__
+            raise
+        finally:
+            finish_trace(trace, error)
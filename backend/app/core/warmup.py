@@ -0,0 +1,88 @@
+"""
+AI warm-up - 임베딩 모델/벡터 인덱스 백그라운드 로딩
+서버는 즉시 요청을 받고, AI 엔드포인트는 워밍업 완료 전까지 503을 반환합니다.
+"""
+import asyncio
+import time
+from typing import Optional
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+
+
+class WarmupState:
+    """Warm-up progress (per process)"""
+
+    PENDING = "pending"
+    WARMING = "warming"
+    READY = "ready"
+    FAILED = "failed"
+
+    def __init__(self):
+        self.status = self.PENDING
+        self.started_at: Optional[float] = None
+        self.duration_ms: Optional[int] = None
+        self.error: Optional[str] = None
+
+    @property
+    def is_done(self) -> bool:
+        """Finished loading (FAILED still serves with RAG fallback context)"""
+        return self.status in (self.READY, self.FAILED)
+
+    def to_dict(self) -> dict:
+        return {
+            "status": self.status,
+            "duration_ms": self.duration_ms,
+            "error": self.error,
+        }
+
+
+warmup_state = WarmupState()
+_task: Optional[asyncio.Task] = None
+
+
+async def _run_warmup() -> None:
+    """Load model and index in a worker thread"""
+    from app.services.rag_service import rag_service
+
+    warmup_state.status = WarmupState.WARMING
+    warmup_state.started_at = time.perf_counter()
+    try:
+        await asyncio.to_thread(rag_service.warm_up)
+        warmup_state.status = WarmupState.READY
+        print(f"AI warm-up completed: {rag_service.backend_info}")
+    except Exception as e:
+        warmup_state.status = WarmupState.FAILED
+        warmup_state.error = str(e)
+        print(f"AI warm-up failed: {e}")
+    finally:
+        warmup_state.duration_ms = int((time.perf_counter() - warmup_state.started_at) * 1000)
+
+
+def start_warmup() -> None:
+    """Start background warm-up (called from FastAPI lifespan)"""
+    global _task
+    if not settings.AI_WARMUP_ON_STARTUP:
+        # 워밍업 비활성화 시 첫 요청에서 지연 로딩
+        warmup_state.status = WarmupState.READY
+        return
+    if _task is None or _task.done():
+        _task = asyncio.create_task(_run_warmup())
+
+
+async def stop_warmup() -> None:
+    """Stop waiting on warm-up at shutdown (the loader thread finishes on its own)"""
+    global _task
+    if _task is not None and not _task.done():
+        _task.cancel()
+    _task = None
+
+
+def require_ai_ready() -> None:
+    """Dependency: fast 503 while the model and index are still loading"""
+    if not warmup_state.is_done:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="AI 모델을 준비 중입니다. 잠시 후 다시 시도해주세요",
+            headers={"Retry-After": str(settings.AI_WARMUP_RETRY_AFTER_SECONDS)},
+        )
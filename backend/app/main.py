@@ -3,11 +3,21 @@ TaxAIgent - FastAPI Application Entry Point
 """
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
-from app.core.database import init_db, close_db, AsyncSessionLocal
+from app.core.database import init_db, close_db, AsyncSessionLocal, get_pool_stats
+from app.core.redis import close_redis
+from app.core.http import init_http_client, close_http_client
+from app.core.loop_monitor import loop_monitor
+from app.core.metrics import MetricsMiddleware, registry as metrics_registry, CONTENT_TYPE as METRICS_CONTENT_TYPE
+from app.core.tracing import TracingMiddleware, exporter as trace_exporter
+from app.core.warmup import start_warmup, stop_warmup, warmup_state
 from app.core.seed import run_seeds
+from app.services.category_registry import category_registry
+from app.services.job_handlers import job_queue
+from app.services.structured_output import get_parse_stats
 
 
 @asynccontextmanager
@@ -17,15 +27,29 @@ async def lifespan(app: FastAPI):
     print(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     await init_db()
     print("Database initialized")
+    await init_http_client()
 
     # Run seed data
     async with AsyncSessionLocal() as session:
         await run_seeds(session)
+        await category_registry.load(session)
+    print(f"Category registry loaded: {len(category_registry.all())} categories")
+
+    # 임베딩 모델/벡터 인덱스는 백그라운드 로딩 (헬스체크는 즉시 응답)
+    start_warmup()
+    loop_monitor.start()
+    await job_queue.start()
 
     yield
 
     # Shutdown
+    await job_queue.stop()
+    await loop_monitor.stop()
+    await stop_warmup()
     await close_db()
+    await close_redis()
+    await close_http_client()
+    trace_exporter.close()
     print("Database connections closed")
 
 
@@ -46,8 +70,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Trace-Id"],
 )
 
+# Request tracing and latency metrics (outermost: covers CORS and all routes)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(TracingMiddleware)
+
 
 @app.get("/")
 async def root():
@@ -60,15 +89,50 @@ async def root():
 
 
 @app.get("/health")
+@app.get("/health/live")
 async def health_check():
-    """Health check endpoint"""
+    """Liveness probe (process is up, used by Railway healthcheck)"""
     return {"status": "healthy"}
 
 
+@app.get("/health/ready")
+async def readiness_check():
+    """Readiness probe (AI model and vector index loaded)"""
+    body = {"ready": warmup_state.is_done, "warmup": warmup_state.to_dict()}
+    if not warmup_state.is_done:
+        return JSONResponse(status_code=503, content=body)
+    return body
+
+
+@app.get("/health/llm")
+async def llm_output_status():
+    """LLM structured output parse stats (failure rate per output type)"""
+    return get_parse_stats()
+
+
+@app.get("/health/loop")
+async def loop_status():
+    """Event loop lag (recent blocking stacks only in DEBUG)"""
+    return loop_monitor.to_dict(include_stacks=settings.DEBUG)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics (this worker process only)"""
+    return Response(content=metrics_registry.render(), media_type=METRICS_CONTENT_TYPE)
+
+
+@app.get("/health/db")
+async def db_pool_status():
+    """Database connection pool metrics"""
+    return get_pool_stats()
+
+
 # API Routers
-from app.api.v1 import auth, users, chat, expenses, ledger
+from app.api.v1 import auth, users, chat, expenses, ledger, jobs
 app.include_router(auth.router, prefix=settings.API_V1_PREFIX)
 app.include_router(users.router, prefix=settings.API_V1_PREFIX)
 app.include_router(chat.router, prefix=settings.API_V1_PREFIX)
 app.include_router(expenses.router, prefix=settings.API_V1_PREFIX)
 app.include_router(ledger.router, prefix=settings.API_V1_PREFIX)
+app.include_router(jobs.router, prefix=settings.API_V1_PREFIX)
@@ -3,10 +3,11 @@ from app.models.user import User
 from app.models.category import Category
 from app.models.expense import Expense, ExpenseImage
 from app.models.income import IncomeRecord
-from app.models.chat import ChatHistory
+from app.models.chat import ChatHistory, ChatSession
 from app.models.plan import Plan, Subscription
-from app.models.usage import UsageLog
+from app.models.usage import UsageLog, UsageCounter
 from app.models.notification import Notification, NotificationSetting
+from app.models.job import Job
 
 __all__ = [
     "User",
@@ -15,9 +16,12 @@ __all__ = [
     "ExpenseImage",
     "IncomeRecord",
     "ChatHistory",
+    "ChatSession",
     "Plan",
     "Subscription",
     "UsageLog",
+    "UsageCounter",
     "Notification",
     "NotificationSetting",
+    "Job",
 ]
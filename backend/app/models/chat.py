@@ -4,7 +4,7 @@ Chat model - 상담 내역
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional
-from sqlalchemy import String, Boolean, Integer, DateTime, Text, ForeignKey, Numeric
+from sqlalchemy import String, Boolean, Integer, DateTime, Text, ForeignKey, Numeric, Index, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -13,9 +13,14 @@ from app.core.database import Base
 class ChatHistory(Base):
     """상담 내역 테이블"""
     __tablename__ = "chat_histories"
+    __table_args__ = (
+        # 상담 내역 최신순 조회 / 세션별 조회
+        Index("ix_chat_histories_user_created", "user_id", "created_at"),
+        Index("ix_chat_histories_user_session_created", "user_id", "session_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     session_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
 
     # Chat info
@@ -32,8 +37,11 @@ class ChatHistory(Base):
     llm_provider: Mapped[Optional[str]] = mapped_column(String(30), nullable=True)
     llm_model: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     input_tokens: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    cached_input_tokens: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)  # 제공자 prefix 캐시 적중분
     output_tokens: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     response_time_ms: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    # 단계별 소요 시간 {"llm.generate": {"ms": 812.4, "count": 1}, "db.query": {...}, ...}
+    timings: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
 
     # User feedback
     feedback: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)  # good, bad
@@ -47,3 +55,25 @@ class ChatHistory(Base):
 
     def __repr__(self):
         return f"<ChatHistory(id={self.id}, channel={self.channel})>"
+
+
+class ChatSession(Base):
+    """상담 세션 테이블 (오래된 대화의 누적 요약, user_id + session_id 당 1행)"""
+    __tablename__ = "chat_sessions"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    session_id: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    # Rolling summary of turns up to summarized_until_id (chat_histories.id)
+    summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    summarized_until_id: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+
+    # Relationships
+    user = relationship("User", back_populates="chat_sessions")
+
+    def __repr__(self):
+        return f"<ChatSession(user_id={self.user_id}, session_id={self.session_id})>"
@@ -4,7 +4,7 @@ Expense models - 지출 내역
 from datetime import datetime, date
 from decimal import Decimal
 from typing import Optional
-from sqlalchemy import String, Boolean, Integer, Date, DateTime, Text, ForeignKey, Numeric, JSON
+from sqlalchemy import String, Boolean, Integer, Date, DateTime, Text, ForeignKey, Numeric, JSON, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -13,9 +13,16 @@ from app.core.database import Base
 class Expense(Base):
     """지출 테이블"""
     __tablename__ = "expenses"
+    __table_args__ = (
+        # 기간 조회/집계 및 목록 정렬 (date DESC, id DESC)
+        Index(
+            "ix_expenses_user_date", "user_id", "date", "id",
+            postgresql_include=["amount", "is_deductible", "category_id"],
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     category_id: Mapped[Optional[int]] = mapped_column(ForeignKey("categories.id", ondelete="SET NULL"), nullable=True)
 
     # Basic info
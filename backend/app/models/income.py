@@ -4,7 +4,7 @@ Income model - 수입 내역
 from datetime import datetime, date
 from decimal import Decimal
 from typing import Optional
-from sqlalchemy import String, Date, DateTime, Text, ForeignKey, Numeric
+from sqlalchemy import String, Date, DateTime, Text, ForeignKey, Numeric, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -13,9 +13,12 @@ from app.core.database import Base
 class IncomeRecord(Base):
     """수입 테이블"""
     __tablename__ = "income_records"
+    __table_args__ = (
+        Index("ix_income_records_user_date", "user_id", "date", postgresql_include=["amount"]),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
     # Basic info
     date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
@@ -0,0 +1,45 @@
+"""
+Job model - 백그라운드 작업 (AI 분류, 장부 내보내기)
+"""
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import String, Integer, DateTime, Text, ForeignKey, JSON, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.core.database import Base
+
+
+class Job(Base):
+    """백그라운드 작업 테이블"""
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # 사용자별 최근 작업 조회
+        Index("ix_jobs_user_created", "user_id", "created_at"),
+        # 재시작 시 미완료 작업 복구
+        Index("ix_jobs_status", "status"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)  # UUID
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+
+    # Job info
+    type: Mapped[str] = mapped_column(String(30), nullable=False)  # classify_expense, export_ledger
+    status: Mapped[str] = mapped_column(String(20), default="queued", nullable=False)  # queued, running, succeeded, failed
+    payload: Mapped[dict] = mapped_column(JSON, nullable=False, default=dict)
+    result: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    # Retries
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    max_attempts: Mapped[int] = mapped_column(Integer, default=3, nullable=False)
+
+    # Timestamps
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    # Relationships
+    user = relationship("User", back_populates="jobs")
+
+    def __repr__(self):
+        return f"<Job(id={self.id}, type={self.type}, status={self.status})>"
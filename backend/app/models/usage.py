@@ -3,7 +3,7 @@ Usage model - 사용량 로그
 """
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, DateTime, ForeignKey
+from sqlalchemy import String, Integer, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -12,9 +12,12 @@ from app.core.database import Base
 class UsageLog(Base):
     """사용량 로그 테이블"""
     __tablename__ = "usage_logs"
+    __table_args__ = (
+        Index("ix_usage_logs_user_month_action", "user_id", "year_month", "action_type"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
 
     # Action info
     action_type: Mapped[str] = mapped_column(String(30), nullable=False)  # chat, expense, export
@@ -29,3 +32,26 @@ class UsageLog(Base):
 
     def __repr__(self):
         return f"<UsageLog(id={self.id}, action_type={self.action_type}, year_month={self.year_month})>"
+
+
+class UsageCounter(Base):
+    """월별 사용량 카운터 테이블 (user_id, year_month, action_type 당 1행)"""
+    __tablename__ = "usage_counters"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    year_month: Mapped[str] = mapped_column(String(7), primary_key=True)  # YYYY-MM
+    action_type: Mapped[str] = mapped_column(String(30), primary_key=True)  # chat, expense, export
+
+    # Counter
+    used: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    # Timestamps
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+    )
+
+    # Relationships
+    user = relationship("User", back_populates="usage_counters")
+
+    def __repr__(self):
+        return f"<UsageCounter(user_id={self.user_id}, year_month={self.year_month}, action_type={self.action_type}, used={self.used})>"
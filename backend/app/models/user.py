@@ -48,10 +48,13 @@ class User(Base):
     expenses = relationship("Expense", back_populates="user", cascade="all, delete-orphan")
     income_records = relationship("IncomeRecord", back_populates="user", cascade="all, delete-orphan")
     chat_histories = relationship("ChatHistory", back_populates="user", cascade="all, delete-orphan")
+    chat_sessions = relationship("ChatSession", back_populates="user", cascade="all, delete-orphan")
     subscription = relationship("Subscription", back_populates="user", uselist=False)
     usage_logs = relationship("UsageLog", back_populates="user", cascade="all, delete-orphan")
+    usage_counters = relationship("UsageCounter", back_populates="user", cascade="all, delete-orphan")
     notifications = relationship("Notification", back_populates="user", cascade="all, delete-orphan")
     notification_setting = relationship("NotificationSetting", back_populates="user", uselist=False)
+    jobs = relationship("Job", back_populates="user", cascade="all, delete-orphan")
 
     @property
     def is_verified(self) -> bool:
@@ -4,7 +4,7 @@ Expense schemas
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 class ExpenseCreate(BaseModel):
@@ -18,6 +18,7 @@ class ExpenseCreate(BaseModel):
     evidence_type: str = Field(default="none", max_length=20)
     vendor: Optional[str] = Field(None, max_length=100)
     memo: Optional[str] = None
+    auto_classify: bool = False  # category_id가 없으면 AI 분류 작업 등록
 
 
 class ExpenseUpdate(BaseModel):
@@ -35,6 +36,31 @@ class ExpenseUpdate(BaseModel):
     is_confirmed: Optional[bool] = None
 
 
+class ExpenseBulkUpdate(BaseModel):
+    """Bulk update request (same changes applied to every id)"""
+    ids: List[int] = Field(..., min_length=1, max_length=1000)
+    category_id: Optional[int] = None
+    is_deductible: Optional[bool] = None
+    is_confirmed: Optional[bool] = None
+
+    @model_validator(mode="after")
+    def _require_change(self):
+        if self.category_id is None and self.is_deductible is None and self.is_confirmed is None:
+            raise ValueError("category_id, is_deductible, is_confirmed 중 하나 이상 지정해야 합니다")
+        return self
+
+
+class ExpenseBulkConfirm(BaseModel):
+    """Bulk confirm request"""
+    ids: List[int] = Field(..., min_length=1, max_length=1000)
+
+
+class ExpenseBulkResult(BaseModel):
+    """Bulk update summary"""
+    updated: int
+    not_found: List[int]  # 없거나 다른 사용자의 지출
+
+
 class CategoryInfo(BaseModel):
     """Category info for expense response"""
     id: int
@@ -64,6 +90,7 @@ class ExpenseResponse(BaseModel):
     ai_confidence: Optional[float]
     ai_reason: Optional[str]
     is_confirmed: bool
+    classification_job_id: Optional[str] = None  # auto_classify 작업 ID
     created_at: datetime
     updated_at: datetime
 
@@ -80,6 +107,22 @@ class ExpenseList(BaseModel):
     total_amount: Decimal
 
 
+class ImportRowError(BaseModel):
+    """Rejected statement row"""
+    row: int
+    message: str
+
+
+class ExpenseImportResponse(BaseModel):
+    """Bulk import summary"""
+    total_rows: int
+    imported: int
+    duplicates: int  # 기존 지출과 (날짜, 금액, 가맹점) 중복
+    invalid: int
+    errors: List[ImportRowError]  # 처음 100건
+    classification_job_ids: List[str]
+
+
 class ClassifyRequest(BaseModel):
     """AI classification request"""
     description: str = Field(..., min_length=1, max_length=500)
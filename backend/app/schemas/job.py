@@ -0,0 +1,24 @@
+"""
+Job schemas
+"""
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+
+class JobResponse(BaseModel):
+    """Background job status"""
+    id: str
+    type: str
+    status: str  # queued, running, succeeded, failed
+    attempts: int
+    max_attempts: int
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    download_url: Optional[str] = None  # export_ledger 완료 시
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -1,16 +1,25 @@
 """
 Authentication service - 인증 비즈니스 로직
 """
+import hashlib
 from datetime import datetime
 from typing import Optional
-import httpx
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from app.core.cache import TTLCache, MISSING
 from app.core.config import settings
-from app.core.security import get_password_hash, verify_password, generate_tokens, decode_token
+from app.core.http import get_http_client
+from app.core.security import get_password_hash_async, verify_password_async, generate_tokens, decode_token
 from app.models.user import User
 from app.models.plan import Plan, Subscription
+from app.services.user_service import invalidate_subscription_cache
+
+
+KAKAO_USER_INFO_URL = "https://kapi.kakao.com/v2/user/me"
+
+# sha256(kakao access token) -> Kakao user info (successful lookups only)
+_kakao_profile_cache = TTLCache(ttl=settings.KAKAO_PROFILE_CACHE_TTL_SECONDS, name="kakao_profile")
 
 
 class AuthService:
@@ -30,7 +39,7 @@ class AuthService:
         # Create user
         user = User(
             email=email,
-            password_hash=get_password_hash(password),
+            password_hash=await get_password_hash_async(password),
             name=name or email.split("@")[0],
             provider="email",
             status="active",
@@ -59,7 +68,7 @@ class AuthService:
         if not user.password_hash:
             raise ValueError("소셜 로그인으로 가입된 계정입니다")
 
-        if not verify_password(password, user.password_hash):
+        if not await verify_password_async(password, user.password_hash):
             raise ValueError("이메일 또는 비밀번호가 올바르지 않습니다")
 
         if user.status != "active":
@@ -149,16 +158,21 @@ class AuthService:
 
     async def _get_kakao_user_info(self, access_token: str) -> Optional[dict]:
         """Get user info from Kakao API"""
+        cache_key = hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+        cached = _kakao_profile_cache.get(cache_key)
+        if cached is not MISSING:
+            return cached
+
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://kapi.kakao.com/v2/user/me",
-                    headers={"Authorization": f"Bearer {access_token}"},
-                    timeout=10.0
-                )
-                if response.status_code == 200:
-                    return response.json()
-                return None
+            response = await get_http_client().get(
+                KAKAO_USER_INFO_URL,
+                headers={"Authorization": f"Bearer {access_token}"},
+            )
+            if response.status_code == 200:
+                user_info = response.json()
+                _kakao_profile_cache.set(cache_key, user_info)
+                return user_info
+            return None
         except Exception:
             return None
 
@@ -176,3 +190,4 @@ class AuthService:
                 started_at=datetime.utcnow(),
             )
             self.db.add(subscription)
+            invalidate_subscription_cache(user_id)
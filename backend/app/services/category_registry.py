@@ -0,0 +1,107 @@
+"""
+Category registry - 계정과목 인메모리 레지스트리
+계정과목은 시드 이후 거의 변경되지 않으므로 시작 시 한 번 로드하여 요청마다 조회하지 않습니다.
+"""
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+
+from app.models.category import Category
+
+
+@dataclass(frozen=True)
+class CategoryEntry:
+    """Immutable category record"""
+    id: int
+    code: str
+    name: str
+    name_en: Optional[str]
+    description: Optional[str]
+    is_deductible: bool
+
+
+class CategoryRegistry:
+    """Process-wide category lookup (loaded once in lifespan after the seeds)"""
+
+    def __init__(self):
+        self._entries: Tuple[CategoryEntry, ...] = ()
+        self._by_id: Dict[int, CategoryEntry] = {}
+        self._by_code: Dict[str, CategoryEntry] = {}
+        self._json: bytes = b"[]"
+        self._etag: str = ""
+        self._loaded = False
+
+    async def load(self, db: AsyncSession) -> None:
+        """(Re)load all categories from the database"""
+        result = await db.execute(select(Category).order_by(Category.sort_order))
+        entries = tuple(
+            CategoryEntry(
+                id=category.id,
+                code=category.code,
+                name=category.name,
+                name_en=category.name_en,
+                description=category.description,
+                is_deductible=category.is_deductible,
+            )
+            for category in result.scalars().all()
+        )
+
+        # /categories 응답 JSON 사전 생성
+        payload = json.dumps(
+            [
+                {
+                    "id": entry.id,
+                    "code": entry.code,
+                    "name": entry.name,
+                    "name_en": entry.name_en,
+                    "description": entry.description,
+                    "is_deductible": entry.is_deductible,
+                }
+                for entry in entries
+            ],
+            ensure_ascii=False,
+        ).encode("utf-8")
+
+        # Swap all lookup maps at once
+        self._entries = entries
+        self._by_id = {entry.id: entry for entry in entries}
+        self._by_code = {entry.code: entry for entry in entries}
+        self._json = payload
+        self._etag = f'"{hashlib.sha256(payload).hexdigest()[:16]}"'
+        self._loaded = bool(entries)
+
+    async def ensure_loaded(self, db: AsyncSession) -> None:
+        """Load on first use (e.g. scripts running without lifespan)"""
+        if not self._loaded:
+            await self.load(db)
+
+    def get(self, category_id: Optional[int]) -> Optional[CategoryEntry]:
+        """Get category by ID"""
+        if category_id is None:
+            return None
+        return self._by_id.get(category_id)
+
+    def get_by_code(self, code: str) -> Optional[CategoryEntry]:
+        """Get category by code (case-insensitive)"""
+        return self._by_code.get(code.upper())
+
+    def all(self) -> List[CategoryEntry]:
+        """All categories in display order"""
+        return list(self._entries)
+
+    @property
+    def json(self) -> bytes:
+        """Precomputed JSON body for the /categories endpoint"""
+        return self._json
+
+    @property
+    def etag(self) -> str:
+        """ETag of the precomputed JSON"""
+        return self._etag
+
+
+# Global instance
+category_registry = CategoryRegistry()
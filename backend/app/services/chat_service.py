@@ -1,17 +1,23 @@
 """
 Chat service - AI 상담 비즈니스 로직
 """
+import asyncio
 import uuid
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, desc
+from pydantic import BaseModel, Field, field_validator
 
+from app.core.config import settings
+from app.core.tracing import current_timings
 from app.models.chat import ChatHistory
-from app.models.category import Category
+from app.services.category_registry import category_registry
 from app.services.rag_service import rag_service
 from app.services.llm_service import llm_service, LLMResponse
+from app.services.session_memory import SessionMemory, SessionMemoryService
+from app.services.structured_output import parse_structured
 from app.services.user_service import UserService
 
 
@@ -74,6 +80,33 @@ SYSTEM_PROMPT = """당신은 한국의 1인 사업자를 위한 AI 세무 비서
 """
 
 
+class ChatAnswer(BaseModel):
+    """Structured chat answer returned by the LLM"""
+    answer: str = Field(..., min_length=1)
+    is_deductible: Optional[bool] = None
+    category_code: Optional[str] = None
+    confidence: Optional[float] = None
+    legal_basis: Optional[str] = None
+
+    @field_validator("is_deductible", mode="before")
+    @classmethod
+    def _lenient_bool(cls, value):
+        return value if isinstance(value, bool) else None
+
+    @field_validator("category_code", mode="before")
+    @classmethod
+    def _normalize_code(cls, value):
+        return value.strip().upper() or None if isinstance(value, str) else None
+
+    @field_validator("confidence", mode="before")
+    @classmethod
+    def _clamp_confidence(cls, value):
+        try:
+            return min(max(float(value), 0.0), 1.0)
+        except (TypeError, ValueError):
+            return None
+
+
 class ChatService:
     """Chat service"""
 
@@ -91,30 +124,31 @@ class ChatService:
         # Check usage limit
         user_service = UserService(self.db)
         if not await user_service.check_usage_limit(user_id, "chat"):
-            return {
-                "answer": "이번 달 상담 횟수를 모두 사용하셨습니다. 요금제를 업그레이드하시면 더 많은 상담이 가능합니다.",
-                "is_deductible": None,
-                "category_code": None,
-                "confidence": None,
-                "references": []
-            }, None
-
-        # Generate session ID if not provided
-        if not session_id:
+            return self._limit_exceeded_response(), None
+
+        # Session memory (summary + recent turns); new sessions start empty
+        memory_service = SessionMemoryService(self.db)
+        if session_id:
+            memory = await memory_service.load(user_id, session_id)
+        else:
             session_id = str(uuid.uuid4())
+            memory = SessionMemory()
 
-        # Search for relevant context using RAG
-        rag_documents = rag_service.search(question, top_k=3)
-        context = rag_service.format_context(rag_documents)
+        # Search and pack context within the token budget
+        # (embedding/FAISS are blocking, keep them off the event loop)
+        packed = await asyncio.to_thread(rag_service.search_context, question, 3)
+        if settings.DEBUG:
+            print(f"RAG context: {packed.to_dict()}")
 
         # Build prompt with context
-        prompt = self._build_prompt(question, context)
+        prompt = self._build_prompt(question, packed.text, memory_service.format(memory))
 
         # Generate response using LLM
         llm_response = await llm_service.generate(
             prompt=prompt,
             system_prompt=SYSTEM_PROMPT,
-            temperature=0.3
+            temperature=0.3,
+            json_output=True
         )
 
         # Parse LLM response
@@ -124,12 +158,17 @@ class ChatService:
         category_id = None
         category_name = None
         if parsed_response.get("category_code"):
-            category = await self._get_category_by_code(parsed_response["category_code"])
+            await category_registry.ensure_loaded(self.db)
+            category = category_registry.get_by_code(parsed_response["category_code"])
             if category:
                 category_id = category.id
                 category_name = category.name
 
-        # Save chat history
+        # Unit of work: usage counter, usage log and chat history in one transaction
+        # Consume usage atomically (the pre-check above can race with concurrent requests)
+        if not await user_service.consume_usage(user_id, "chat", channel):
+            return self._limit_exceeded_response(), None
+
         confidence = parsed_response.get("confidence")
         chat_history = ChatHistory(
             user_id=user_id,
@@ -143,18 +182,18 @@ class ChatService:
             llm_provider=llm_response.provider,
             llm_model=llm_response.model,
             input_tokens=llm_response.input_tokens,
+            cached_input_tokens=llm_response.cached_input_tokens,
             output_tokens=llm_response.output_tokens,
             response_time_ms=llm_response.response_time_ms,
+            # 저장 시점까지의 단계별 시간 (이 INSERT/COMMIT 자체는 제외)
+            timings=current_timings(),
         )
         self.db.add(chat_history)
         await self.db.commit()
-        await self.db.refresh(chat_history)
-
-        # Log usage
-        await user_service.log_usage(user_id, "chat", channel)
+        memory_service.record_turn(user_id, session_id, memory, chat_history)
 
         # Build response
-        references = [doc.get("source", "") for doc in rag_documents if doc.get("source")]
+        references = [doc.get("source", "") for doc in packed.documents if doc.get("source")]
 
         return {
             "answer": parsed_response["answer"],
@@ -166,40 +205,40 @@ class ChatService:
             "session_id": session_id
         }, chat_history
 
-    def _build_prompt(self, question: str, context: str) -> str:
-        """Build prompt with context"""
-        if context:
-            return f"""참고자료:
-{context}
+    def _limit_exceeded_response(self) -> dict:
+        """Response returned when the monthly chat limit is exhausted"""
+        return {
+            "answer": "이번 달 상담 횟수를 모두 사용하셨습니다. 요금제를 업그레이드하시면 더 많은 상담이 가능합니다.",
+            "is_deductible": None,
+            "category_code": None,
+            "confidence": None,
+            "references": []
+        }
 
-사용자 질문: {question}
+    def _build_prompt(self, question: str, context: str, history: str = "") -> str:
+        """Build prompt with session history and context"""
+        sections = []
+        if history:
+            sections.append(history)
+        if context:
+            sections.append(f"참고자료:\n{context}")
+        sections.append(f"사용자 질문: {question}")
 
-위 참고자료를 바탕으로 질문에 답변해주세요. 반드시 JSON 형식으로 응답하세요."""
+        if context:
+            instruction = "위 참고자료를 바탕으로 질문에 답변해주세요. 반드시 JSON 형식으로 응답하세요."
         else:
-            return f"""사용자 질문: {question}
+            instruction = "위 질문에 답변해주세요. 반드시 JSON 형식으로 응답하세요."
+        if history:
+            instruction = "이전 대화 맥락을 고려하여 " + instruction
+        sections.append(instruction)
 
-위 질문에 답변해주세요. 반드시 JSON 형식으로 응답하세요."""
+        return "\n\n".join(sections)
 
     def _parse_response(self, response: str) -> dict:
         """Parse LLM response"""
-        import json
-        import re
-
-        # Try to extract JSON from response
-        try:
-            # Find JSON in response (handle nested objects)
-            json_match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', response, re.DOTALL)
-            if json_match:
-                parsed = json.loads(json_match.group())
-                return {
-                    "answer": parsed.get("answer", response),
-                    "is_deductible": parsed.get("is_deductible"),
-                    "category_code": parsed.get("category_code"),
-                    "confidence": parsed.get("confidence"),
-                    "legal_basis": parsed.get("legal_basis")
-                }
-        except json.JSONDecodeError:
-            pass
+        parsed = parse_structured(response, ChatAnswer, "chat")
+        if parsed:
+            return parsed.model_dump()
 
         # If JSON parsing fails, return plain answer
         return {
@@ -210,13 +249,6 @@ class ChatService:
             "legal_basis": None
         }
 
-    async def _get_category_by_code(self, code: str) -> Optional[Category]:
-        """Get category by code"""
-        result = await self.db.execute(
-            select(Category).where(Category.code == code.upper())
-        )
-        return result.scalar_one_or_none()
-
     async def get_history(
         self,
         user_id: int,
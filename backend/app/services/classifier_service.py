@@ -1,11 +1,13 @@
 """
 Classifier service - AI 지출 분류
 """
-from typing import Optional
+from typing import Optional, List, Tuple
 from decimal import Decimal
 from dataclasses import dataclass
+from pydantic import BaseModel, field_validator
 
 from app.services.llm_service import llm_service
+from app.services.structured_output import parse_structured
 
 
 @dataclass
@@ -18,7 +20,8 @@ class ClassificationResult:
     reason: str
 
 
-CLASSIFICATION_PROMPT = """당신은 한국의 세무 전문가입니다. 아래 지출 내역을 분석하여 적절한 계정과목으로 분류해주세요.
+# 고정 부분 (system instruction, 호출마다 byte 단위로 동일해야 prefix 캐싱 적용)
+_CLASSIFICATION_INSTRUCTION = """당신은 한국의 세무 전문가입니다. 지출 내역을 분석하여 적절한 계정과목으로 분류해주세요.
 
 계정과목 목록:
 - ENT: 접대비 (거래처 식사, 선물 등)
@@ -37,22 +40,38 @@ CLASSIFICATION_PROMPT = """당신은 한국의 세무 전문가입니다. 아래
 - DEP: 감가상각비 (자산 감가상각)
 - OTH: 기타 (분류 어려운 경비)
 - NON: 비용처리불가 (개인적 지출)
+"""
 
-지출 내역:
-- 내용: {description}
-- 금액: {amount}원
-- 가맹점: {vendor}
-
+CLASSIFICATION_SYSTEM_PROMPT = _CLASSIFICATION_INSTRUCTION + """
 다음 JSON 형식으로 응답하세요:
-{{
+{
   "category_code": "계정과목 코드",
   "category_name": "계정과목 이름",
   "is_deductible": true/false,
   "confidence": 0.0-1.0,
   "reason": "분류 이유 (간단히)"
-}}
+}
 """
 
+# 여러 건을 한 번에 분류 (일괄 등록 후 분류 작업)
+CLASSIFICATION_BATCH_SYSTEM_PROMPT = _CLASSIFICATION_INSTRUCTION + """
+지출 내역 여러 건이 번호와 함께 주어집니다. 모든 항목을 분류하여 다음 JSON 형식으로 응답하세요:
+{
+  "results": [
+    {"index": 번호, "category_code": "계정과목 코드", "is_deductible": true/false, "confidence": 0.0-1.0, "reason": "분류 이유 (간단히)"}
+  ]
+}
+"""
+
+# 요청별 부분
+CLASSIFICATION_PROMPT = """지출 내역:
+- 내용: {description}
+- 금액: {amount}원
+- 가맹점: {vendor}
+"""
+
+CLASSIFICATION_BATCH_ITEM = "{index}. 내용: {description} / 금액: {amount}원 / 가맹점: {vendor}"
+
 CATEGORY_NAMES = {
     "ENT": "접대비",
     "WEL": "복리후생비",
@@ -73,6 +92,50 @@ CATEGORY_NAMES = {
 }
 
 
+class ClassificationOutput(BaseModel):
+    """Structured classification returned by the LLM"""
+    category_code: str = "OTH"
+    is_deductible: bool = True
+    confidence: float = 0.5
+    reason: str = "AI 자동 분류"
+
+    @field_validator("category_code", mode="before")
+    @classmethod
+    def _normalize_code(cls, value):
+        return value.strip().upper() if isinstance(value, str) and value.strip() else "OTH"
+
+    @field_validator("confidence", mode="before")
+    @classmethod
+    def _clamp_confidence(cls, value):
+        try:
+            return min(max(float(value), 0.0), 1.0)
+        except (TypeError, ValueError):
+            return 0.5
+
+
+class BatchClassificationItem(ClassificationOutput):
+    """One entry of a batch classification"""
+    index: Optional[int] = None
+
+
+class BatchClassificationOutput(BaseModel):
+    """Structured batch classification returned by the LLM"""
+    results: List[BatchClassificationItem] = []
+
+    @field_validator("results", mode="before")
+    @classmethod
+    def _drop_invalid(cls, value):
+        return [item for item in value if isinstance(item, dict)] if isinstance(value, list) else []
+
+
+# (description, amount, vendor)
+ClassificationItem = Tuple[str, Optional[Decimal], Optional[str]]
+
+
+def _format_amount(amount: Optional[Decimal]) -> str:
+    return f"{amount:,.0f}" if amount else "미입력"
+
+
 class ClassifierService:
     """AI expense classifier"""
 
@@ -86,46 +149,74 @@ class ClassifierService:
         # Build prompt
         prompt = CLASSIFICATION_PROMPT.format(
             description=description,
-            amount=f"{amount:,.0f}" if amount else "미입력",
+            amount=_format_amount(amount),
             vendor=vendor or "미입력"
         )
 
         # Get LLM response
         response = await llm_service.generate(
             prompt=prompt,
+            system_prompt=CLASSIFICATION_SYSTEM_PROMPT,
             temperature=0.2,
-            max_tokens=500
+            max_tokens=500,
+            json_output=True
         )
 
         # Parse response
         return self._parse_classification(response.content)
 
+    async def classify_batch(self, items: List[ClassificationItem]) -> List[ClassificationResult]:
+        """Classify several expenses with one LLM call (results in input order)"""
+        if not items:
+            return []
+
+        prompt = "지출 내역:\n" + "\n".join(
+            CLASSIFICATION_BATCH_ITEM.format(
+                index=i,
+                description=description,
+                amount=_format_amount(amount),
+                vendor=vendor or "미입력"
+            )
+            for i, (description, amount, vendor) in enumerate(items, start=1)
+        )
+
+        response = await llm_service.generate(
+            prompt=prompt,
+            system_prompt=CLASSIFICATION_BATCH_SYSTEM_PROMPT,
+            temperature=0.2,
+            max_tokens=200 + 80 * len(items),
+            json_output=True
+        )
+
+        parsed = parse_structured(response.content, BatchClassificationOutput, "classification_batch")
+        results = [self._fallback() for _ in items]
+        if parsed:
+            for position, item in enumerate(parsed.results):
+                # index가 없거나 범위를 벗어나면 응답 순서를 사용
+                index = item.index - 1 if item.index and 0 < item.index <= len(items) else position
+                if index < len(items):
+                    results[index] = self._to_result(item)
+        return results
+
     def _parse_classification(self, response: str) -> ClassificationResult:
         """Parse classification response"""
-        import json
-        import re
+        parsed = parse_structured(response, ClassificationOutput, "classification")
+        if parsed:
+            return self._to_result(parsed)
+        return self._fallback()
 
-        try:
-            # Extract JSON from response
-            json_match = re.search(r'\{[^{}]*\}', response, re.DOTALL)
-            if json_match:
-                parsed = json.loads(json_match.group())
-
-                category_code = parsed.get("category_code", "OTH").upper()
-                if category_code not in CATEGORY_NAMES:
-                    category_code = "OTH"
-
-                return ClassificationResult(
-                    category_code=category_code,
-                    category_name=CATEGORY_NAMES.get(category_code, "기타"),
-                    is_deductible=parsed.get("is_deductible", True) and category_code != "NON",
-                    confidence=min(max(parsed.get("confidence", 0.5), 0), 1),
-                    reason=parsed.get("reason", "AI 자동 분류")
-                )
-        except (json.JSONDecodeError, KeyError):
-            pass
-
-        # Default fallback
+    def _to_result(self, parsed: ClassificationOutput) -> ClassificationResult:
+        category_code = parsed.category_code if parsed.category_code in CATEGORY_NAMES else "OTH"
+        return ClassificationResult(
+            category_code=category_code,
+            category_name=CATEGORY_NAMES.get(category_code, "기타"),
+            is_deductible=parsed.is_deductible and category_code != "NON",
+            confidence=parsed.confidence,
+            reason=parsed.reason
+        )
+
+    def _fallback(self) -> ClassificationResult:
+        """Default fallback"""
         return ClassificationResult(
             category_code="OTH",
             category_name="기타",
@@ -0,0 +1,155 @@
+"""
+Context builder - 토큰 예산 기반 RAG 컨텍스트 구성
+중복 문서를 제거하고, 긴 문서는 질문과 가까운 문장만 남겨 예산 안에서 참고자료를 구성합니다.
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+import numpy as np
+
+from app.core.config import settings
+from app.services.embedding_service import embedding_service
+from app.services.token_counter import estimate_tokens
+
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?。])\s+|\n+")
+
+
+@dataclass
+class PackedContext:
+    """Context text and the token accounting used to build it"""
+    text: str = ""
+    documents: List[Dict] = field(default_factory=list)
+    tokens: int = 0
+    budget: int = 0
+    source_tokens: int = 0
+    dropped_duplicates: int = 0
+    dropped_over_budget: int = 0
+    trimmed: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "tokens": self.tokens,
+            "budget": self.budget,
+            "source_tokens": self.source_tokens,
+            "documents": len(self.documents),
+            "dropped_duplicates": self.dropped_duplicates,
+            "dropped_over_budget": self.dropped_over_budget,
+            "trimmed": self.trimmed,
+        }
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split Korean/English text into sentences"""
+    return [s.strip() for s in _SENTENCE_SPLIT.split(text.strip()) if s.strip()]
+
+
+def _normalize(sentence: str) -> str:
+    return re.sub(r"\W+", "", sentence).lower()
+
+
+def format_document(index: int, content: str, source: str) -> str:
+    """Reference block format shared with RAGService.format_context"""
+    source_str = f"\n출처: {source}" if source else ""
+    return f"[참고자료 {index}]\n{content}{source_str}"
+
+
+class ContextBuilder:
+    """Packs retrieved documents into a token budget"""
+
+    def __init__(
+        self,
+        max_tokens: Optional[int] = None,
+        doc_max_tokens: Optional[int] = None,
+        dedupe_overlap: Optional[float] = None,
+    ):
+        self.max_tokens = max_tokens or settings.RAG_CONTEXT_MAX_TOKENS
+        self.doc_max_tokens = doc_max_tokens or settings.RAG_CONTEXT_DOC_MAX_TOKENS
+        self.dedupe_overlap = dedupe_overlap if dedupe_overlap is not None else settings.RAG_CONTEXT_DEDUPE_OVERLAP
+
+    def build(self, query: str, documents: List[Dict]) -> PackedContext:
+        """Dedupe, trim and pack documents (highest score first)"""
+        packed = PackedContext(budget=self.max_tokens)
+        if not documents:
+            return packed
+
+        ordered = sorted(documents, key=lambda d: d.get("score", 0.0), reverse=True)
+        packed.source_tokens = sum(estimate_tokens(d.get("content", "")) for d in ordered)
+
+        # 1. 중복 제거 (이미 포함된 문장과 겹치는 비율이 높으면 제외)
+        seen_sentences = set()
+        candidates = []
+        for doc in ordered:
+            sentences = split_sentences(doc.get("content", ""))
+            keys = {_normalize(s) for s in sentences} - {""}
+            if not keys:
+                continue
+            if len(keys & seen_sentences) / len(keys) >= self.dedupe_overlap:
+                packed.dropped_duplicates += 1
+                continue
+            seen_sentences |= keys
+            candidates.append((doc, sentences))
+
+        # 2. 긴 문서는 질문과 유사한 문장만 남김 (한 번의 배치 임베딩)
+        long_docs = [
+            i for i, (doc, sentences) in enumerate(candidates)
+            if len(sentences) > 1 and estimate_tokens(doc["content"]) > self.doc_max_tokens
+        ]
+        contents = [doc["content"] for doc, _ in candidates]
+        if long_docs:
+            scores = self._sentence_scores(query, [candidates[i][1] for i in long_docs])
+            for i, sentence_scores in zip(long_docs, scores):
+                contents[i] = self._trim(candidates[i][1], sentence_scores)
+                packed.trimmed += 1
+
+        # 3. 예산 안에서 점수 순으로 채움
+        blocks = []
+        for (doc, _), content in zip(candidates, contents):
+            block = format_document(len(blocks) + 1, content, doc.get("source", ""))
+            block_tokens = estimate_tokens(block)
+            if packed.tokens + block_tokens > self.max_tokens:
+                packed.dropped_over_budget += 1
+                continue
+            blocks.append(block)
+            packed.tokens += block_tokens
+            packed.documents.append({**doc, "content": content})
+
+        packed.text = "\n\n".join(blocks)
+        return packed
+
+    def _sentence_scores(self, query: str, sentence_groups: List[List[str]]) -> List[np.ndarray]:
+        """Cosine similarity of each sentence to the query"""
+        flat = [s for group in sentence_groups for s in group]
+        embeddings = embedding_service.embed_texts([query] + flat)
+
+        if embeddings is not None:
+            matrix = np.asarray(embeddings, dtype=np.float32)
+            similarities = matrix[1:] @ matrix[0]
+        else:
+            # 임베딩 불가 시 글자 bigram 겹침으로 대체
+            similarities = np.array([self._lexical_overlap(query, s) for s in flat], dtype=np.float32)
+
+        groups, offset = [], 0
+        for group in sentence_groups:
+            groups.append(similarities[offset:offset + len(group)])
+            offset += len(group)
+        return groups
+
+    def _trim(self, sentences: List[str], scores: np.ndarray) -> str:
+        """Keep the most similar sentences within doc_max_tokens, in original order"""
+        keep, used = [], 0
+        for index in np.argsort(-scores):
+            tokens = estimate_tokens(sentences[index])
+            if keep and used + tokens > self.doc_max_tokens:
+                continue
+            keep.append(index)
+            used += tokens
+        return " ".join(sentences[i] for i in sorted(keep))
+
+    @staticmethod
+    def _lexical_overlap(query: str, sentence: str) -> float:
+        query_grams = {query[i:i + 2] for i in range(len(query) - 1)}
+        sentence_grams = {sentence[i:i + 2] for i in range(len(sentence) - 1)}
+        if not query_grams or not sentence_grams:
+            return 0.0
+        return len(query_grams & sentence_grams) / len(query_grams)
@@ -0,0 +1,115 @@
+"""
+Embedding backends - KoE5 추론 백엔드 (PyTorch / ONNX Runtime / int8 ONNX)
+EMBEDDING_BACKEND 설정으로 선택합니다. ONNX 모델은 scripts/export_onnx_embedding.py로 생성합니다.
+"""
+from pathlib import Path
+from typing import List
+import numpy as np
+
+from app.core.config import settings
+
+
+BACKEND_TORCH = "torch"
+BACKEND_ONNX = "onnx"
+BACKEND_ONNX_INT8 = "onnx-int8"
+BACKENDS = (BACKEND_TORCH, BACKEND_ONNX, BACKEND_ONNX_INT8)
+
+ONNX_MODEL_FILE = "model.onnx"
+ONNX_INT8_MODEL_FILE = "model_int8.onnx"
+TOKENIZER_FILE = "tokenizer.json"
+
+
+def onnx_model_dir() -> Path:
+    """ONNX export directory (relative paths are resolved from the backend root)"""
+    path = Path(settings.EMBEDDING_ONNX_DIR)
+    if not path.is_absolute():
+        path = Path(__file__).parent.parent.parent / path
+    return path
+
+
+class TorchEmbeddingBackend:
+    """SentenceTransformer on PyTorch (full precision)"""
+
+    name = BACKEND_TORCH
+
+    def __init__(self, model_name: str):
+        from sentence_transformers import SentenceTransformer
+
+        self._model = SentenceTransformer(model_name, device="cpu")
+        self.dimension = self._model.get_sentence_embedding_dimension()
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Normalized float32 embeddings, shape (n, dimension)"""
+        return self._model.encode(
+            texts,
+            batch_size=settings.EMBEDDING_BATCH_SIZE,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+        ).astype(np.float32)
+
+
+class OnnxEmbeddingBackend:
+    """ONNX Runtime inference with mean pooling (same pooling as the KoE5 SentenceTransformer)"""
+
+    def __init__(self, model_dir: Path, quantized: bool = False):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        model_file = ONNX_INT8_MODEL_FILE if quantized else ONNX_MODEL_FILE
+        model_path = model_dir / model_file
+        if not model_path.exists():
+            raise FileNotFoundError(
+                f"{model_path} not found (run scripts/export_onnx_embedding.py)"
+            )
+
+        self.name = BACKEND_ONNX_INT8 if quantized else BACKEND_ONNX
+
+        self._tokenizer = Tokenizer.from_file(str(model_dir / TOKENIZER_FILE))
+        self._tokenizer.enable_truncation(max_length=settings.EMBEDDING_MAX_LENGTH)
+        self._tokenizer.enable_padding()
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if settings.EMBEDDING_ONNX_THREADS > 0:
+            options.intra_op_num_threads = settings.EMBEDDING_ONNX_THREADS
+        self._session = ort.InferenceSession(
+            str(model_path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {i.name for i in self._session.get_inputs()}
+        self.dimension = self._session.get_outputs()[0].shape[-1]
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Normalized float32 embeddings, shape (n, dimension)"""
+        batch_size = settings.EMBEDDING_BATCH_SIZE
+        chunks = [
+            self._encode_batch(texts[i:i + batch_size])
+            for i in range(0, len(texts), batch_size)
+        ]
+        return np.concatenate(chunks) if chunks else np.zeros((0, self.dimension), np.float32)
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        encodings = self._tokenizer.encode_batch(texts)
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.zeros_like(input_ids)
+
+        last_hidden_state = self._session.run(None, feeds)[0]
+
+        # Mean pooling over non-padding tokens
+        mask = attention_mask[..., None].astype(np.float32)
+        summed = (last_hidden_state * mask).sum(axis=1)
+        pooled = summed / np.clip(mask.sum(axis=1), 1e-9, None)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return (pooled / np.clip(norms, 1e-12, None)).astype(np.float32)
+
+
+def create_backend(name: str):
+    """Create embedding backend by name"""
+    if name == BACKEND_TORCH:
+        return TorchEmbeddingBackend(settings.EMBEDDING_MODEL)
+    if name in (BACKEND_ONNX, BACKEND_ONNX_INT8):
+        return OnnxEmbeddingBackend(onnx_model_dir(), quantized=name == BACKEND_ONNX_INT8)
+    raise ValueError(f"Unknown embedding backend: {name} (choose from {', '.join(BACKENDS)})")
@@ -1,62 +1,110 @@
 """
 Embedding service - KoE5 임베딩
+추론 백엔드(torch / onnx / onnx-int8)는 EMBEDDING_BACKEND로 선택합니다.
 """
+import threading
 from typing import List, Optional
 import numpy as np
-from sentence_transformers import SentenceTransformer
 
 from app.core.config import settings
+from app.core.metrics import embedding_batch_size, embedding_duration
+from app.core.tracing import traced
 
 
 class EmbeddingService:
     """KoE5 embedding service"""
 
     _instance: Optional["EmbeddingService"] = None
-    _model: Optional[SentenceTransformer] = None
+    _backend = None
+    _load_attempted: bool = False
+    _lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self):
-        if self._model is None:
-            self._load_model()
+    def load(self) -> bool:
+        """Load model once (blocking; run from warm-up thread or scripts)"""
+        if self._load_attempted:
+            return self._backend is not None
+        with self._lock:
+            if not self._load_attempted:
+                self._load_model()
+                self._load_attempted = True
+        return self._backend is not None
 
     def _load_model(self):
-        """Load KoE5 model"""
+        """Load KoE5 model with the configured backend"""
         try:
-            print(f"Loading embedding model: {settings.EMBEDDING_MODEL}")
-            self._model = SentenceTransformer(settings.EMBEDDING_MODEL)
-            print("Embedding model loaded successfully")
+            # torch/onnxruntime import 자체가 수 초 걸리므로 로드 시점에 import
+            if settings.EMBEDDING_SIDECAR_SOCKET:
+                # 임베딩 사이드카 사용 시 모델은 사이드카 프로세스에만 로드
+                from app.services.embedding_sidecar import RemoteEmbeddingBackend
+
+                print(f"Connecting to embedding sidecar: {settings.EMBEDDING_SIDECAR_SOCKET}")
+                self._backend = RemoteEmbeddingBackend(settings.EMBEDDING_SIDECAR_SOCKET)
+            else:
+                from app.services.embedding_backends import create_backend
+
+                print(f"Loading embedding model: {settings.EMBEDDING_MODEL} ({settings.EMBEDDING_BACKEND})")
+                self._backend = create_backend(settings.EMBEDDING_BACKEND)
+            print(f"Embedding model loaded successfully (dimension {self._backend.dimension})")
         except Exception as e:
             print(f"Failed to load embedding model: {e}")
-            self._model = None
+            self._backend = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the model is in memory"""
+        return self._backend is not None
+
+    @property
+    def dimension(self) -> Optional[int]:
+        """Embedding dimension reported by the loaded model"""
+        return self._backend.dimension if self._backend is not None else None
 
+    @property
+    def backend_name(self) -> Optional[str]:
+        """Active backend name"""
+        return self._backend.name if self._backend is not None else None
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        backend = self._backend.name
+        embedding_batch_size.observe(len(texts), backend)
+        with embedding_duration.time(backend):
+            return self._backend.encode(texts)
+
+    @traced("embedding.embed_text")
     def embed_text(self, text: str) -> Optional[List[float]]:
         """Embed single text"""
-        if self._model is None:
+        if not self.load():
             return None
 
         try:
-            embedding = self._model.encode(text, normalize_embeddings=True)
-            return embedding.tolist()
+            return self._encode([text])[0].tolist()
         except Exception as e:
             print(f"Embedding error: {e}")
             return None
 
+    @traced("embedding.embed_texts")
     def embed_texts(self, texts: List[str]) -> Optional[List[List[float]]]:
         """Embed multiple texts"""
-        if self._model is None:
+        if not self.load():
             return None
 
         try:
-            embeddings = self._model.encode(texts, normalize_embeddings=True)
-            return embeddings.tolist()
+            return self._encode(texts).tolist()
         except Exception as e:
             print(f"Batch embedding error: {e}")
             return None
 
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Normalized float32 array (raises if the model is unavailable)"""
+        if not self.load():
+            raise RuntimeError("Embedding model is not loaded")
+        return self._encode(texts)
+
     def compute_similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
         """Compute cosine similarity between two embeddings"""
         vec1 = np.array(embedding1)
@@ -0,0 +1,313 @@
+"""
+Embedding sidecar - 임베딩/검색 전용 프로세스 (Unix socket)
+uvicorn 워커 N개가 모델 1개와 FAISS 인덱스 1개를 공유하고, 워커 간 요청을 배치로 묶어 처리합니다.
+
+실행:
+    python -m app.services.embedding_sidecar --socket /tmp/taxaigent-embed.sock &
+    EMBEDDING_SIDECAR_SOCKET=/tmp/taxaigent-embed.sock uvicorn app.main:app --workers 4
+
+프로토콜: 요청/응답마다 [header 길이][payload 길이] (각 4바이트) + JSON header + payload
+임베딩 벡터는 payload에 float32 바이트로 전달합니다.
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import struct
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+from app.core.config import settings
+from app.core.metrics import vector_search_duration
+from app.core.tracing import traced
+
+
+_FRAME = struct.Struct("!II")
+
+
+def _pack(header: dict, payload: bytes = b"") -> bytes:
+    header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    return _FRAME.pack(len(header_bytes), len(payload)) + header_bytes + payload
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise ConnectionError("Embedding sidecar closed the connection")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> Tuple[dict, bytes]:
+    header_size, payload_size = _FRAME.unpack(await reader.readexactly(_FRAME.size))
+    header = json.loads(await reader.readexactly(header_size))
+    payload = await reader.readexactly(payload_size) if payload_size else b""
+    return header, payload
+
+
+# ---------------------------------------------------------------------------
+# Client (uvicorn workers) - blocking, one connection per thread
+# ---------------------------------------------------------------------------
+
+class SidecarClient:
+    """Blocking client; RAG search already runs in worker threads"""
+
+    def __init__(self, socket_path: str):
+        self._socket_path = socket_path
+        self._local = threading.local()
+
+    def _connect(self, timeout: float) -> socket.socket:
+        """Connect, retrying while the sidecar is still loading the model"""
+        deadline = time.monotonic() + timeout
+        while True:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self._socket_path)
+                sock.settimeout(settings.EMBEDDING_SIDECAR_REQUEST_TIMEOUT)
+                return sock
+            except OSError:
+                sock.close()
+                if time.monotonic() >= deadline:
+                    raise
+                time.sleep(0.5)
+
+    def request(self, header: dict, connect_timeout: float = 0.0) -> Tuple[dict, bytes]:
+        """Send one request; reconnects once if a pooled connection went stale"""
+        for attempt in range(2):
+            sock = getattr(self._local, "sock", None)
+            if sock is None:
+                sock = self._local.sock = self._connect(connect_timeout)
+            try:
+                sock.sendall(_pack(header))
+                header_size, payload_size = _FRAME.unpack(_recv_exact(sock, _FRAME.size))
+                response = json.loads(_recv_exact(sock, header_size))
+                payload = _recv_exact(sock, payload_size) if payload_size else b""
+                break
+            except (OSError, ConnectionError):
+                sock.close()
+                self._local.sock = None
+                if attempt:
+                    raise
+
+        if "error" in response:
+            raise RuntimeError(f"Embedding sidecar error: {response['error']}")
+        return response, payload
+
+
+class RemoteEmbeddingBackend:
+    """Embedding backend served by the sidecar"""
+
+    name = "sidecar"
+
+    def __init__(self, socket_path: str):
+        self._client = SidecarClient(socket_path)
+        info, _ = self._client.request(
+            {"op": "info"}, connect_timeout=settings.EMBEDDING_SIDECAR_CONNECT_TIMEOUT
+        )
+        self.dimension = info["dimension"]
+        self.name = f"sidecar:{info['backend']}"
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        """Normalized float32 embeddings, shape (n, dimension)"""
+        header, payload = self._client.request({"op": "embed", "texts": texts})
+        return np.frombuffer(payload, dtype=np.float32).reshape(header["shape"])
+
+
+class RemoteVectorStore:
+    """LocalVectorStore interface backed by the sidecar's FAISS index"""
+
+    def __init__(self):
+        self._client: Optional[SidecarClient] = None
+        self._document_count = 0
+
+    def load(self):
+        """Wait for the sidecar and read index info"""
+        if self._client is None:
+            self._client = SidecarClient(settings.EMBEDDING_SIDECAR_SOCKET)
+        info, _ = self._client.request(
+            {"op": "info"}, connect_timeout=settings.EMBEDDING_SIDECAR_CONNECT_TIMEOUT
+        )
+        self._document_count = info["documents"]
+
+    @traced("vector_store.search")
+    def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        filter_dict: Optional[Dict] = None
+    ) -> List[Dict]:
+        """벡터 유사도 검색 (사이드카)"""
+        if self._client is None:
+            self.load()
+        with vector_search_duration.time("sidecar"):
+            header, _ = self._client.request(
+                {"op": "search", "query": query, "top_k": top_k, "filter": filter_dict}
+            )
+        return header["results"]
+
+    def rebuild(self):
+        raise RuntimeError("Rebuild the index in the sidecar process (scripts/rebuild_vector_store.py)")
+
+    @property
+    def document_count(self) -> int:
+        return self._document_count
+
+    @property
+    def is_ready(self) -> bool:
+        return self._document_count > 0
+
+
+remote_vector_store = RemoteVectorStore()
+
+
+# ---------------------------------------------------------------------------
+# Server (sidecar process)
+# ---------------------------------------------------------------------------
+
+class EmbeddingSidecarServer:
+    """Unix socket server that micro-batches embed requests across connections"""
+
+    def __init__(self, socket_path: str, max_batch: int, max_wait_ms: float):
+        self._socket_path = socket_path
+        self._max_batch = max_batch
+        self._max_wait = max_wait_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._embedding = None
+        self._store = None
+        self.batches = 0
+        self.texts = 0
+
+    def _load(self):
+        """Load model and FAISS index in this process only"""
+        from app.services.embedding_service import embedding_service
+        from app.services.local_vector_store import local_vector_store
+
+        if not embedding_service.load():
+            raise RuntimeError("Failed to load embedding model")
+        local_vector_store.load()
+        self._embedding = embedding_service
+        self._store = local_vector_store
+
+    async def _embed(self, texts: List[str]) -> np.ndarray:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((texts, future))
+        return await future
+
+    async def _batcher(self):
+        """Collect queued requests up to max_batch texts or max_wait, then encode once"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            count = len(batch[0][0])
+            deadline = loop.time() + self._max_wait
+            while count < self._max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+                count += len(item[0])
+
+            texts = [text for item_texts, _ in batch for text in item_texts]
+            try:
+                vectors = await asyncio.to_thread(self._embedding.encode, texts)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.texts += len(texts)
+            offset = 0
+            for item_texts, future in batch:
+                if not future.done():
+                    future.set_result(vectors[offset:offset + len(item_texts)])
+                offset += len(item_texts)
+
+    async def _handle(self, header: dict) -> Tuple[dict, bytes]:
+        op = header.get("op")
+        if op == "info":
+            return {
+                "dimension": self._embedding.dimension,
+                "backend": self._embedding.backend_name,
+                "documents": self._store.document_count,
+                "batches": self.batches,
+                "texts": self.texts,
+            }, b""
+        if op == "embed":
+            vectors = await self._embed(header["texts"])
+            return {"shape": list(vectors.shape)}, np.ascontiguousarray(vectors, np.float32).tobytes()
+        if op == "search":
+            vectors = await self._embed([header["query"]])
+            results = await asyncio.to_thread(
+                self._store.search_by_vector, vectors[0].tolist(), header.get("top_k", 5), header.get("filter")
+            )
+            return {"results": results}, b""
+        return {"error": f"unknown op: {op}"}, b""
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    header, _ = await _read_frame(reader)
+                except asyncio.IncompleteReadError:
+                    break
+                try:
+                    response, payload = await self._handle(header)
+                except Exception as e:
+                    response, payload = {"error": str(e)}, b""
+                writer.write(_pack(response, payload))
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self):
+        # 모델/인덱스 로드가 끝난 뒤 소켓을 열어 클라이언트가 준비 완료까지 대기하도록 함
+        await asyncio.to_thread(self._load)
+        self._queue = asyncio.Queue()
+        batcher = asyncio.create_task(self._batcher())
+
+        if os.path.exists(self._socket_path):
+            os.unlink(self._socket_path)
+        server = await asyncio.start_unix_server(self._serve_connection, path=self._socket_path)
+        print(f"Embedding sidecar listening on {self._socket_path} "
+              f"(batch {self._max_batch}, wait {self._max_wait * 1000:.1f}ms, "
+              f"{self._store.document_count} documents)")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batcher.cancel()
+            if os.path.exists(self._socket_path):
+                os.unlink(self._socket_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TaxAIgent embedding/retrieval sidecar")
+    parser.add_argument("--socket", default=settings.EMBEDDING_SIDECAR_SOCKET or "/tmp/taxaigent-embed.sock")
+    parser.add_argument("--max-batch", type=int, default=settings.EMBEDDING_SIDECAR_MAX_BATCH)
+    parser.add_argument("--max-wait-ms", type=float, default=settings.EMBEDDING_SIDECAR_MAX_WAIT_MS)
+    args = parser.parse_args()
+
+    # 사이드카 자신은 모델을 직접 로드 (환경변수를 워커와 공유해도 자기 자신에 연결하지 않도록)
+    settings.EMBEDDING_SIDECAR_SOCKET = None
+
+    server = EmbeddingSidecarServer(args.socket, args.max_batch, args.max_wait_ms)
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""
+Expense import - 카드 명세서(CSV/XLSX) 일괄 등록
+파일을 청크 단위로 읽고 검증한 뒤, 기존 지출과 (날짜, 금액, 가맹점)이 같은 행을 제외하고 청크별 다중 INSERT로 저장합니다.
+사용량은 가져오기 1회에 한 번(등록 건수만큼) 차감하고, AI 분류는 classify_batch 작업으로 나눠 백그라운드에서 실행합니다.
+"""
+import asyncio
+import codecs
+import csv
+import io
+import re
+from collections import Counter
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import select, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.expense import Expense
+from app.services.job_queue import job_queue, CLASSIFY_BATCH
+from app.services.user_service import UserService
+
+
+# 카드사별 명세서 헤더 (공백 제거, 소문자 비교)
+HEADER_ALIASES = {
+    "date": ("이용일자", "이용일", "거래일자", "거래일", "승인일자", "승인일", "승인일시", "사용일자", "사용일", "날짜", "일자", "date"),
+    "amount": ("이용금액", "승인금액", "거래금액", "결제금액", "사용금액", "금액", "amount"),
+    "vendor": ("가맹점명", "이용가맹점", "이용가맹점명", "가맹점", "이용처", "사용처", "거래처", "상호", "vendor", "merchant"),
+    "description": ("내용", "적요", "이용내역", "거래내용", "description"),
+    "vat_amount": ("부가세", "부가세액", "부가가치세", "vat"),
+    "memo": ("메모", "비고", "memo"),
+}
+# 명세서 상단 안내 문구 아래에서 헤더 행을 찾을 최대 행 수
+HEADER_SCAN_ROWS = 30
+# 응답에 포함할 오류 행 수
+ERROR_LIMIT = 100
+IMPORT_EXTENSIONS = (".csv", ".xlsx", ".xlsm")
+
+_DATE_PATTERN = re.compile(r"^(\d{4}|\d{2})\s*[.\-/년]?\s*(\d{1,2})\s*[.\-/월]?\s*(\d{1,2})")
+_CENT = Decimal("0.01")
+
+RowError = Tuple[int, str]
+
+
+def _normalize_header(value) -> str:
+    return re.sub(r"\s+", "", str(value or "")).lower()
+
+
+def _match_header(values: list) -> Optional[Dict[str, int]]:
+    """Column index per field, if this row looks like the header"""
+    normalized = [_normalize_header(value) for value in values]
+    columns = {}
+    for field, aliases in HEADER_ALIASES.items():
+        for alias in aliases:
+            if alias in normalized:
+                columns[field] = normalized.index(alias)
+                break
+    if "date" in columns and "amount" in columns and ("vendor" in columns or "description" in columns):
+        return columns
+    return None
+
+
+def _parse_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    match = _DATE_PATTERN.match(str(value or "").strip())
+    if not match:
+        raise ValueError(f"날짜 형식 오류: {value}")
+    year, month, day = (int(group) for group in match.groups())
+    if year < 100:
+        year += 2000
+    try:
+        return date(year, month, day)
+    except ValueError:
+        raise ValueError(f"날짜 형식 오류: {value}")
+
+
+def _parse_amount(value) -> Optional[Decimal]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float, Decimal)):
+        return Decimal(str(value))
+    text = re.sub(r"[,\s원₩]", "", str(value))
+    negative = text.startswith("(") and text.endswith(")")
+    try:
+        amount = Decimal(text.strip("()"))
+    except InvalidOperation:
+        raise ValueError(f"금액 형식 오류: {value}")
+    return -amount if negative else amount
+
+
+def _text(value, max_length: int) -> Optional[str]:
+    text = str(value).strip() if value is not None else ""
+    return text[:max_length] or None
+
+
+def _dedupe_key(expense_date: date, amount, vendor: Optional[str]) -> tuple:
+    return expense_date, Decimal(str(amount)).quantize(_CENT), (vendor or "").strip()
+
+
+def _detect_encoding(file: BinaryIO) -> str:
+    """UTF-8 (with or without BOM), else CP949 (국내 카드사 CSV 기본)"""
+    sample = file.read(65536)
+    file.seek(0)
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8-sig"
+    except UnicodeDecodeError:
+        return "cp949"
+
+
+def _iter_rows(file: BinaryIO, filename: str) -> Iterator[Tuple[int, list]]:
+    """(row number, cell values) from the first sheet or the CSV file"""
+    if filename.lower().endswith((".xlsx", ".xlsm")):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            for number, values in enumerate(workbook.active.iter_rows(values_only=True), start=1):
+                yield number, list(values)
+        finally:
+            workbook.close()
+    else:
+        text = io.TextIOWrapper(file, encoding=_detect_encoding(file), newline="")
+        try:
+            for number, values in enumerate(csv.reader(text), start=1):
+                yield number, values
+        finally:
+            text.detach()  # UploadFile이 원본 파일을 닫음
+
+
+class StatementReader:
+    """Reads and validates statement rows in chunks (blocking - run with asyncio.to_thread)"""
+
+    def __init__(self, file: BinaryIO, filename: str):
+        self._rows = _iter_rows(file, filename)
+        self.columns: Optional[Dict[str, int]] = None
+        self.rows_read = 0
+
+    def _find_header(self) -> None:
+        for number, values in self._rows:
+            self.columns = _match_header(values)
+            if self.columns:
+                return
+            if number >= HEADER_SCAN_ROWS:
+                break
+        raise ValueError("헤더 행을 찾을 수 없습니다 (날짜, 금액, 가맹점 또는 내용 열이 필요합니다)")
+
+    def _cell(self, values: list, field: str):
+        index = self.columns.get(field)
+        return values[index] if index is not None and index < len(values) else None
+
+    def _parse(self, values: list) -> dict:
+        amount = _parse_amount(self._cell(values, "amount"))
+        if amount is None:
+            raise ValueError("금액이 없습니다")
+        if amount <= 0:
+            raise ValueError("금액이 0 이하입니다 (취소/환불 거래)")
+
+        vendor = _text(self._cell(values, "vendor"), 100)
+        description = _text(self._cell(values, "description"), 200) or vendor
+        if not description:
+            raise ValueError("내용/가맹점이 없습니다")
+
+        vat_amount = _parse_amount(self._cell(values, "vat_amount"))
+        return {
+            "date": _parse_date(self._cell(values, "date")),
+            "description": description,
+            "amount": amount.quantize(_CENT),
+            "vat_amount": vat_amount.quantize(_CENT) if vat_amount and vat_amount > 0 else None,
+            "vendor": vendor,
+            "memo": _text(self._cell(values, "memo"), 1000),
+        }
+
+    def next_chunk(self, size: int) -> Tuple[List[dict], List[RowError], bool]:
+        """Up to size parsed rows and row errors; the flag is True at end of file"""
+        if self.columns is None:
+            self._find_header()
+
+        rows, errors = [], []
+        for number, values in self._rows:
+            if all(value is None or str(value).strip() == "" for value in values):
+                continue
+            self.rows_read += 1
+            try:
+                rows.append(self._parse(values))
+            except ValueError as e:
+                errors.append((number, str(e)))
+            if len(rows) + len(errors) >= size:
+                return rows, errors, False
+        return rows, errors, True
+
+
+class ExpenseImportService:
+    """Bulk expense import"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def import_statement(
+        self,
+        user_id: int,
+        file: BinaryIO,
+        filename: str,
+        auto_classify: bool = True
+    ) -> dict:
+        """Import a card statement (commits; raises ValueError and leaves the rollback to the caller)"""
+        user_service = UserService(self.db)
+        if not await user_service.check_usage_limit(user_id, "expense"):
+            raise ValueError("이번 달 지출 등록 횟수를 모두 사용하셨습니다")
+
+        reader = StatementReader(file, filename)
+        existing: Counter = Counter()
+        fetched_dates: Set[date] = set()
+        expense_ids: List[int] = []
+        errors: List[RowError] = []
+        duplicates = invalid = 0
+        now = datetime.utcnow()
+
+        done = False
+        while not done:
+            try:
+                rows, row_errors, done = await asyncio.to_thread(reader.next_chunk, settings.IMPORT_CHUNK_SIZE)
+            except ValueError:
+                raise
+            except Exception as e:
+                raise ValueError(f"파일을 읽을 수 없습니다: {e}")
+
+            if reader.rows_read > settings.IMPORT_MAX_ROWS:
+                raise ValueError(f"한 번에 최대 {settings.IMPORT_MAX_ROWS:,}행까지 등록할 수 있습니다")
+
+            invalid += len(row_errors)
+            errors.extend(row_errors[:ERROR_LIMIT - len(errors)])
+
+            unique = await self._drop_duplicates(user_id, rows, existing, fetched_dates)
+            duplicates += len(rows) - len(unique)
+            if not unique:
+                continue
+
+            # Multi-row INSERT ... RETURNING id (executemany)
+            result = await self.db.execute(
+                insert(Expense).returning(Expense.id),
+                [
+                    {
+                        **row,
+                        "user_id": user_id,
+                        "payment_method": "card",
+                        "evidence_type": "card",
+                        "source": "import",
+                        "ai_classified": False,
+                        "is_confirmed": False,
+                        "created_at": now,
+                        "updated_at": now,
+                    }
+                    for row in unique
+                ],
+            )
+            expense_ids.extend(result.scalars().all())
+
+        # Usage metered once for the whole import
+        if expense_ids and not await user_service.consume_usage(user_id, "expense", amount=len(expense_ids)):
+            raise ValueError(f"이번 달 남은 지출 등록 횟수가 부족합니다 ({len(expense_ids):,}건)")
+
+        jobs = []
+        if auto_classify and expense_ids:
+            size = settings.IMPORT_CLASSIFY_JOB_SIZE
+            jobs = [
+                job_queue.add(self.db, user_id, CLASSIFY_BATCH, {"expense_ids": expense_ids[i:i + size]})
+                for i in range(0, len(expense_ids), size)
+            ]
+
+        await self.db.commit()
+        for job in jobs:
+            await job_queue.dispatch(job)
+
+        return {
+            "total_rows": reader.rows_read,
+            "imported": len(expense_ids),
+            "duplicates": duplicates,
+            "invalid": invalid,
+            "errors": [{"row": row, "message": message} for row, message in errors],
+            "classification_job_ids": [job.id for job in jobs],
+        }
+
+    async def _drop_duplicates(
+        self,
+        user_id: int,
+        rows: List[dict],
+        existing: Counter,
+        fetched_dates: Set[date]
+    ) -> List[dict]:
+        """Drop rows matching saved expenses on (date, amount, vendor)"""
+        dates = {row["date"] for row in rows} - fetched_dates
+        if dates:
+            # 이미 조회한 날짜는 다시 읽지 않음 (이번 가져오기로 추가된 행과 구분)
+            result = await self.db.execute(
+                select(Expense.date, Expense.amount, Expense.vendor)
+                .where(Expense.user_id == user_id, Expense.date.in_(dates))
+            )
+            for expense_date, amount, vendor in result:
+                existing[_dedupe_key(expense_date, amount, vendor)] += 1
+            fetched_dates |= dates
+
+        # 같은 날 같은 금액의 거래가 여러 건일 수 있어 건수 단위로 차감
+        unique = []
+        for row in rows:
+            key = _dedupe_key(row["date"], row["amount"], row["vendor"])
+            if existing[key] > 0:
+                existing[key] -= 1
+                continue
+            unique.append(row)
+        return unique
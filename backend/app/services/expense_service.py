@@ -3,15 +3,17 @@ Expense service - 지출 관리 비즈니스 로직
 """
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc, and_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import select, update, func, desc, and_, case
 
+from app.core.config import settings
 from app.models.expense import Expense
-from app.models.category import Category
-from app.schemas.expense import ExpenseCreate, ExpenseUpdate
+from app.models.job import Job
+from app.schemas.expense import ExpenseCreate, ExpenseUpdate, ExpenseBulkUpdate
+from app.services.category_registry import category_registry, CategoryEntry
 from app.services.classifier_service import classifier_service
+from app.services.job_queue import job_queue, CLASSIFY_EXPENSE
 from app.services.user_service import UserService
 
 
@@ -21,11 +23,11 @@ class ExpenseService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def create(self, user_id: int, data: ExpenseCreate) -> Expense:
-        """Create new expense"""
-        # Check usage limit
+    async def create(self, user_id: int, data: ExpenseCreate) -> Tuple[Expense, Optional[Job]]:
+        """Create new expense (returns the queued classification job when auto_classify is set)"""
+        # Check and consume usage (committed together with the expense)
         user_service = UserService(self.db)
-        if not await user_service.check_usage_limit(user_id, "expense"):
+        if not await user_service.consume_usage(user_id, "expense"):
             raise ValueError("이번 달 지출 등록 횟수를 모두 사용하셨습니다")
 
         expense = Expense(
@@ -48,24 +50,32 @@ class ExpenseService:
                 expense.is_deductible = category.is_deductible
 
         self.db.add(expense)
+
+        # AI classification runs in the background (job committed with the expense)
+        job = None
+        if data.auto_classify and not data.category_id:
+            await self.db.flush()
+            job = job_queue.add(self.db, user_id, CLASSIFY_EXPENSE, {"expense_id": expense.id})
+
+        # Defaults and id are populated by the flush; categories are resolved from the registry
         await self.db.commit()
-        await self.db.refresh(expense)
+        if job:
+            await job_queue.dispatch(job)
 
-        # Log usage
-        await user_service.log_usage(user_id, "expense")
+        return expense, job
 
-        # Load relationships
-        return await self.get_by_id(expense.id, user_id)
+    async def exists(self, expense_id: int, user_id: int) -> bool:
+        """Check expense ownership without loading it"""
+        result = await self.db.execute(
+            select(Expense.id).where(Expense.id == expense_id, Expense.user_id == user_id)
+        )
+        return result.scalar_one_or_none() is not None
 
     async def get_by_id(self, expense_id: int, user_id: int) -> Optional[Expense]:
         """Get expense by ID"""
+        await category_registry.ensure_loaded(self.db)
         result = await self.db.execute(
-            select(Expense)
-            .options(
-                selectinload(Expense.category),
-                selectinload(Expense.ai_category)
-            )
-            .where(Expense.id == expense_id, Expense.user_id == user_id)
+            select(Expense).where(Expense.id == expense_id, Expense.user_id == user_id)
         )
         return result.scalar_one_or_none()
 
@@ -121,11 +131,8 @@ class ExpenseService:
         sum_result = await self.db.execute(sum_query)
         total_amount = sum_result.scalar() or Decimal("0")
 
-        # Get paginated results
-        query = query.options(
-            selectinload(Expense.category),
-            selectinload(Expense.ai_category)
-        )
+        # Get paginated results (categories are resolved from the registry)
+        await category_registry.ensure_loaded(self.db)
         query = query.order_by(desc(Expense.date), desc(Expense.id))
         query = query.offset((page - 1) * size).limit(size)
 
@@ -135,24 +142,90 @@ class ExpenseService:
         return list(items), total, total_amount
 
     async def update(self, expense_id: int, user_id: int, data: ExpenseUpdate) -> Optional[Expense]:
-        """Update expense"""
-        expense = await self.get_by_id(expense_id, user_id)
-        if not expense:
-            return None
-
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(expense, field, value)
+        """Update expense (one UPDATE ... RETURNING where the dialect supports it)"""
+        await category_registry.ensure_loaded(self.db)
+        values = data.model_dump(exclude_unset=True)
 
         # If category is updated, update is_deductible
         if data.category_id:
             category = await self._get_category(data.category_id)
             if category and data.is_deductible is None:
-                expense.is_deductible = category.is_deductible
+                values["is_deductible"] = category.is_deductible
 
-        expense.updated_at = datetime.utcnow()
+        values["updated_at"] = datetime.utcnow()
+
+        if not self.db.get_bind().dialect.update_returning:
+            expense = await self.get_by_id(expense_id, user_id)
+            if not expense:
+                return None
+            for field, value in values.items():
+                setattr(expense, field, value)
+            await self.db.commit()
+            return expense
+
+        result = await self.db.execute(
+            update(Expense)
+            .where(Expense.id == expense_id, Expense.user_id == user_id)
+            .values(**values)
+            .returning(Expense)
+            .execution_options(populate_existing=True)
+        )
+        expense = result.scalar_one_or_none()
         await self.db.commit()
-        return await self.get_by_id(expense_id, user_id)
+        return expense
+
+    async def bulk_update(self, user_id: int, data: ExpenseBulkUpdate) -> dict:
+        """Apply the same changes to many expenses with one UPDATE"""
+        values = data.model_dump(exclude={"ids"}, exclude_none=True)
+
+        # If category is updated, update is_deductible (same as update())
+        if data.category_id is not None:
+            category = await self._get_category(data.category_id)
+            if not category:
+                raise ValueError("존재하지 않는 계정과목입니다")
+            if data.is_deductible is None:
+                values["is_deductible"] = category.is_deductible
+
+        return await self._bulk_execute(user_id, data.ids, values)
+
+    async def bulk_confirm(self, user_id: int, expense_ids: List[int]) -> dict:
+        """Confirm expenses, keeping the AI category where none was set"""
+        await category_registry.ensure_loaded(self.db)
+        deductible = {entry.id: entry.is_deductible for entry in category_registry.all()}
+
+        values = {
+            "is_confirmed": True,
+            "category_id": func.coalesce(Expense.category_id, Expense.ai_category_id),
+        }
+        if deductible:
+            # Deductibility follows the category the row ends up with (manual first, then AI)
+            values["is_deductible"] = func.coalesce(
+                Expense.is_deductible,
+                case(deductible, value=func.coalesce(Expense.category_id, Expense.ai_category_id), else_=None)
+            )
+        return await self._bulk_execute(user_id, expense_ids, values)
+
+    async def _bulk_execute(self, user_id: int, expense_ids: List[int], values: dict) -> dict:
+        """Set-based UPDATE scoped to the user's rows (returns a compact summary)"""
+        ids = set(expense_ids)
+        condition = (Expense.user_id == user_id, Expense.id.in_(ids))
+        statement = (
+            update(Expense)
+            .where(*condition)
+            .values(**values, updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+
+        if self.db.get_bind().dialect.update_returning:
+            result = await self.db.execute(statement.returning(Expense.id))
+            updated = set(result.scalars().all())
+        else:
+            result = await self.db.execute(select(Expense.id).where(*condition))
+            updated = set(result.scalars().all())
+            await self.db.execute(statement)
+        await self.db.commit()
+
+        return {"updated": len(updated), "not_found": sorted(ids - updated)}
 
     async def delete(self, expense_id: int, user_id: int) -> bool:
         """Delete expense"""
@@ -193,7 +266,72 @@ class ExpenseService:
 
         expense.updated_at = datetime.utcnow()
         await self.db.commit()
-        return await self.get_by_id(expense_id, user_id)
+        return expense
+
+    async def classify_many(self, expense_ids: List[int], user_id: int) -> dict:
+        """
+        Classify unclassified expenses in LLM batches, committing after each batch.
+
+        Rows with the same description and vendor share one classification.
+        A retried job only sees rows not classified yet, so completed batches are not paid for again.
+        """
+        result = await self.db.execute(
+            select(
+                Expense.id, Expense.description, Expense.amount, Expense.vendor,
+                Expense.category_id, Expense.is_confirmed
+            ).where(
+                Expense.id.in_(expense_ids),
+                Expense.user_id == user_id,
+                Expense.ai_classified == False  # noqa: E712 - 재시도 시 이미 분류된 행 제외
+            )
+        )
+        rows = result.all()
+        if not rows:
+            return {"classified": 0, "llm_calls": 0}
+
+        # (description, vendor) -> rows sharing the classification
+        groups: Dict[tuple, list] = {}
+        for row in rows:
+            groups.setdefault((row.description, row.vendor), []).append(row)
+        keys = list(groups)
+
+        await category_registry.ensure_loaded(self.db)
+        batch_size = settings.IMPORT_CLASSIFY_BATCH_SIZE
+        llm_calls = 0
+        for i in range(0, len(keys), batch_size):
+            batch = keys[i:i + batch_size]
+            items = [(groups[key][0].description, groups[key][0].amount, groups[key][0].vendor) for key in batch]
+            results = await classifier_service.classify_batch(items)
+            llm_calls += 1
+
+            now = datetime.utcnow()
+            ai_only, applied = [], []
+            for key, classification in zip(batch, results):
+                category = category_registry.get_by_code(classification.category_code)
+                for row in groups[key]:
+                    params = {
+                        "id": row.id,
+                        "ai_classified": True,
+                        "ai_category_id": category.id if category else None,
+                        "ai_confidence": Decimal(str(classification.confidence)),
+                        "ai_reason": classification.reason,
+                        "updated_at": now,
+                    }
+                    # If not manually set, apply AI classification
+                    if not row.is_confirmed and not row.category_id:
+                        params["category_id"] = category.id if category else None
+                        params["is_deductible"] = classification.is_deductible
+                        applied.append(params)
+                    else:
+                        ai_only.append(params)
+
+            # Bulk UPDATE by primary key (executemany), committed per LLM batch so a timeout keeps finished batches
+            for params in (applied, ai_only):
+                if params:
+                    await self.db.execute(update(Expense), params)
+            await self.db.commit()
+
+        return {"classified": len(rows), "llm_calls": llm_calls}
 
     async def classify_description(
         self,
@@ -215,16 +353,12 @@ class ExpenseService:
             "reason": result.reason
         }
 
-    async def _get_category(self, category_id: int) -> Optional[Category]:
+    async def _get_category(self, category_id: int) -> Optional[CategoryEntry]:
         """Get category by ID"""
-        result = await self.db.execute(
-            select(Category).where(Category.id == category_id)
-        )
-        return result.scalar_one_or_none()
+        await category_registry.ensure_loaded(self.db)
+        return category_registry.get(category_id)
 
-    async def _get_category_by_code(self, code: str) -> Optional[Category]:
+    async def _get_category_by_code(self, code: str) -> Optional[CategoryEntry]:
         """Get category by code"""
-        result = await self.db.execute(
-            select(Category).where(Category.code == code.upper())
-        )
-        return result.scalar_one_or_none()
+        await category_registry.ensure_loaded(self.db)
+        return category_registry.get_by_code(code)
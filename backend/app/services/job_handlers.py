@@ -0,0 +1,74 @@
+"""
+Job handlers - 백그라운드 작업 핸들러 (AI 분류, 장부 내보내기)
+"""
+import asyncio
+from datetime import date
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.job import Job
+from app.services.expense_service import ExpenseService
+from app.services.job_queue import (
+    job_queue, JobError, result_path, CLASSIFY_EXPENSE, CLASSIFY_BATCH, EXPORT_LEDGER
+)
+from app.services.ledger_service import LedgerService, render_export, EXPORT_MEDIA_TYPES
+from app.services.user_service import UserService
+
+
+@job_queue.register(CLASSIFY_EXPENSE, concurrency=settings.JOB_CLASSIFY_CONCURRENCY)
+async def classify_expense(db: AsyncSession, job: Job) -> dict:
+    """AI classification of a saved expense (payload: expense_id)"""
+    expense = await ExpenseService(db).classify(job.payload["expense_id"], job.user_id)
+    if not expense:
+        raise JobError("지출 내역을 찾을 수 없습니다")
+
+    return {
+        "expense_id": expense.id,
+        "category_id": expense.category_id,
+        "ai_category_id": expense.ai_category_id,
+        "ai_confidence": float(expense.ai_confidence) if expense.ai_confidence is not None else None,
+        "ai_reason": expense.ai_reason,
+        "is_deductible": expense.is_deductible,
+    }
+
+
+@job_queue.register(CLASSIFY_BATCH, concurrency=settings.JOB_CLASSIFY_CONCURRENCY)
+async def classify_batch(db: AsyncSession, job: Job) -> dict:
+    """Batched AI classification of imported expenses (payload: expense_ids)"""
+    return await ExpenseService(db).classify_many(job.payload["expense_ids"], job.user_id)
+
+
+def _write_file(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+
+
+@job_queue.register(EXPORT_LEDGER, concurrency=settings.JOB_EXPORT_CONCURRENCY)
+async def export_ledger(db: AsyncSession, job: Job) -> dict:
+    """Ledger export to a result file (payload: start_date, end_date, format)"""
+    start_date = date.fromisoformat(job.payload["start_date"])
+    end_date = date.fromisoformat(job.payload["end_date"])
+
+    entries, summary, _ = await LedgerService(db).get_ledger(
+        user_id=job.user_id,
+        start_date=start_date,
+        end_date=end_date
+    )
+    # Workbook build/save is CPU-bound, keep it off the event loop
+    content, extension = await asyncio.to_thread(render_export, entries, summary, job.payload["format"])
+
+    # Usage is committed together with the job result
+    if not await UserService(db).consume_usage(job.user_id, "export"):
+        raise JobError("이번 달 내보내기 횟수를 모두 사용하셨습니다")
+
+    path = result_path(job.id, extension)
+    await asyncio.to_thread(_write_file, path, content)
+
+    return {
+        "filename": f"ledger_{start_date}_{end_date}.{extension}",
+        "media_type": EXPORT_MEDIA_TYPES[extension],
+        "extension": extension,
+        "size": len(content),
+    }
@@ -0,0 +1,448 @@
+"""
+Job queue - 백그라운드 작업 큐 (AI 분류, 장부 내보내기)
+작업 기록은 jobs 테이블에 저장하고, 실행 대기열은 프로세스 내 asyncio.Queue (JOB_QUEUE_REDIS면 Redis 리스트)를 사용합니다.
+작업 유형별 워커 수로 동시 실행을 제한하고, 실패 시 지수 백오프로 재시도합니다.
+유실된 작업(재시도 대기 시간이 지나도 queued/running이고 대기열에도 없는 작업)은 다시 넣습니다.
+Redis 대기열은 주기적으로, 프로세스 내 큐는 다른 워커의 대기열을 볼 수 없으므로 시작 직후에만 복구합니다.
+내보내기 결과 파일은 JOB_RESULT_TTL_SECONDS가 지나면 삭제하고 작업 결과에 expired를 표시합니다.
+"""
+import asyncio
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.core.metrics import registry
+from app.core.redis import get_redis
+from app.models.job import Job
+
+
+# Job status
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+# Job types (handlers: app/services/job_handlers.py)
+CLASSIFY_EXPENSE = "classify_expense"
+CLASSIFY_BATCH = "classify_batch"
+EXPORT_LEDGER = "export_ledger"
+
+REDIS_KEY_PREFIX = "taxaigent:jobs:"
+# 유실 작업 복구는 주기마다 한 프로세스만 실행
+REDIS_RECOVER_LOCK = REDIS_KEY_PREFIX + "recover-lock"
+# Redis BRPOP 대기 시간 (종료 시 워커가 멈추는 최대 시간)
+REDIS_POP_TIMEOUT = 5
+# 만료 처리 시 한 번에 갱신할 작업 수
+EXPIRE_BATCH_SIZE = 500
+
+# handler(db, job) -> result dict (JSON). 핸들러가 커밋하지 않은 변경은 작업 완료와 함께 커밋됩니다.
+JobHandler = Callable[[AsyncSession, Job], Awaitable[Optional[dict]]]
+
+
+class JobError(Exception):
+    """Permanent job failure (not retried, message is shown to the user)"""
+
+
+@dataclass
+class JobType:
+    name: str
+    handler: JobHandler
+    concurrency: int
+    max_attempts: int
+
+
+job_duration = registry.histogram(
+    "job_duration_seconds", "Background job run time", ("type", "status"),
+)
+
+
+def result_dir() -> Path:
+    """Result file directory (relative JOB_RESULT_DIR is resolved from the backend root)"""
+    directory = Path(settings.JOB_RESULT_DIR)
+    if not directory.is_absolute():
+        directory = Path(__file__).parent.parent.parent / directory
+    return directory
+
+
+def result_path(job_id: str, extension: str) -> Path:
+    """Result file for a job"""
+    return result_dir() / f"{job_id}.{extension}"
+
+
+def result_expired(job: Job) -> bool:
+    """Result file removed, or due for removal by the next cleanup"""
+    if job.result and job.result.get("expired"):
+        return True
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.JOB_RESULT_TTL_SECONDS)
+    return job.finished_at is not None and job.finished_at < cutoff
+
+
+def remove_results(job_id: str) -> None:
+    """Delete a job's result files (blocking)"""
+    directory = result_dir()
+    if directory.is_dir():
+        for path in directory.glob(f"{job_id}.*"):
+            path.unlink(missing_ok=True)
+
+
+def _remove_expired_files(cutoff: float) -> List[str]:
+    """Delete result files last written before cutoff (blocking), returns their job ids"""
+    directory = result_dir()
+    if not directory.is_dir():
+        return []
+    job_ids = []
+    for path in directory.iterdir():
+        try:
+            if path.is_file() and path.stat().st_mtime < cutoff:
+                path.unlink()
+                job_ids.append(path.stem)
+        except FileNotFoundError:
+            pass  # 다른 프로세스가 먼저 삭제
+    return job_ids
+
+
+class JobQueue:
+    """Persistent job records + bounded per-type workers (per process)"""
+
+    def __init__(self):
+        self._types: Dict[str, JobType] = {}
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: List[asyncio.Task] = []
+        self._retries: Set[asyncio.Task] = set()
+        self._local_ids: Set[str] = set()  # 로컬 큐에서 대기 중인 작업
+        self._maintenance: Optional[asyncio.Task] = None
+        self._running = False
+
+    def register(self, name: str, concurrency: int, max_attempts: Optional[int] = None):
+        """Decorator registering a job handler"""
+        def decorator(handler: JobHandler) -> JobHandler:
+            self._types[name] = JobType(
+                name=name,
+                handler=handler,
+                concurrency=max(1, concurrency),
+                max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+            )
+            return handler
+        return decorator
+
+    @property
+    def _redis(self):
+        return get_redis() if settings.JOB_QUEUE_REDIS else None
+
+    # -------------------------------------------------------------------------
+    # Enqueue
+    # -------------------------------------------------------------------------
+
+    def add(self, db: AsyncSession, user_id: int, job_type: str, payload: dict) -> Job:
+        """Add a job to the session (dispatch it with dispatch() after the commit)"""
+        spec = self._types.get(job_type)
+        if spec is None:
+            raise ValueError(f"Unknown job type: {job_type}")
+
+        job = Job(
+            id=str(uuid.uuid4()),
+            user_id=user_id,
+            type=job_type,
+            status=QUEUED,
+            payload=payload,
+            attempts=0,
+            max_attempts=spec.max_attempts,
+            created_at=datetime.utcnow(),
+        )
+        db.add(job)
+        return job
+
+    async def enqueue(self, db: AsyncSession, user_id: int, job_type: str, payload: dict) -> Job:
+        """Persist and dispatch a job (commits the session)"""
+        job = self.add(db, user_id, job_type, payload)
+        # 워커는 별도 세션에서 조회하므로 디스패치 전에 커밋
+        await db.commit()
+        await self.dispatch(job)
+        return job
+
+    async def dispatch(self, job: Job) -> None:
+        """Hand a committed job to the workers"""
+        await self._push(job.type, job.id)
+
+    async def _push(self, job_type: str, job_id: str) -> None:
+        client = self._redis
+        if client is not None:
+            try:
+                await client.lpush(REDIS_KEY_PREFIX + job_type, job_id)
+                return
+            except Exception as e:
+                print(f"Redis job push failed, using local queue: {e}")
+
+        queue = self._queues.get(job_type)
+        if queue is None:
+            # 워커 미실행 (스크립트 등): queued 상태로 남고 다음 복구에서 처리
+            print(f"Job queue not running, {job_type} job {job_id} stays queued")
+            return
+        self._local_ids.add(job_id)
+        queue.put_nowait(job_id)
+
+    # -------------------------------------------------------------------------
+    # Workers
+    # -------------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start workers and the maintenance task (called from FastAPI lifespan)"""
+        if self._running:
+            return
+        self._running = True
+
+        for spec in self._types.values():
+            self._queues[spec.name] = asyncio.Queue()
+            for i in range(spec.concurrency):
+                self._workers.append(
+                    asyncio.create_task(self._worker(spec), name=f"job-{spec.name}-{i}")
+                )
+
+        self._maintenance = asyncio.create_task(self._maintain(), name="job-maintenance")
+        print(f"Job queue started ({', '.join(f'{s.name} x{s.concurrency}' for s in self._types.values())}"
+              f"{', redis' if self._redis is not None else ''})")
+
+    async def stop(self) -> None:
+        """Cancel workers (interrupted jobs are recovered once their retry window passes)"""
+        self._running = False
+        tasks = self._workers + list(self._retries)
+        if self._maintenance is not None:
+            tasks.append(self._maintenance)
+            self._maintenance = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._workers.clear()
+        self._retries.clear()
+        self._queues.clear()
+        self._local_ids.clear()
+
+    def _recovery_window(self) -> float:
+        """Longest a live job stays queued/running: a timed-out attempt (with slack) plus the longest retry backoff"""
+        max_attempts = max((spec.max_attempts for spec in self._types.values()), default=1)
+        backoff = settings.JOB_RETRY_BACKOFF_SECONDS * (2 ** (max_attempts - 1))
+        return settings.JOB_TIMEOUT_SECONDS * 2 + backoff
+
+    async def _acquire_recover_lock(self) -> bool:
+        client = self._redis
+        if client is None:
+            return True
+        try:
+            ttl = max(1, int(settings.JOB_MAINTENANCE_INTERVAL_SECONDS))
+            return bool(await client.set(REDIS_RECOVER_LOCK, "1", nx=True, ex=ttl))
+        except Exception as e:
+            print(f"Redis job recover lock failed: {e}")
+            return True
+
+    async def _waiting_ids(self) -> Set[str]:
+        """Job ids still waiting in a queue (not lost, only behind a backlog)"""
+        waiting = set(self._local_ids)
+        client = self._redis
+        if client is not None:
+            for name in self._types:
+                waiting.update(await client.lrange(REDIS_KEY_PREFIX + name, 0, -1))
+        return waiting
+
+    async def _recover(self) -> None:
+        """Requeue jobs lost by a stopped process (past the retry window and in no queue)"""
+        if not await self._acquire_recover_lock():
+            return
+
+        # 재시도 대기 중이거나 다른 워커가 실행 중인 작업은 건드리지 않음
+        stale_before = datetime.utcnow() - timedelta(seconds=self._recovery_window())
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(Job)
+                .where(Job.status == RUNNING, Job.started_at < stale_before)
+                .values(status=QUEUED)
+            )
+            await db.commit()
+            result = await db.execute(
+                select(Job.id, Job.type)
+                .where(Job.status == QUEUED, func.coalesce(Job.started_at, Job.created_at) < stale_before)
+                .order_by(Job.created_at)
+            )
+            rows = result.all()
+
+        waiting = await self._waiting_ids() if rows else set()
+        lost = [(job_id, job_type) for job_id, job_type in rows if job_id not in waiting and job_type in self._types]
+        for job_id, job_type in lost:
+            await self._push(job_type, job_id)
+        if lost:
+            print(f"Requeued {len(lost)} unfinished jobs")
+
+    async def _maintain(self) -> None:
+        """Recovery of lost jobs and periodic cleanup of expired result files"""
+        # 로컬 큐: 시작 시점에 아직 재시도 대기 시간 안이던 작업까지 잡도록 대기 시간이 지난 뒤 한 번 더 복구
+        recover_until = time.monotonic() + self._recovery_window() + settings.JOB_MAINTENANCE_INTERVAL_SECONDS
+        while True:
+            if self._redis is not None or time.monotonic() <= recover_until:
+                try:
+                    await self._recover()
+                except Exception as e:
+                    print(f"Job recovery failed: {e}")
+            try:
+                await self._expire_results()
+            except Exception as e:
+                print(f"Job result cleanup failed: {e}")
+            await asyncio.sleep(settings.JOB_MAINTENANCE_INTERVAL_SECONDS)
+
+    async def _expire_results(self) -> None:
+        """Delete result files older than JOB_RESULT_TTL_SECONDS and mark their jobs expired"""
+        cutoff = time.time() - settings.JOB_RESULT_TTL_SECONDS
+        job_ids = await asyncio.to_thread(_remove_expired_files, cutoff)
+        if not job_ids:
+            return
+
+        async with AsyncSessionLocal() as db:
+            for i in range(0, len(job_ids), EXPIRE_BATCH_SIZE):
+                result = await db.execute(
+                    select(Job).where(Job.id.in_(job_ids[i:i + EXPIRE_BATCH_SIZE]), Job.status == SUCCEEDED)
+                )
+                for job in result.scalars():
+                    if job.result and not job.result.get("expired"):
+                        # JSON 컬럼은 변경 추적이 없어 새 dict를 할당
+                        job.result = {**job.result, "expired": True}
+            await db.commit()
+        print(f"Removed {len(job_ids)} expired job result files")
+
+    async def _next_job_id(self, spec: JobType) -> Optional[str]:
+        queue = self._queues[spec.name]
+        client = self._redis
+        if client is None:
+            return await queue.get()
+
+        # Redis 장애 시 로컬 큐로 들어간 작업 먼저
+        if not queue.empty():
+            return queue.get_nowait()
+        try:
+            item = await client.brpop(REDIS_KEY_PREFIX + spec.name, timeout=REDIS_POP_TIMEOUT)
+            return item[1] if item else None
+        except Exception as e:
+            print(f"Redis job pop failed: {e}")
+            await asyncio.sleep(1)
+            return None
+
+    async def _worker(self, spec: JobType) -> None:
+        while True:
+            job_id = await self._next_job_id(spec)
+            if not job_id:
+                continue
+            self._local_ids.discard(job_id)
+            try:
+                await self._run(spec, job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Job {job_id} ({spec.name}) worker error: {e}")
+
+    async def _run(self, spec: JobType, job_id: str) -> None:
+        async with AsyncSessionLocal() as db:
+            # queued -> running (다른 워커/프로세스가 이미 가져간 작업이면 건너뜀)
+            claimed = await db.execute(
+                update(Job)
+                .where(Job.id == job_id, Job.status == QUEUED)
+                .values(status=RUNNING, attempts=Job.attempts + 1, started_at=datetime.utcnow())
+            )
+            await db.commit()
+            if claimed.rowcount != 1:
+                return
+
+            job = await db.get(Job, job_id)
+            attempts, max_attempts = job.attempts, job.max_attempts
+            start = time.perf_counter()
+            try:
+                if attempts > max_attempts:
+                    raise JobError("재시도 횟수를 초과했습니다")
+                result = await asyncio.wait_for(spec.handler(db, job), settings.JOB_TIMEOUT_SECONDS)
+            except Exception as e:
+                await self._abort(db, spec, job_id, attempts, max_attempts, e, start)
+                return
+
+            job.status = SUCCEEDED
+            job.result = result
+            job.error = None
+            job.finished_at = datetime.utcnow()
+            try:
+                await db.commit()
+            except Exception as e:
+                # 결과 파일은 커밋 전에 쓰이므로 함께 정리
+                await self._abort(db, spec, job_id, attempts, max_attempts, e, start)
+                return
+            job_duration.observe(time.perf_counter() - start, spec.name, SUCCEEDED)
+
+    async def _abort(
+        self,
+        db: AsyncSession,
+        spec: JobType,
+        job_id: str,
+        attempts: int,
+        max_attempts: int,
+        error: Exception,
+        start: float
+    ) -> None:
+        """Roll back a failed run and remove its partial result file"""
+        await db.rollback()
+        # 타임아웃 후에도 스레드에서 계속 쓰이는 파일은 만료 정리에서 삭제됨
+        await asyncio.to_thread(remove_results, job_id)
+        job_duration.observe(time.perf_counter() - start, spec.name, FAILED)
+        await self._fail(db, spec, job_id, attempts, max_attempts, error)
+
+    async def _fail(
+        self,
+        db: AsyncSession,
+        spec: JobType,
+        job_id: str,
+        attempts: int,
+        max_attempts: int,
+        error: Exception
+    ) -> None:
+        """Retry with exponential backoff, or mark the job failed"""
+        message = str(error) or type(error).__name__
+        retry = not isinstance(error, JobError) and attempts < max_attempts
+        print(f"Job {job_id} ({spec.name}) attempt {attempts}/{max_attempts} failed: {message}")
+
+        values = {"status": QUEUED, "error": message} if retry else \
+            {"status": FAILED, "error": message, "finished_at": datetime.utcnow()}
+        await db.execute(update(Job).where(Job.id == job_id).values(**values))
+        await db.commit()
+
+        if retry:
+            delay = settings.JOB_RETRY_BACKOFF_SECONDS * (2 ** (attempts - 1))
+            task = asyncio.create_task(self._retry_later(spec.name, job_id, delay))
+            self._retries.add(task)
+            task.add_done_callback(self._retries.discard)
+
+    async def _retry_later(self, job_type: str, job_id: str, delay: float) -> None:
+        await asyncio.sleep(delay)
+        await self._push(job_type, job_id)
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    async def get(self, db: AsyncSession, job_id: str, user_id: int) -> Optional[Job]:
+        """Get a job owned by the user"""
+        result = await db.execute(
+            select(Job).where(Job.id == job_id, Job.user_id == user_id)
+        )
+        return result.scalar_one_or_none()
+
+    def queue_depths(self) -> Dict[str, int]:
+        return {name: queue.qsize() for name, queue in self._queues.items()}
+
+
+job_queue = JobQueue()
+
+registry.gauge(
+    "job_queue_depth", "Jobs waiting in the local queue",
+    lambda: [((name,), depth) for name, depth in job_queue.queue_depths().items()], ("type",),
+)
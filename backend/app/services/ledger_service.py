@@ -1,6 +1,7 @@
 """
 Ledger service - 장부/통계 비즈니스 로직
 """
+import io
 from datetime import date, datetime
 from decimal import Decimal
 from typing import List, Tuple, Optional
@@ -382,3 +383,78 @@ class LedgerService:
                 prev_limit = limit
 
         return Decimal(str(int(tax)))
+
+
+# =============================================================================
+# Export rendering (blocking - run with asyncio.to_thread)
+# =============================================================================
+
+EXPORT_MEDIA_TYPES = {
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "csv": "text/csv",
+}
+
+
+def _deductible_mark(entry: LedgerEntry) -> str:
+    return "O" if entry.is_deductible else ("X" if entry.is_deductible is False else "-")
+
+
+def _render_csv(entries: List[LedgerEntry], summary: LedgerSummary) -> bytes:
+    output = io.StringIO()
+    output.write("날짜,내용,수입,지출,계정과목,증빙유형,경비인정\n")
+    for entry in entries:
+        output.write(f"{entry.date},{entry.description},{entry.income},{entry.expense},{entry.category_name or ''},{entry.evidence_type},{_deductible_mark(entry)}\n")
+
+    output.write(f"\n요약\n")
+    output.write(f"총 수입,{summary.total_income}\n")
+    output.write(f"총 지출,{summary.total_expense}\n")
+    output.write(f"경비인정액,{summary.deductible_expense}\n")
+    output.write(f"순이익,{summary.net_income}\n")
+    output.write(f"예상세금,{summary.estimated_tax}\n")
+    return output.getvalue().encode('utf-8-sig')
+
+
+def _render_excel(entries: List[LedgerEntry], summary: LedgerSummary) -> bytes:
+    from openpyxl import Workbook
+
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "간편장부"
+
+    # Headers
+    ws.append(["날짜", "내용", "수입", "지출", "계정과목", "증빙유형", "경비인정"])
+
+    # Data
+    for entry in entries:
+        ws.append([
+            str(entry.date),
+            entry.description,
+            float(entry.income),
+            float(entry.expense),
+            entry.category_name or "",
+            entry.evidence_type,
+            _deductible_mark(entry)
+        ])
+
+    # Summary
+    ws.append([])
+    ws.append(["요약"])
+    ws.append(["총 수입", float(summary.total_income)])
+    ws.append(["총 지출", float(summary.total_expense)])
+    ws.append(["경비인정액", float(summary.deductible_expense)])
+    ws.append(["순이익", float(summary.net_income)])
+    ws.append(["예상세금", float(summary.estimated_tax)])
+
+    output = io.BytesIO()
+    wb.save(output)
+    return output.getvalue()
+
+
+def render_export(entries: List[LedgerEntry], summary: LedgerSummary, format: str) -> Tuple[bytes, str]:
+    """Render the ledger as Excel (or CSV); returns (content, file extension)"""
+    if format == "excel":
+        try:
+            return _render_excel(entries, summary), "xlsx"
+        except ImportError:
+            pass  # Fallback to CSV if openpyxl not available
+    return _render_csv(entries, summary), "csv"
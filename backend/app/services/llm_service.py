@@ -1,13 +1,19 @@
 """
 LLM service - Gemini/GPT 라우터
+고정 시스템 프롬프트는 각 제공자의 system instruction으로 분리해 전송하여 prefix 캐싱이 적용되도록 합니다.
 """
+import asyncio
 import time
-from typing import Optional, Dict, Any
+from datetime import timedelta
+from typing import Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 import google.generativeai as genai
 from openai import AsyncOpenAI
 
 from app.core.config import settings
+from app.core.metrics import llm_errors, llm_request_duration, llm_tokens
+from app.core.tracing import traced
+from app.services.token_counter import estimate_tokens
 
 
 @dataclass
@@ -19,12 +25,30 @@ class LLMResponse:
     input_tokens: int
     output_tokens: int
     response_time_ms: int
+    cached_input_tokens: int = 0  # input_tokens 중 제공자 캐시에서 처리된 토큰
+
+
+def _record_metrics(
+    provider: str,
+    model: str,
+    response_time_ms: int,
+    input_tokens: int,
+    cached_input_tokens: int,
+    output_tokens: int
+) -> None:
+    llm_request_duration.observe(response_time_ms / 1000, provider, model)
+    llm_tokens.inc(provider, model, "input", amount=input_tokens or 0)
+    llm_tokens.inc(provider, model, "cached_input", amount=cached_input_tokens or 0)
+    llm_tokens.inc(provider, model, "output", amount=output_tokens or 0)
 
 
 class LLMService:
     """LLM service with fallback support"""
 
     def __init__(self):
+        # system prompt -> (GenerativeModel, expires_at)
+        self._gemini_models: Dict[str, Tuple[Any, float]] = {}
+        self._gemini_lock = asyncio.Lock()
         self._init_clients()
 
     def _init_clients(self):
@@ -38,27 +62,34 @@ class LLMService:
 
         # OpenAI
         if settings.OPENAI_API_KEY:
-            self.openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+            self.openai_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY, base_url=settings.OPENAI_BASE_URL)
         else:
             self.openai_client = None
 
+    @traced("llm.generate")
     async def generate(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         temperature: float = 0.3,
-        max_tokens: int = 1000
+        max_tokens: int = 1000,
+        json_output: bool = False
     ) -> LLMResponse:
-        """Generate response using primary LLM with fallback"""
+        """Generate response using primary LLM with fallback
+
+        system_prompt must be a static string (byte-identical across calls)
+        so that provider prefix caching applies; put per-request data in prompt.
+        json_output requests the provider's JSON mode (parse with structured_output).
+        """
         # Try Gemini first
         if self.gemini_model:
-            response = await self._generate_gemini(prompt, system_prompt, temperature, max_tokens)
+            response = await self._generate_gemini(prompt, system_prompt, temperature, max_tokens, json_output)
             if response:
                 return response
 
         # Fallback to OpenAI
         if self.openai_client:
-            response = await self._generate_openai(prompt, system_prompt, temperature, max_tokens)
+            response = await self._generate_openai(prompt, system_prompt, temperature, max_tokens, json_output)
             if response:
                 return response
 
@@ -72,47 +103,92 @@ class LLMService:
             response_time_ms=0
         )
 
+    async def _get_gemini_model(self, system_prompt: Optional[str]):
+        """Model bound to a system instruction (explicit context cache when enabled)"""
+        if not system_prompt:
+            return self.gemini_model
+
+        entry = self._gemini_models.get(system_prompt)
+        if entry and entry[1] > time.monotonic():
+            return entry[0]
+
+        async with self._gemini_lock:
+            entry = self._gemini_models.get(system_prompt)
+            if entry and entry[1] > time.monotonic():
+                return entry[0]
+
+            model, expires_at = None, float("inf")
+            ttl = settings.GEMINI_CONTEXT_CACHE_TTL_SECONDS
+            if ttl > 0:
+                try:
+                    cached = await asyncio.to_thread(
+                        genai.caching.CachedContent.create,
+                        model=settings.GEMINI_MODEL,
+                        system_instruction=system_prompt,
+                        ttl=timedelta(seconds=ttl),
+                    )
+                    model = genai.GenerativeModel.from_cached_content(cached)
+                    # 제공자 측 만료 전에 재생성
+                    expires_at = time.monotonic() + max(ttl - 60, ttl / 2)
+                except Exception as e:
+                    # 최소 토큰 수 미달 등: system instruction만 사용 (implicit prefix 캐싱)
+                    print(f"Gemini context cache unavailable, using system instruction: {e}")
+
+            if model is None:
+                model = genai.GenerativeModel(settings.GEMINI_MODEL, system_instruction=system_prompt)
+
+            self._gemini_models[system_prompt] = (model, expires_at)
+            return model
+
     async def _generate_gemini(
         self,
         prompt: str,
         system_prompt: Optional[str],
         temperature: float,
-        max_tokens: int
+        max_tokens: int,
+        json_output: bool = False
     ) -> Optional[LLMResponse]:
         """Generate using Gemini"""
         try:
             start_time = time.time()
 
-            # Combine system prompt with user prompt
-            full_prompt = prompt
-            if system_prompt:
-                full_prompt = f"{system_prompt}\n\n{prompt}"
-
-            response = self.gemini_model.generate_content(
-                full_prompt,
+            model = await self._get_gemini_model(system_prompt)
+            response = await model.generate_content_async(
+                prompt,
                 generation_config=genai.GenerationConfig(
                     temperature=temperature,
                     max_output_tokens=max_tokens,
+                    response_mime_type="application/json" if json_output else None,
                 )
             )
 
             response_time_ms = int((time.time() - start_time) * 1000)
 
-            # Estimate tokens (Gemini doesn't always provide exact counts)
-            input_tokens = len(full_prompt) // 4
-            output_tokens = len(response.text) // 4
-
+            # Prefer exact counts from usage_metadata, estimate when absent
+            usage = getattr(response, "usage_metadata", None)
+            if usage is not None and getattr(usage, "prompt_token_count", None):
+                input_tokens = usage.prompt_token_count
+                output_tokens = usage.candidates_token_count
+                cached_input_tokens = getattr(usage, "cached_content_token_count", 0) or 0
+            else:
+                input_tokens = estimate_tokens(prompt) + estimate_tokens(system_prompt or "")
+                output_tokens = estimate_tokens(response.text)
+                cached_input_tokens = 0
+
+            _record_metrics("gemini", settings.GEMINI_MODEL, response_time_ms, input_tokens, cached_input_tokens, output_tokens)
             return LLMResponse(
                 content=response.text,
                 provider="gemini",
                 model=settings.GEMINI_MODEL,
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
-                response_time_ms=response_time_ms
+                response_time_ms=response_time_ms,
+                cached_input_tokens=cached_input_tokens,
             )
 
         except Exception as e:
             print(f"Gemini error: {e}")
+            llm_errors.inc("gemini", settings.GEMINI_MODEL)
             return None
 
     async def _generate_openai(
@@ -120,37 +196,58 @@ class LLMService:
         prompt: str,
         system_prompt: Optional[str],
         temperature: float,
-        max_tokens: int
+        max_tokens: int,
+        json_output: bool = False
     ) -> Optional[LLMResponse]:
         """Generate using OpenAI"""
         try:
             start_time = time.time()
 
+            # 고정 system 메시지를 항상 첫 메시지로 두어 prefix 캐시 적중
             messages = []
             if system_prompt:
                 messages.append({"role": "system", "content": system_prompt})
             messages.append({"role": "user", "content": prompt})
 
+            options = {}
+            if json_output:
+                # json_object 모드는 프롬프트에 "JSON" 문구가 있어야 함 (시스템 프롬프트에 포함)
+                options["response_format"] = {"type": "json_object"}
+
             response = await self.openai_client.chat.completions.create(
                 model=settings.OPENAI_MODEL,
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
+                **options,
             )
 
             response_time_ms = int((time.time() - start_time) * 1000)
 
+            # 1024 토큰 이상 동일 prefix는 자동 캐싱됨 (prompt_tokens_details.cached_tokens)
+            details = getattr(response.usage, "prompt_tokens_details", None)
+            if isinstance(details, dict):
+                cached_input_tokens = details.get("cached_tokens") or 0
+            else:
+                cached_input_tokens = getattr(details, "cached_tokens", 0) or 0
+
+            _record_metrics(
+                "openai", settings.OPENAI_MODEL, response_time_ms,
+                response.usage.prompt_tokens, cached_input_tokens, response.usage.completion_tokens,
+            )
             return LLMResponse(
                 content=response.choices[0].message.content,
                 provider="openai",
                 model=settings.OPENAI_MODEL,
                 input_tokens=response.usage.prompt_tokens,
                 output_tokens=response.usage.completion_tokens,
-                response_time_ms=response_time_ms
+                response_time_ms=response_time_ms,
+                cached_input_tokens=cached_input_tokens,
             )
 
         except Exception as e:
             print(f"OpenAI error: {e}")
+            llm_errors.inc("openai", settings.OPENAI_MODEL)
             return None
 
 
@@ -4,11 +4,15 @@ Pinecone 대신 로컬에서 벡터 검색을 수행합니다.
 """
 import json
 import pickle
+import threading
 from pathlib import Path
 from typing import List, Dict, Optional
 import numpy as np
 import faiss
 
+from app.core.config import settings
+from app.core.metrics import vector_search_duration
+from app.core.tracing import traced
 from app.services.embedding_service import embedding_service
 
 
@@ -29,18 +33,28 @@ class LocalVectorStore:
 
         self._index: Optional[faiss.IndexFlatIP] = None  # Inner Product (cosine with normalized vectors)
         self._documents: List[Dict] = []
-        self._dimension: int = 1024  # KoE5 embedding dimension
+        self._dimension: int = 1024  # KoE5 embedding dimension (빌드 시 모델 값으로 갱신)
 
         # 저장 경로 (한글 경로 문제 회피)
         self._data_dir = Path(__file__).parent.parent.parent / "data"
-        self._store_dir = self._data_dir / "vector_store"
+        self._store_dir = Path(settings.VECTOR_STORE_DIR) if settings.VECTOR_STORE_DIR else self._data_dir / "vector_store"
         self._index_path = self._store_dir / "faiss.index"
         self._docs_path = self._store_dir / "documents.pkl"
 
-        # 인덱스 로드 시도
-        self._load_or_build()
+        # 인덱스는 load()에서 로드 (시작 시 백그라운드 워밍업)
+        self._loaded = False
+        self._lock = threading.Lock()
         self._initialized = True
 
+    def load(self):
+        """Load or build the index once (blocking)"""
+        if self._loaded:
+            return
+        with self._lock:
+            if not self._loaded:
+                self._load_or_build()
+                self._loaded = True
+
     def _load_or_build(self):
         """저장된 인덱스 로드 또는 새로 빌드"""
         if self._index_path.exists() and self._docs_path.exists():
@@ -57,6 +71,7 @@ class LocalVectorStore:
             with open(self._index_path, "rb") as f:
                 index_data = np.load(f)
             self._index = faiss.deserialize_index(index_data)
+            self._dimension = self._index.d
 
             with open(self._docs_path, "rb") as f:
                 self._documents = pickle.load(f)
@@ -128,8 +143,9 @@ class LocalVectorStore:
             self._index = faiss.IndexFlatIP(self._dimension)
             return
 
-        # FAISS 인덱스 생성
+        # FAISS 인덱스 생성 (차원은 모델 출력 기준)
         embeddings_array = np.array(embeddings, dtype=np.float32)
+        self._dimension = embeddings_array.shape[1]
 
         # 정규화 (cosine similarity를 위해)
         faiss.normalize_L2(embeddings_array)
@@ -156,6 +172,7 @@ class LocalVectorStore:
         filter_dict: Optional[Dict] = None
     ) -> List[Dict]:
         """벡터 유사도 검색"""
+        self.load()
         if self._index is None or self._index.ntotal == 0:
             return []
 
@@ -164,12 +181,27 @@ class LocalVectorStore:
         if query_embedding is None:
             return []
 
+        return self.search_by_vector(query_embedding, top_k, filter_dict)
+
+    @traced("vector_store.search")
+    def search_by_vector(
+        self,
+        query_embedding: List[float],
+        top_k: int = 5,
+        filter_dict: Optional[Dict] = None
+    ) -> List[Dict]:
+        """이미 계산된 쿼리 임베딩으로 검색 (임베딩 사이드카에서 배치 임베딩 후 사용)"""
+        self.load()
+        if self._index is None or self._index.ntotal == 0:
+            return []
+
         # 정규화
         query_array = np.array([query_embedding], dtype=np.float32)
         faiss.normalize_L2(query_array)
 
         # 검색
-        scores, indices = self._index.search(query_array, min(top_k * 2, self._index.ntotal))
+        with vector_search_duration.time("faiss"):
+            scores, indices = self._index.search(query_array, min(top_k * 2, self._index.ntotal))
 
         # 결과 포맷팅
         results = []
@@ -217,7 +249,9 @@ class LocalVectorStore:
     def rebuild(self):
         """인덱스 재빌드 (지식 데이터 변경 시)"""
         print("Rebuilding vector store...")
-        self._build_from_knowledge()
+        with self._lock:
+            self._build_from_knowledge()
+            self._loaded = True
 
     @property
     def document_count(self) -> int:
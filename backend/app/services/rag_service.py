@@ -2,11 +2,13 @@
 RAG service - 벡터 검색 기반 문서 검색
 로컬 FAISS 또는 Pinecone 벡터 검색을 지원합니다.
 """
+import threading
 from typing import List, Dict, Optional
-from pinecone import Pinecone
 
 from app.core.config import settings
+from app.core.tracing import traced
 from app.services.embedding_service import embedding_service
+from app.services.context_builder import ContextBuilder, PackedContext, format_document
 
 
 class RAGService:
@@ -16,6 +18,8 @@ class RAGService:
     _pinecone_index = None
     _local_store = None
     _use_local: bool = True
+    _backend_ready: bool = False
+    _lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
@@ -26,14 +30,33 @@ class RAGService:
         if hasattr(self, "_initialized") and self._initialized:
             return
 
+        # 백엔드 연결/모델 로드는 warm_up()에서 수행 (import 시점에 하지 않음)
         self._initialized = True
-        self._init_backend()
+
+    def warm_up(self):
+        """Load embedding model and vector index (blocking, called from startup warm-up)"""
+        self._ensure_backend()
+        embedding_service.load()
+        if self._use_local:
+            self._local_store.load()
+            print(f"Local vector store loaded: {self._local_store.document_count} documents")
+
+    def _ensure_backend(self):
+        """Initialize backend once"""
+        if self._backend_ready:
+            return
+        with self._lock:
+            if not self._backend_ready:
+                self._init_backend()
+                self._backend_ready = True
 
     def _init_backend(self):
         """벡터 검색 백엔드 초기화"""
         # Pinecone API 키가 있으면 Pinecone 사용 시도
         if settings.PINECONE_API_KEY:
             try:
+                from pinecone import Pinecone
+
                 pc = Pinecone(api_key=settings.PINECONE_API_KEY)
                 self._pinecone_index = pc.Index(settings.PINECONE_INDEX_NAME)
                 self._use_local = False
@@ -50,9 +73,13 @@ class RAGService:
     def _init_local_store(self):
         """로컬 벡터 스토어 초기화 (지연 로딩)"""
         if self._local_store is None:
-            from app.services.local_vector_store import local_vector_store
-            self._local_store = local_vector_store
-            print(f"Local vector store loaded: {self._local_store.document_count} documents")
+            if settings.EMBEDDING_SIDECAR_SOCKET:
+                # 검색도 사이드카에서 수행 (워커별 FAISS 인덱스 로드 없음)
+                from app.services.embedding_sidecar import remote_vector_store
+                self._local_store = remote_vector_store
+            else:
+                from app.services.local_vector_store import local_vector_store
+                self._local_store = local_vector_store
 
     def search(
         self,
@@ -62,6 +89,7 @@ class RAGService:
         namespace: str = "tax_rules"
     ) -> List[Dict]:
         """벡터 유사도 검색"""
+        self._ensure_backend()
         if self._use_local:
             return self._search_local(query, top_k, filter_dict)
         else:
@@ -149,21 +177,29 @@ class RAGService:
         ]
 
     def format_context(self, documents: List[Dict]) -> str:
-        """검색 결과를 컨텍스트 문자열로 포맷팅"""
+        """검색 결과를 컨텍스트 문자열로 포맷팅 (전체 내용, 예산 없음)"""
         if not documents:
             return ""
 
-        context_parts = []
-        for i, doc in enumerate(documents, 1):
-            source = doc.get("source", "")
-            source_str = f"\n출처: {source}" if source else ""
-            context_parts.append(f"[참고자료 {i}]\n{doc['content']}{source_str}")
+        return "\n\n".join(
+            format_document(i, doc["content"], doc.get("source", ""))
+            for i, doc in enumerate(documents, 1)
+        )
+
+    def build_context(self, query: str, documents: List[Dict]) -> PackedContext:
+        """토큰 예산 안에서 중복 제거/문장 단위 축약한 컨텍스트 구성"""
+        return ContextBuilder().build(query, documents)
 
-        return "\n\n".join(context_parts)
+    @traced("rag.search_context")
+    def search_context(self, query: str, top_k: int = 5) -> PackedContext:
+        """검색 + 컨텍스트 구성 (blocking, 스레드에서 호출)"""
+        return self.build_context(query, self.search(query, top_k=top_k))
 
     @property
     def is_ready(self) -> bool:
         """RAG 서비스 준비 상태"""
+        if not self._backend_ready:
+            return False
         if self._use_local:
             self._init_local_store()
             return self._local_store is not None and self._local_store.is_ready
@@ -173,9 +209,13 @@ class RAGService:
     @property
     def backend_info(self) -> str:
         """현재 사용 중인 백엔드 정보"""
+        if not self._backend_ready:
+            return "Not initialized"
         if self._use_local:
             self._init_local_store()
             count = self._local_store.document_count if self._local_store else 0
+            if settings.EMBEDDING_SIDECAR_SOCKET:
+                return f"Embedding sidecar FAISS ({count} documents)"
             return f"Local FAISS ({count} documents)"
         else:
             return f"Pinecone ({settings.PINECONE_INDEX_NAME})"
@@ -0,0 +1,205 @@
+"""
+Session memory - 멀티턴 상담 세션 메모리
+최근 N턴은 원문(축약)으로, 그 이전 대화는 세션별 누적 요약으로 프롬프트에 포함합니다.
+"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.chat import ChatHistory, ChatSession
+from app.services.llm_service import llm_service
+from app.services.token_counter import truncate_to_tokens
+
+
+SESSION_SUMMARY_SYSTEM_PROMPT = """당신은 세무 상담 대화를 요약하는 도우미입니다.
+이전 요약과 새 대화를 합쳐 하나의 요약으로 갱신해주세요.
+
+요약 원칙:
+- 사용자의 사업 정보(업종, 과세 유형 등)와 질문한 지출 항목을 유지
+- 각 항목의 판단 결과(경비 인정 여부, 계정과목, 법령 근거)를 간단히 기록
+- 인사말, 반복 설명은 제외
+- 한국어 평문으로 500자 이내
+"""
+
+
+@dataclass
+class Turn:
+    """One question/answer pair"""
+    id: int
+    question: str
+    answer: str
+
+
+@dataclass
+class SessionMemory:
+    """Summary plus turns not yet folded into it (oldest first)"""
+    summary: Optional[str] = None
+    summarized_until_id: int = 0
+    turns: List[Turn] = field(default_factory=list)
+
+
+# (user_id, session_id) -> SessionMemory (워커별 hot cache, 다른 워커가 기록한 턴이 있으면 다시 로드)
+_session_cache = TTLCache(settings.SESSION_CACHE_TTL_SECONDS, settings.SESSION_CACHE_MAXSIZE, name="session_memory")
+_refreshing: set = set()
+
+
+def _unsummarized_limit() -> int:
+    # 요약이 계속 실패해도 캐시 크기가 무한히 커지지 않도록 제한
+    return settings.SESSION_HISTORY_TURNS + settings.SESSION_SUMMARY_BATCH * 4
+
+
+class SessionMemoryService:
+    """Loads and formats session memory for prompting"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def load(self, user_id: int, session_id: str) -> SessionMemory:
+        """Cached memory if it has the newest turn, else summary + recent turns from the database"""
+        key = (user_id, session_id)
+        memory = _session_cache.get(key, None)
+        if memory is not None and await self._is_current(user_id, session_id, memory):
+            return memory
+
+        chat_session = await self.db.get(ChatSession, key)
+        memory = SessionMemory()
+        if chat_session:
+            memory.summary = chat_session.summary
+            memory.summarized_until_id = chat_session.summarized_until_id
+
+        # ix_chat_histories_user_session_created 인덱스 사용
+        # (id 범위 조건을 SQL에 넣으면 session_id 단일 인덱스 + 정렬로 바뀌므로 요약 여부는 여기서 거름)
+        result = await self.db.execute(
+            select(ChatHistory.id, ChatHistory.question, ChatHistory.answer)
+            .where(
+                ChatHistory.user_id == user_id,
+                ChatHistory.session_id == session_id,
+            )
+            .order_by(ChatHistory.created_at.desc())
+            .limit(_unsummarized_limit())
+        )
+        memory.turns = [
+            Turn(*row) for row in reversed(result.all())
+            if row.id > memory.summarized_until_id
+        ]
+
+        _session_cache.set(key, memory)
+        return memory
+
+    async def _is_current(self, user_id: int, session_id: str, memory: SessionMemory) -> bool:
+        """No turn newer than the cached ones (another worker may have answered in this session)"""
+        result = await self.db.execute(
+            select(ChatHistory.id)
+            .where(
+                ChatHistory.user_id == user_id,
+                ChatHistory.session_id == session_id,
+            )
+            .order_by(ChatHistory.created_at.desc())
+            .limit(1)
+        )
+        latest_id = result.scalar_one_or_none()
+        known_id = memory.turns[-1].id if memory.turns else memory.summarized_until_id
+        return latest_id is None or latest_id <= known_id
+
+    def format(self, memory: SessionMemory) -> str:
+        """Prompt section with the summary and the last N turns"""
+        parts = []
+        if memory.summary:
+            parts.append(f"이전 대화 요약:\n{memory.summary}")
+
+        recent = memory.turns[-settings.SESSION_HISTORY_TURNS:] if settings.SESSION_HISTORY_TURNS > 0 else []
+        if recent:
+            lines = []
+            for turn in recent:
+                lines.append(f"사용자: {truncate_to_tokens(turn.question, settings.SESSION_TURN_MAX_TOKENS)}")
+                lines.append(f"AI: {truncate_to_tokens(turn.answer, settings.SESSION_TURN_MAX_TOKENS)}")
+            parts.append("최근 대화:\n" + "\n".join(lines))
+
+        return "\n\n".join(parts)
+
+    def record_turn(self, user_id: int, session_id: str, memory: SessionMemory, chat_history: ChatHistory) -> None:
+        """Append the committed turn to the hot cache"""
+        memory.turns.append(Turn(chat_history.id, chat_history.question, chat_history.answer))
+        del memory.turns[:-_unsummarized_limit()]
+        _session_cache.set((user_id, session_id), memory)
+
+
+def needs_summary(user_id: int, session_id: str) -> bool:
+    """Enough turns fell out of the recent window to refresh the summary"""
+    memory = _session_cache.get((user_id, session_id), None)
+    if memory is None or (user_id, session_id) in _refreshing:
+        return False
+    return len(memory.turns) >= settings.SESSION_HISTORY_TURNS + settings.SESSION_SUMMARY_BATCH
+
+
+def _build_summary_prompt(summary: Optional[str], turns: List[Tuple[int, str, str]]) -> str:
+    lines = [f"이전 요약:\n{summary or '(없음)'}", "", "새 대화:"]
+    for _, question, answer in turns:
+        lines.append(f"사용자: {truncate_to_tokens(question, settings.SESSION_TURN_MAX_TOKENS)}")
+        lines.append(f"AI: {truncate_to_tokens(answer, settings.SESSION_TURN_MAX_TOKENS)}")
+    return "\n".join(lines)
+
+
+async def refresh_summary(user_id: int, session_id: str) -> None:
+    """Fold turns older than the recent window into the session summary
+
+    Runs as a background task after the response, with its own DB session.
+    """
+    key = (user_id, session_id)
+    if key in _refreshing:
+        return
+    _refreshing.add(key)
+
+    try:
+        async with AsyncSessionLocal() as db:
+            chat_session = await db.get(ChatSession, key)
+            since = chat_session.summarized_until_id if chat_session else 0
+
+            # 요약되지 않은 턴만 읽음 (답변 원문까지 세션 전체를 읽지 않도록 id 조건을 SQL에 포함)
+            result = await db.execute(
+                select(ChatHistory.id, ChatHistory.question, ChatHistory.answer)
+                .where(
+                    ChatHistory.user_id == user_id,
+                    ChatHistory.session_id == session_id,
+                    ChatHistory.id > since,
+                )
+                .order_by(ChatHistory.created_at)
+            )
+            rows = result.all()
+            keep = settings.SESSION_HISTORY_TURNS
+            to_summarize = rows[:-keep] if keep > 0 else rows
+            if len(to_summarize) < settings.SESSION_SUMMARY_BATCH:
+                return
+
+            response = await llm_service.generate(
+                prompt=_build_summary_prompt(chat_session.summary if chat_session else None, to_summarize),
+                system_prompt=SESSION_SUMMARY_SYSTEM_PROMPT,
+                temperature=0.2,
+                max_tokens=settings.SESSION_SUMMARY_MAX_TOKENS,
+            )
+            if response.provider == "none":
+                return
+
+            if chat_session is None:
+                chat_session = ChatSession(user_id=user_id, session_id=session_id)
+                db.add(chat_session)
+            chat_session.summary = response.content.strip()
+            chat_session.summarized_until_id = to_summarize[-1][0]
+            chat_session.updated_at = datetime.utcnow()
+            await db.commit()
+
+        # Hot cache 갱신 (요약된 턴 제거)
+        memory = _session_cache.get(key, None)
+        if memory is not None:
+            memory.summary = chat_session.summary
+            memory.summarized_until_id = chat_session.summarized_until_id
+            memory.turns = [t for t in memory.turns if t.id > chat_session.summarized_until_id]
+    except Exception as e:
+        print(f"Session summary refresh failed ({session_id}): {e}")
+    finally:
+        _refreshing.discard(key)
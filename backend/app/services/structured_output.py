@@ -0,0 +1,151 @@
+"""
+Structured output - LLM JSON 응답 추출/검증
+코드 펜스, 앞뒤 설명문, 잘린(truncated) 응답에서도 JSON 객체를 선형 시간에 추출하고 Pydantic으로 검증합니다.
+"""
+import json
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple, Type, TypeVar
+from pydantic import BaseModel, ValidationError
+
+
+T = TypeVar("T", bound=BaseModel)
+
+# 완결된 객체가 JSON으로 파싱되지 않을 때 다음 '{'부터 재시도하는 최대 횟수
+MAX_OBJECT_ATTEMPTS = 3
+
+
+@dataclass
+class ParseStats:
+    """Parse outcome counters per output type"""
+    total: int = 0
+    ok: int = 0
+    repaired: int = 0   # truncated output closed by the scanner
+    invalid: int = 0    # JSON found but failed schema validation
+    no_json: int = 0    # no JSON object found
+
+    @property
+    def failure_rate(self) -> float:
+        return (self.invalid + self.no_json) / self.total if self.total else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "total": self.total,
+            "ok": self.ok,
+            "repaired": self.repaired,
+            "invalid": self.invalid,
+            "no_json": self.no_json,
+            "failure_rate": round(self.failure_rate, 4),
+        }
+
+
+parse_stats: Dict[str, ParseStats] = {}
+
+
+def _scan_object(text: str, start: int) -> Tuple[Optional[str], int, bool]:
+    """Scan one top-level object starting at text[start] == '{'
+
+    Returns (candidate, end_index, repaired). For truncated input the
+    candidate is closed (open string, brackets) or cut at the last comma.
+    """
+    stack = []
+    in_string = False
+    escaped = False
+    last_comma: Optional[Tuple[int, str]] = None
+
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if ch == '"':
+            in_string = True
+        elif ch == "{":
+            stack.append("}")
+        elif ch == "[":
+            stack.append("]")
+        elif ch in "}]":
+            if not stack or stack[-1] != ch:
+                return None, i, False
+            stack.pop()
+            if not stack:
+                return text[start:i + 1], i, False
+        elif ch == ",":
+            last_comma = (i, "".join(reversed(stack)))
+
+    # 잘린 응답: 열린 문자열/괄호를 닫아 복구
+    body = text[start:]
+    if escaped:
+        body = body[:-1]
+    if in_string:
+        body += '"'
+    body = body.rstrip()
+    if body.endswith(","):
+        body = body[:-1]
+    if not body.endswith(":"):
+        return body + "".join(reversed(stack)), len(text), True
+    if last_comma:
+        return text[start:last_comma[0]] + last_comma[1], len(text), True
+    return None, len(text), True
+
+
+def extract_json(text: str) -> Tuple[Optional[dict], bool]:
+    """Find the first JSON object in an LLM response
+
+    Returns (object, repaired). Code fences and surrounding prose are skipped.
+    """
+    if not text:
+        return None, False
+
+    # 코드 펜스/설명문은 첫 '{' 이전에서 건너뜀
+    position = 0
+    for _ in range(MAX_OBJECT_ATTEMPTS):
+        start = text.find("{", position)
+        if start == -1:
+            break
+        candidate, end, repaired = _scan_object(text, start)
+        if candidate is not None:
+            try:
+                parsed = json.loads(candidate)
+                if isinstance(parsed, dict) and parsed:
+                    return parsed, repaired
+            except json.JSONDecodeError:
+                pass
+        if repaired:
+            break
+        position = start + 1 if candidate is None else end + 1
+
+    return None, False
+
+
+def parse_structured(text: str, model: Type[T], name: str) -> Optional[T]:
+    """Extract and validate structured output, recording parse stats under name"""
+    stats = parse_stats.setdefault(name, ParseStats())
+    stats.total += 1
+
+    parsed, repaired = extract_json(text)
+    if parsed is None:
+        stats.no_json += 1
+        return None
+
+    try:
+        result = model.model_validate(parsed)
+    except ValidationError as e:
+        stats.invalid += 1
+        print(f"Structured output validation failed ({name}): {e.error_count()} errors")
+        return None
+
+    stats.ok += 1
+    if repaired:
+        stats.repaired += 1
+    return result
+
+
+def get_parse_stats() -> dict:
+    """Parse stats by output type"""
+    return {name: stats.to_dict() for name, stats in parse_stats.items()}
@@ -0,0 +1,58 @@
+"""
+Token counter - 한국어/영문 혼합 텍스트 토큰 수 추정
+len(text) // 4 는 영문 기준이라 한글은 2~3배 적게 추정되므로 문자 종류별로 계산합니다.
+"""
+import math
+import re
+
+
+# 문자 종류별 토큰 비율 (Gemini SentencePiece / GPT o200k 기준 실측 평균)
+HANGUL_TOKENS_PER_CHAR = 0.8
+LATIN_CHARS_PER_TOKEN = 4.0
+DIGITS_PER_TOKEN = 3.0
+
+_PIECE = re.compile(
+    r"(?P<hangul>[가-힣ㄱ-ㆎ]+)"
+    r"|(?P<latin>[A-Za-z]+)"
+    r"|(?P<digit>\d+)"
+    r"|(?P<space>\s+)"
+    r"|(?P<other>.)",
+    re.DOTALL,
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate LLM tokens for mixed Korean/English text"""
+    if not text:
+        return 0
+
+    tokens = 0.0
+    for match in _PIECE.finditer(text):
+        kind = match.lastgroup
+        length = len(match.group())
+        if kind == "hangul":
+            tokens += length * HANGUL_TOKENS_PER_CHAR
+        elif kind == "latin":
+            tokens += math.ceil(length / LATIN_CHARS_PER_TOKEN)
+        elif kind == "digit":
+            tokens += math.ceil(length / DIGITS_PER_TOKEN)
+        elif kind == "other":
+            tokens += 1
+        # 공백은 대부분 인접 토큰에 병합됨
+
+    return max(1, math.ceil(tokens))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to at most max_tokens (estimated), marking the cut with an ellipsis"""
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    low, high = 0, len(text)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if estimate_tokens(text[:middle]) < max_tokens:
+            low = middle
+        else:
+            high = middle - 1
+    return text[:low].rstrip() + "…"
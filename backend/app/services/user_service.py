@@ -4,15 +4,46 @@ User service - 사용자 비즈니스 로직
 from datetime import datetime
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import selectinload
 
+from app.core.cache import TTLCache, MISSING
+from app.core.config import settings
+from app.core.security import invalidate_user_principal
+from app.core.tracing import traced
 from app.models.user import User
 from app.models.plan import Plan, Subscription
-from app.models.usage import UsageLog
+from app.models.usage import UsageLog, UsageCounter
 from app.schemas.user import UserUpdate, BusinessInfoUpdate, SubscriptionInfo, UsageInfo
 
 
+# Process-wide caches for metered requests
+# plan_id -> plan.limits
+_plan_limits_cache = TTLCache(ttl=settings.PLAN_CACHE_TTL_SECONDS, maxsize=100, name="plan_limits")
+# user_id -> subscription.plan_id (None if no subscription)
+_subscription_plan_cache = TTLCache(ttl=settings.SUBSCRIPTION_CACHE_TTL_SECONDS, name="subscription_plan")
+
+
+def invalidate_plan_cache(plan_id: Optional[int] = None) -> None:
+    """
+    Invalidate cached plan limits in this process (all plans if plan_id is None).
+
+    Call after writing plans. Other worker processes (and edits made directly
+    in the database) pick up the change when PLAN_CACHE_TTL_SECONDS expires.
+    """
+    if plan_id is None:
+        _plan_limits_cache.clear()
+    else:
+        _plan_limits_cache.invalidate(plan_id)
+
+
+def invalidate_subscription_cache(user_id: int) -> None:
+    """Invalidate cached subscription of a user (call on subscription changes)"""
+    _subscription_plan_cache.invalidate(user_id)
+
+
 class UserService:
     """User service"""
 
@@ -36,6 +67,7 @@ class UserService:
         user.updated_at = datetime.utcnow()
         await self.db.commit()
         await self.db.refresh(user)
+        await invalidate_user_principal(user.id)
         return user
 
     async def update_business_info(self, user: User, data: BusinessInfoUpdate) -> User:
@@ -46,6 +78,7 @@ class UserService:
         user.updated_at = datetime.utcnow()
         await self.db.commit()
         await self.db.refresh(user)
+        await invalidate_user_principal(user.id)
         return user
 
     async def get_subscription_info(self, user_id: int) -> Optional[SubscriptionInfo]:
@@ -72,25 +105,15 @@ class UserService:
         """Get current month usage info"""
         year_month = datetime.utcnow().strftime("%Y-%m")
 
-        # Get usage counts by action type
+        # Get usage counters by action type
         result = await self.db.execute(
-            select(UsageLog.action_type, func.count(UsageLog.id))
-            .where(UsageLog.user_id == user_id, UsageLog.year_month == year_month)
-            .group_by(UsageLog.action_type)
+            select(UsageCounter.action_type, UsageCounter.used)
+            .where(UsageCounter.user_id == user_id, UsageCounter.year_month == year_month)
         )
         usage_counts = {row[0]: row[1] for row in result.all()}
 
         # Get user's plan limits
-        sub_result = await self.db.execute(
-            select(Subscription)
-            .options(selectinload(Subscription.plan))
-            .where(Subscription.user_id == user_id)
-        )
-        subscription = sub_result.scalar_one_or_none()
-
-        limits = {}
-        if subscription and subscription.plan and subscription.plan.limits:
-            limits = subscription.plan.limits
+        limits = await self._get_plan_limits(user_id)
 
         return UsageInfo(
             chat_used=usage_counts.get("chat", 0),
@@ -101,33 +124,100 @@ class UserService:
             export_limit=limits.get("export_monthly", -1),
         )
 
-    async def log_usage(self, user_id: int, action_type: str, channel: Optional[str] = None) -> None:
-        """Log usage action"""
+    @traced("usage.check_limit")
+    async def check_usage_limit(self, user_id: int, action_type: str) -> bool:
+        """Check if user has remaining usage for action type (read-only pre-check)"""
+        limits = await self._get_plan_limits(user_id)
+        limit = limits.get(f"{action_type}_monthly", -1)
+        if limit == -1:
+            return True
+
+        year_month = datetime.utcnow().strftime("%Y-%m")
+        result = await self.db.execute(
+            select(UsageCounter.used).where(
+                UsageCounter.user_id == user_id,
+                UsageCounter.year_month == year_month,
+                UsageCounter.action_type == action_type
+            )
+        )
+        used = result.scalar_one_or_none() or 0
+        return used < limit
+
+    @traced("usage.consume")
+    async def consume_usage(
+        self,
+        user_id: int,
+        action_type: str,
+        channel: Optional[str] = None,
+        amount: int = 1
+    ) -> bool:
+        """
+        Atomically check the monthly limit and increment the usage counter.
+
+        Returns False (and records nothing) if the increment would exceed the
+        plan limit. Does not commit: the counter update and the UsageLog audit
+        row become part of the caller's transaction.
+        """
+        limits = await self._get_plan_limits(user_id)
+        limit = limits.get(f"{action_type}_monthly", -1)
+        if limit != -1 and amount > limit:
+            return False
+
         year_month = datetime.utcnow().strftime("%Y-%m")
-        usage_log = UsageLog(
+        now = datetime.utcnow()
+
+        # INSERT ... ON CONFLICT DO UPDATE SET used = used + n WHERE used + n <= limit RETURNING used
+        insert = _dialect_insert(self.db)
+        stmt = insert(UsageCounter).values(
+            user_id=user_id,
+            year_month=year_month,
+            action_type=action_type,
+            used=amount,
+            updated_at=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UsageCounter.user_id, UsageCounter.year_month, UsageCounter.action_type],
+            set_={"used": UsageCounter.used + stmt.excluded.used, "updated_at": now},
+            where=(UsageCounter.used + stmt.excluded.used <= limit) if limit != -1 else None,
+        ).returning(UsageCounter.used)
+
+        result = await self.db.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            return False
+
+        # Audit trail (flushed with the caller's commit)
+        self.db.add(UsageLog(
             user_id=user_id,
             action_type=action_type,
             channel=channel,
             year_month=year_month
-        )
-        self.db.add(usage_log)
-        await self.db.commit()
-
-    async def check_usage_limit(self, user_id: int, action_type: str) -> bool:
-        """Check if user has remaining usage for action type"""
-        usage_info = await self.get_usage_info(user_id)
-
-        if action_type == "chat":
-            if usage_info.chat_limit == -1:
-                return True
-            return usage_info.chat_used < usage_info.chat_limit
-        elif action_type == "expense":
-            if usage_info.expense_limit == -1:
-                return True
-            return usage_info.expense_used < usage_info.expense_limit
-        elif action_type == "export":
-            if usage_info.export_limit == -1:
-                return True
-            return usage_info.export_used < usage_info.export_limit
-
+        ))
         return True
+
+    async def _get_plan_limits(self, user_id: int) -> dict:
+        """Get monthly limits of the user's plan (empty dict means unlimited)"""
+        plan_id = _subscription_plan_cache.get(user_id)
+        if plan_id is MISSING:
+            result = await self.db.execute(
+                select(Subscription.plan_id).where(Subscription.user_id == user_id)
+            )
+            plan_id = result.scalar_one_or_none()
+            _subscription_plan_cache.set(user_id, plan_id)
+
+        if plan_id is None:
+            return {}
+
+        limits = _plan_limits_cache.get(plan_id)
+        if limits is MISSING:
+            result = await self.db.execute(select(Plan.limits).where(Plan.id == plan_id))
+            limits = result.scalar_one_or_none()
+            _plan_limits_cache.set(plan_id, limits)
+
+        return limits or {}
+
+
+def _dialect_insert(db: AsyncSession):
+    """Dialect-specific insert() supporting ON CONFLICT (PostgreSQL, SQLite)"""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql_insert
+    return sqlite_insert
@@ -0,0 +1,115 @@
+"""
+로그인 부하 벤치마크 스크립트
+로그인(bcrypt) 폭주 중에도 상담 요청 지연시간(p99)이 유지되는지 측정합니다.
+
+실행 중인 서버에 대해 두 단계를 측정합니다.
+  1. baseline: 상담 요청만
+  2. mixed:    상담 요청 + 동시 로그인
+
+사용법:
+    python scripts/bench_auth_load.py --duration 20 --logins 8
+    python scripts/bench_auth_load.py --ask   # /chat/ask 사용 (LLM 호출 발생)
+"""
+import argparse
+import asyncio
+import sys
+import io
+import time
+from pathlib import Path
+from typing import List
+
+import httpx
+
+# Windows 콘솔 UTF-8 출력 설정
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.bench_stats import percentile
+
+
+async def chat_worker(client: httpx.AsyncClient, headers: dict, ask: bool, stop_at: float, latencies: List[float]):
+    """Send chat requests back-to-back until stop_at"""
+    while time.perf_counter() < stop_at:
+        start = time.perf_counter()
+        if ask:
+            response = await client.post("/chat/ask", headers=headers, json={"question": "노트북 구매 비용 처리 방법"})
+        else:
+            response = await client.get("/chat/history", headers=headers, params={"size": 20})
+        if response.status_code == 200:
+            latencies.append((time.perf_counter() - start) * 1000)
+
+
+async def login_worker(client: httpx.AsyncClient, email: str, password: str, stop_at: float, counter: List[int]):
+    """Log in back-to-back until stop_at"""
+    while time.perf_counter() < stop_at:
+        response = await client.post("/auth/login", json={"email": email, "password": password})
+        if response.status_code == 200:
+            counter[0] += 1
+
+
+async def run_phase(args, headers: dict, logins: int) -> dict:
+    """Run one measurement phase"""
+    latencies: List[float] = []
+    login_count = [0]
+    stop_at = time.perf_counter() + args.duration
+
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=60.0) as client:
+        tasks = [
+            chat_worker(client, headers, args.ask, stop_at, latencies)
+            for _ in range(args.chat_concurrency)
+        ]
+        tasks += [
+            login_worker(client, args.email, args.password, stop_at, login_count)
+            for _ in range(logins)
+        ]
+        await asyncio.gather(*tasks)
+
+    return {
+        "requests": len(latencies),
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "logins": login_count[0],
+    }
+
+
+async def main(args):
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=60.0) as client:
+        response = await client.post("/auth/login", json={"email": args.email, "password": args.password})
+        response.raise_for_status()
+        headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    print("=" * 60)
+    print(f"로그인 부하 벤치마크 ({'/chat/ask' if args.ask else '/chat/history'})")
+    print("=" * 60)
+
+    results = {}
+    for name, logins in (("baseline", 0), ("mixed", args.logins)):
+        print(f"\n{name}: chat x{args.chat_concurrency}, login x{logins}, {args.duration}s")
+        results[name] = await run_phase(args, headers, logins)
+        r = results[name]
+        print(f"  chat requests: {r['requests']}, logins: {r['logins']}")
+        print(f"  p50 {r['p50']:.1f}ms  p95 {r['p95']:.1f}ms  p99 {r['p99']:.1f}ms")
+
+    base_p99 = results["baseline"]["p99"]
+    mixed_p99 = results["mixed"]["p99"]
+    ratio = mixed_p99 / base_p99 if base_p99 else 0
+    print("\n" + "=" * 60)
+    print(f"p99 baseline {base_p99:.1f}ms -> mixed {mixed_p99:.1f}ms (x{ratio:.2f})")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로그인 + 상담 혼합 부하 벤치마크")
+    parser.add_argument("--base-url", default="http://localhost:8001/api/v1")
+    parser.add_argument("--email", default="admin@taxaigent.kr")
+    parser.add_argument("--password", default="admin1234!")
+    parser.add_argument("--duration", type=float, default=15.0, help="단계별 측정 시간(초)")
+    parser.add_argument("--chat-concurrency", type=int, default=4)
+    parser.add_argument("--logins", type=int, default=8, help="mixed 단계 동시 로그인 수")
+    parser.add_argument("--ask", action="store_true", help="/chat/ask로 측정 (기본: /chat/history)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,133 @@
+"""
+상담 DB 비용 벤치마크 스크립트
+ChatService.ask 한 번에 발생하는 SQL 수, 커밋 수, DB 시간을 측정합니다.
+LLM과 RAG는 고정 응답으로 대체하여 DB 비용만 측정합니다.
+
+사용법:
+    python scripts/bench_chat_db.py --iterations 200
+    python scripts/bench_chat_db.py --database-url postgresql+asyncpg://...   # 서버에 임시 DB 생성 후 삭제
+"""
+import argparse
+import asyncio
+import os
+import sys
+import io
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 출력 설정
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+parser = argparse.ArgumentParser(description="ChatService.ask DB 비용 측정")
+parser.add_argument("--iterations", type=int, default=100)
+parser.add_argument("--database-url", default=None, help="임시 DB를 만들 PostgreSQL 서버 (기본: 임시 SQLite)")
+args = parser.parse_args()
+
+from scripts.scratch_db import create_scratch_database, drop_scratch_database
+
+# app 모듈 import 전에 DB 설정 (주어진 DB가 아닌 새로 만든 임시 DB에서 측정)
+scratch_url = asyncio.run(create_scratch_database(args.database_url, "bench_chat"))
+os.environ["DATABASE_URL"] = scratch_url
+os.environ["DB_ECHO"] = "false"
+
+from sqlalchemy import event, select
+
+from app.core.database import engine, init_db, AsyncSessionLocal
+from app.core.seed import seed_categories, seed_plans
+from app.models import User, Plan, Subscription
+from app.services import chat_service as chat_module
+from app.services.chat_service import ChatService
+from app.services.llm_service import LLMResponse
+
+FAKE_ANSWER = '{"answer": "소득세법 제27조에 따라 경비로 인정됩니다.", "is_deductible": true, "category_code": "EQP", "confidence": 0.9}'
+
+
+async def fake_generate(*_args, **_kwargs) -> LLMResponse:
+    return LLMResponse(
+        content=FAKE_ANSWER, provider="fake", model="fake",
+        input_tokens=0, output_tokens=0, response_time_ms=0,
+    )
+
+
+class DBCounter:
+    """Counts statements, commits and time spent in the DB driver"""
+
+    def __init__(self):
+        self.statements = 0
+        self.commits = 0
+        self.seconds = 0.0
+        self._started = {}
+
+    def before(self, conn, cursor, statement, parameters, context, executemany):  # noqa: ARG002
+        self._started[id(context)] = time.perf_counter()
+
+    def after(self, conn, cursor, statement, parameters, context, executemany):  # noqa: ARG002
+        self.statements += 1
+        self.seconds += time.perf_counter() - self._started.pop(id(context), time.perf_counter())
+
+    def commit(self, conn):  # noqa: ARG002
+        self.commits += 1
+
+
+async def main():
+    # LLM/RAG 대체
+    chat_module.llm_service.generate = fake_generate
+    chat_module.rag_service.search = lambda *a, **k: []
+
+    await init_db()
+
+    async with AsyncSessionLocal() as db:
+        await seed_categories(db)
+        await seed_plans(db)
+        user = User(email="bench@taxaigent.kr", name="bench", provider="email")
+        db.add(user)
+        await db.flush()
+        premium = (await db.execute(select(Plan).where(Plan.code == "premium"))).scalar_one()
+        db.add(Subscription(user_id=user.id, plan_id=premium.id, status="active", started_at=datetime.utcnow()))
+        await db.commit()
+        user_id = user.id
+
+    counter = DBCounter()
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", counter.before)
+    event.listen(sync_engine, "after_cursor_execute", counter.after)
+    event.listen(sync_engine, "commit", counter.commit)
+
+    # 캐시 워밍업 1회 제외
+    async with AsyncSessionLocal() as db:
+        await ChatService(db).ask(user_id=user_id, question="워밍업", session_id="bench")
+    counter.__init__()
+
+    wall_start = time.perf_counter()
+    for i in range(args.iterations):
+        async with AsyncSessionLocal() as db:
+            await ChatService(db).ask(user_id=user_id, question=f"노트북 구매 {i}", session_id="bench")
+            await db.commit()  # get_db와 동일
+    wall = time.perf_counter() - wall_start
+
+    n = args.iterations
+    print("=" * 60)
+    print(f"ChatService.ask x{n} ({engine.dialect.name})")
+    print("=" * 60)
+    print(f"  statements / chat : {counter.statements / n:.2f}")
+    print(f"  commits / chat    : {counter.commits / n:.2f}")
+    print(f"  DB time / chat    : {counter.seconds / n * 1000:.3f} ms")
+    print(f"  wall time / chat  : {wall / n * 1000:.3f} ms")
+
+
+async def run() -> None:
+    try:
+        await main()
+    finally:
+        await engine.dispose()
+        await drop_scratch_database(args.database_url, scratch_url)
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
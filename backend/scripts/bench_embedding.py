@@ -0,0 +1,102 @@
+"""
+임베딩 처리량 벤치마크 스크립트
+백엔드별 단건 쿼리 지연시간과 배치 처리량을 측정합니다.
+
+사용법:
+    python scripts/bench_embedding.py
+    python scripts/bench_embedding.py --backends torch onnx-int8 --queries 200 --batch 32
+"""
+import argparse
+import sys
+import io
+import time
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 출력 설정
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.embedding_backends import BACKENDS, create_backend
+from scripts.bench_stats import percentile
+
+QUERIES = [
+    "노트북 구매 비용 처리 방법",
+    "거래처 식사비 접대비 한도",
+    "개인 차량 주유비 경비 인정",
+    "사무실 임차료 계정과목",
+    "직원 회식비 복리후생비",
+    "온라인 광고비 부가세 공제",
+]
+PASSAGE = (
+    "사업과 직접 관련된 지출로서 적격증빙을 수취한 경우 필요경비로 인정됩니다. "
+    "다만 개인적 용도로 사용한 부분은 안분하여 경비에서 제외해야 합니다."
+)
+
+
+def bench_backend(name: str, args) -> dict:
+    load_start = time.perf_counter()
+    backend = create_backend(name)
+    load_seconds = time.perf_counter() - load_start
+
+    # 워밍업
+    backend.encode(QUERIES)
+
+    latencies = []
+    for i in range(args.queries):
+        start = time.perf_counter()
+        backend.encode([QUERIES[i % len(QUERIES)]])
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    passages = [f"{PASSAGE} ({i})" for i in range(args.batch * args.batches)]
+    start = time.perf_counter()
+    for i in range(args.batches):
+        backend.encode(passages[i * args.batch:(i + 1) * args.batch])
+    throughput = len(passages) / (time.perf_counter() - start)
+
+    return {
+        "load_s": load_seconds,
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "throughput": throughput,
+    }
+
+
+def main(args):
+    print("=" * 60)
+    print(f"임베딩 벤치마크 (queries {args.queries}, batch {args.batch} x{args.batches})")
+    print("=" * 60)
+
+    results = {}
+    for name in args.backends:
+        try:
+            results[name] = bench_backend(name, args)
+        except Exception as e:
+            print(f"\n{name}: skipped ({e})")
+            continue
+        r = results[name]
+        print(f"\n{name}")
+        print(f"  load       {r['load_s']:.1f}s")
+        print(f"  query      p50 {r['p50']:.1f}ms  p95 {r['p95']:.1f}ms")
+        print(f"  throughput {r['throughput']:.1f} passages/s")
+
+    base = results.get("torch")
+    if base and len(results) > 1:
+        print("\n" + "=" * 60)
+        for name, r in results.items():
+            if name != "torch":
+                print(f"{name} vs torch: query p50 x{base['p50'] / r['p50']:.2f}, "
+                      f"throughput x{r['throughput'] / base['throughput']:.2f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="임베딩 백엔드 지연시간/처리량 측정")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=BACKENDS)
+    parser.add_argument("--queries", type=int, default=100, help="단건 쿼리 측정 횟수")
+    parser.add_argument("--batch", type=int, default=32, help="배치 크기")
+    parser.add_argument("--batches", type=int, default=8, help="배치 반복 횟수")
+    main(parser.parse_args())
@@ -0,0 +1,267 @@
+"""
+검색 품질/지연 벤치마크 스크립트
+data/knowledge의 FAQ(question 필드가 있는 문서)를 쿼리로, 해당 문서 id를 정답으로 사용해
+임베딩 백엔드 x FAISS 인덱스 구성별 recall@k, MRR, 쿼리당 지연을 측정합니다.
+
+사용법:
+    python scripts/bench_retrieval.py
+    python scripts/bench_retrieval.py --backends torch onnx-int8 --indexes Flat HNSW32 SQ8 "IVF{nlist},Flat"
+    python scripts/bench_retrieval.py --holdout-questions --output results/retrieval.json
+    python scripts/bench_retrieval.py --baseline results/retrieval.json --max-recall-drop 0.02   # 회귀 시 exit 1
+"""
+import argparse
+import json
+import math
+import sys
+import io
+import time
+from pathlib import Path
+from typing import Dict, List, Set
+
+import numpy as np
+import faiss
+
+# Windows 콘솔 UTF-8 출력 설정
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.embedding_backends import BACKENDS, create_backend
+from app.services.local_vector_store import LocalVectorStore
+from scripts.bench_stats import percentile
+
+# 운영 인덱스 (LocalVectorStore)와 동일한 구성
+BASELINE_INDEX = "Flat"
+
+
+def load_corpus(knowledge_dir: Path) -> List[Dict]:
+    documents = []
+    for json_file in sorted(knowledge_dir.glob("*.json")):
+        with open(json_file, "r", encoding="utf-8") as f:
+            documents.extend(json.load(f))
+    for i, doc in enumerate(documents):
+        doc.setdefault("id", f"doc_{i}")
+    return documents
+
+
+def build_queries(documents: List[Dict]) -> List[Dict]:
+    """FAQ entries: question -> relevant ids (the entry itself plus related_ids)"""
+    queries = []
+    for doc in documents:
+        if doc.get("question"):
+            relevant = {doc["id"], *doc.get("related_ids", [])}
+            queries.append({"query": doc["question"], "relevant": relevant})
+    return queries
+
+
+def document_text(doc: Dict, holdout_questions: bool) -> str:
+    """Indexed text (same as LocalVectorStore unless the question is held out)"""
+    if holdout_questions:
+        return doc["content"]
+    return LocalVectorStore()._prepare_text(doc)
+
+
+def build_index(spec: str, embeddings: np.ndarray, args) -> faiss.Index:
+    """FAISS index from a factory string ({nlist} = sqrt(N))"""
+    count, dimension = embeddings.shape
+    nlist = max(1, int(math.sqrt(count)))
+    index = faiss.index_factory(dimension, spec.format(nlist=nlist), faiss.METRIC_INNER_PRODUCT)
+    if not index.is_trained:
+        index.train(embeddings)
+    index.add(embeddings)
+
+    # 검색 파라미터
+    try:
+        faiss.extract_index_ivf(index).nprobe = min(args.nprobe, nlist)
+    except RuntimeError:
+        pass  # IVF 아님
+    if hasattr(index, "hnsw"):
+        index.hnsw.efSearch = args.ef_search
+    return index
+
+
+def evaluate(
+    index: faiss.Index,
+    query_embeddings: np.ndarray,
+    queries: List[Dict],
+    doc_ids: List[str],
+    ks: List[int],
+) -> Dict:
+    """Recall@k, MRR@max(k) and per-query search latency"""
+    max_k = min(max(ks), index.ntotal)
+    recall = {k: 0.0 for k in ks}
+    reciprocal_rank = 0.0
+    latencies = []
+
+    for i, query in enumerate(queries):
+        vector = query_embeddings[i:i + 1]
+        start = time.perf_counter()
+        _, indices = index.search(vector, max_k)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+        ranked = [doc_ids[idx] for idx in indices[0] if idx >= 0]
+        relevant: Set[str] = query["relevant"]
+        for k in ks:
+            recall[k] += len(relevant.intersection(ranked[:k])) / len(relevant)
+        for rank, doc_id in enumerate(ranked, start=1):
+            if doc_id in relevant:
+                reciprocal_rank += 1 / rank
+                break
+
+    count = len(queries)
+    return {
+        **{f"recall@{k}": round(recall[k] / count, 4) for k in ks},
+        f"mrr@{max(ks)}": round(reciprocal_rank / count, 4),
+        "search_ms": {
+            "p50": round(percentile(latencies, 50), 4),
+            "p95": round(percentile(latencies, 95), 4),
+            "p99": round(percentile(latencies, 99), 4),
+        },
+    }
+
+
+def bench_backend(name: str, documents: List[Dict], queries: List[Dict], args) -> List[Dict]:
+    backend = create_backend(name)
+
+    start = time.perf_counter()
+    texts = [document_text(doc, args.holdout_questions) for doc in documents]
+    doc_embeddings = np.vstack([
+        backend.encode(texts[i:i + args.batch]) for i in range(0, len(texts), args.batch)
+    ]).astype(np.float32)
+    faiss.normalize_L2(doc_embeddings)
+    embed_corpus_s = time.perf_counter() - start
+
+    # 쿼리 임베딩은 운영과 같이 1건씩 (지연 측정 포함)
+    query_vectors, embed_latencies = [], []
+    for query in queries:
+        start = time.perf_counter()
+        query_vectors.append(backend.encode([query["query"]])[0])
+        embed_latencies.append((time.perf_counter() - start) * 1000)
+    query_embeddings = np.asarray(query_vectors, dtype=np.float32)
+    faiss.normalize_L2(query_embeddings)
+
+    doc_ids = [doc["id"] for doc in documents]
+    embed_ms = {
+        "p50": round(percentile(embed_latencies, 50), 3),
+        "p95": round(percentile(embed_latencies, 95), 3),
+    }
+
+    results = []
+    for spec in args.indexes:
+        result = {"backend": name, "index": spec, "embed_query_ms": embed_ms, "embed_corpus_s": round(embed_corpus_s, 2)}
+        try:
+            start = time.perf_counter()
+            index = build_index(spec, doc_embeddings, args)
+            result["build_s"] = round(time.perf_counter() - start, 4)
+            result["index_bytes"] = int(faiss.serialize_index(index).size)
+            result.update(evaluate(index, query_embeddings, queries, doc_ids, args.k))
+        except Exception as e:
+            result["error"] = str(e)
+        results.append(result)
+    return results
+
+
+def check_regressions(results: List[Dict], baseline_path: Path, args) -> List[str]:
+    """Configs whose recall dropped more than max_recall_drop against the baseline file"""
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    if baseline.get("holdout_questions") != args.holdout_questions:
+        print("Warning: baseline was measured with a different --holdout-questions setting")
+    ks, max_drop = args.k, args.max_recall_drop
+    previous = {(r["backend"], r["index"]): r for r in baseline.get("results", []) if "error" not in r}
+
+    regressions = []
+    for result in results:
+        before = previous.get((result["backend"], result["index"]))
+        if before is None or "error" in result:
+            continue
+        for k in ks:
+            key = f"recall@{k}"
+            if key in before and result[key] < before[key] - max_drop:
+                regressions.append(
+                    f"{result['backend']}/{result['index']} {key}: {before[key]:.4f} -> {result[key]:.4f}"
+                )
+    return regressions
+
+
+def main(args) -> int:
+    knowledge_dir = Path(args.knowledge_dir)
+    documents = load_corpus(knowledge_dir)
+    queries = build_queries(documents)
+    if not queries:
+        print(f"No FAQ entries with a 'question' field in {knowledge_dir}")
+        return 1
+
+    print("=" * 60)
+    print(f"검색 벤치마크 ({len(documents)} documents, {len(queries)} queries, "
+          f"{'question held out' if args.holdout_questions else 'production text'})")
+    print("=" * 60)
+
+    results = []
+    for name in args.backends:
+        try:
+            results.extend(bench_backend(name, documents, queries, args))
+        except Exception as e:
+            print(f"\n{name}: skipped ({e})")
+
+    max_k = max(args.k)
+    for result in results:
+        print(f"\n{result['backend']} / {result['index']}")
+        if "error" in result:
+            print(f"  error: {result['error']}")
+            continue
+        recalls = "  ".join(f"R@{k} {result[f'recall@{k}']:.3f}" for k in args.k)
+        print(f"  {recalls}  MRR@{max_k} {result[f'mrr@{max_k}']:.3f}")
+        print(f"  search p50 {result['search_ms']['p50']:.3f}ms  p95 {result['search_ms']['p95']:.3f}ms"
+              f"  | query embed p50 {result['embed_query_ms']['p50']:.1f}ms"
+              f"  | index {result['index_bytes'] / 1024:.0f}KB")
+
+    report = {
+        "knowledge_dir": str(knowledge_dir),
+        "documents": len(documents),
+        "queries": len(queries),
+        "holdout_questions": args.holdout_questions,
+        "k": args.k,
+        "nprobe": args.nprobe,
+        "ef_search": args.ef_search,
+        "results": results,
+    }
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n결과 저장: {output_path}")
+
+    exit_code = 0
+    if args.baseline:
+        regressions = check_regressions(results, Path(args.baseline), args)
+        print("\n" + "=" * 60)
+        if regressions:
+            print(f"Recall 회귀 ({len(regressions)}건, 허용 {args.max_recall_drop}):")
+            for line in regressions:
+                print(f"  {line}")
+            exit_code = 1
+        else:
+            print(f"기준 대비 recall 회귀 없음 ({args.baseline})")
+    print("=" * 60)
+    return exit_code
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="지식 베이스 검색 recall/MRR/지연 측정")
+    parser.add_argument("--knowledge-dir", default=str(project_root / "data" / "knowledge"))
+    parser.add_argument("--backends", nargs="+", default=["torch"], choices=BACKENDS)
+    parser.add_argument("--indexes", nargs="+", default=[BASELINE_INDEX, "HNSW32", "SQ8", "SQfp16", "IVF{nlist},Flat"],
+                        help="FAISS index_factory 문자열 ({nlist} = sqrt(문서 수))")
+    parser.add_argument("--k", nargs="+", type=int, default=[1, 3, 5, 10])
+    parser.add_argument("--nprobe", type=int, default=4, help="IVF 검색 클러스터 수")
+    parser.add_argument("--ef-search", type=int, default=64, help="HNSW efSearch")
+    parser.add_argument("--batch", type=int, default=32, help="문서 임베딩 배치 크기")
+    parser.add_argument("--holdout-questions", action="store_true",
+                        help="FAQ 질문을 인덱스 텍스트에서 제외 (질문 문장 그대로의 매칭 배제)")
+    parser.add_argument("--output", default=None, help="결과 JSON 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-recall-drop", type=float, default=0.02)
+    sys.exit(main(parser.parse_args()))
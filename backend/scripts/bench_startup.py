@@ -0,0 +1,107 @@
+"""
+시작 시간 벤치마크 스크립트
+app.main import 시간과 서버 기동 후 liveness/readiness 응답까지의 시간을 측정합니다.
+
+사용법:
+    python scripts/bench_startup.py --runs 5
+    python scripts/bench_startup.py --serve --port 8011   # uvicorn 기동 후 /health/live, /health/ready 측정
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import io
+import time
+from pathlib import Path
+
+import httpx
+
+# Windows 콘솔 UTF-8 출력 설정
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# 프로젝트 루트 (서브프로세스 작업 디렉터리)
+project_root = Path(__file__).parent.parent
+
+IMPORT_SNIPPET = (
+    "import time; start = time.perf_counter(); import app.main; "
+    "print(time.perf_counter() - start)"
+)
+
+
+def measure_import(runs: int) -> list:
+    """Import app.main in fresh interpreters"""
+    timings = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", IMPORT_SNIPPET],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            print(result.stderr)
+            raise SystemExit("app.main import failed")
+        timings.append(float(result.stdout.strip().splitlines()[-1]))
+    return timings
+
+
+def wait_for(url: str, started: float, timeout: float) -> float:
+    """Poll url until 200, return seconds since started"""
+    while time.perf_counter() - started < timeout:
+        try:
+            if httpx.get(url, timeout=1.0).status_code == 200:
+                return time.perf_counter() - started
+        except httpx.TransportError:
+            pass
+        time.sleep(0.05)
+    return float("nan")
+
+
+def measure_serve(port: int, timeout: float) -> dict:
+    """Start uvicorn and time liveness and readiness"""
+    base_url = f"http://127.0.0.1:{port}"
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=project_root,
+        env=dict(os.environ),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        live = wait_for(f"{base_url}/health/live", started, timeout)
+        ready = wait_for(f"{base_url}/health/ready", started, timeout)
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+    return {"live": live, "ready": ready}
+
+
+def main(args):
+    print("=" * 60)
+    print("시작 시간 벤치마크")
+    print("=" * 60)
+
+    timings = measure_import(args.runs)
+    print(f"\nimport app.main x{args.runs}")
+    print(f"  median {statistics.median(timings) * 1000:.0f}ms  "
+          f"min {min(timings) * 1000:.0f}ms  max {max(timings) * 1000:.0f}ms")
+
+    if args.serve:
+        result = measure_serve(args.port, args.timeout)
+        print(f"\nuvicorn :{args.port}")
+        print(f"  /health/live  200 after {result['live']:.2f}s")
+        print(f"  /health/ready 200 after {result['ready']:.2f}s")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="app.main import / 서버 기동 시간 측정")
+    parser.add_argument("--runs", type=int, default=5, help="import 측정 반복 횟수")
+    parser.add_argument("--serve", action="store_true", help="uvicorn 기동 후 헬스체크 응답 시간 측정")
+    parser.add_argument("--port", type=int, default=8011)
+    parser.add_argument("--timeout", type=float, default=300.0, help="헬스체크 대기 한도(초)")
+    main(parser.parse_args())
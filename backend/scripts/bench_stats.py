@@ -0,0 +1,15 @@
+"""
+Bench stats - 벤치마크/부하 테스트 스크립트 공용 통계
+리포트 간 p50/p95/p99를 비교할 수 있도록 모든 스크립트가 같은 백분위수 정의(nearest-rank)를 사용합니다.
+"""
+import math
+from typing import Iterable
+
+
+def percentile(values: Iterable[float], pct: float) -> float:
+    """Nearest-rank percentile (pct: 0-100), 0.0 for no samples"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = math.ceil(pct / 100 * len(ordered))
+    return ordered[max(0, min(len(ordered) - 1, rank - 1))]
@@ -0,0 +1,117 @@
+"""
+임베딩 백엔드 정합성 검사 스크립트
+ONNX / int8 ONNX 임베딩이 PyTorch 임베딩과 코사인 유사도로 일치하는지 확인합니다.
+지식 데이터(data/knowledge)가 있으면 검색 상위 결과 일치율도 함께 확인합니다.
+
+사용법:
+    python scripts/check_embedding_parity.py
+    python scripts/check_embedding_parity.py --backends onnx-int8 --min-cosine-int8 0.97
+"""
+import argparse
+import json
+import sys
+import io
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+# Windows 콘솔 UTF-8 출력 설정
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.embedding_backends import (
+    BACKEND_TORCH, BACKEND_ONNX, BACKEND_ONNX_INT8, create_backend,
+)
+
+SAMPLE_TEXTS = [
+    "노트북을 사업용으로 구매했는데 경비 처리가 되나요?",
+    "거래처와 저녁 식사 비용은 접대비로 처리할 수 있나요?",
+    "개인 차량 주유비를 사업 경비로 넣어도 되나요?",
+    "사무실 월세와 관리비는 어떤 계정과목인가요?",
+    "직원 회식비는 복리후생비인가요?",
+    "온라인 강의 수강료 비용처리",
+    "휴대폰 요금 경비 인정 여부",
+    "쿠팡에서 산 프린터 토너",
+    "페이스북 광고비 부가세 공제",
+    "출장 KTX 승차권",
+    "간이과세자 부가가치세 신고 기한",
+    "종합소득세 신고 시 필요경비 증빙",
+]
+
+
+def load_knowledge_texts(limit: int) -> List[str]:
+    """Knowledge documents prepared the same way as LocalVectorStore"""
+    texts = []
+    knowledge_dir = project_root / "data" / "knowledge"
+    for json_file in sorted(knowledge_dir.glob("*.json")):
+        with open(json_file, "r", encoding="utf-8") as f:
+            for doc in json.load(f):
+                if "question" in doc:
+                    texts.append(f"질문: {doc['question']}\n답변: {doc['content']}")
+                else:
+                    texts.append(doc["content"])
+    return texts[:limit]
+
+
+def topk_agreement(reference: np.ndarray, candidate: np.ndarray, queries: int, k: int) -> float:
+    """Share of top-k neighbours (first `queries` rows against the rest) that match"""
+    ref_scores = reference[:queries] @ reference[queries:].T
+    cand_scores = candidate[:queries] @ candidate[queries:].T
+    ref_top = np.argsort(-ref_scores, axis=1)[:, :k]
+    cand_top = np.argsort(-cand_scores, axis=1)[:, :k]
+    overlap = [len(set(r) & set(c)) / k for r, c in zip(ref_top, cand_top)]
+    return float(np.mean(overlap))
+
+
+def main(args):
+    texts = SAMPLE_TEXTS + load_knowledge_texts(args.docs)
+    has_docs = len(texts) > len(SAMPLE_TEXTS) + args.top_k
+
+    print("=" * 60)
+    print(f"임베딩 정합성 검사 ({len(texts)} texts)")
+    print("=" * 60)
+
+    reference = create_backend(BACKEND_TORCH).encode(texts)
+    print(f"\n{BACKEND_TORCH}: dimension {reference.shape[1]}")
+
+    thresholds = {BACKEND_ONNX: args.min_cosine, BACKEND_ONNX_INT8: args.min_cosine_int8}
+    failed = False
+
+    for name in args.backends:
+        candidate = create_backend(name).encode(texts)
+        if candidate.shape != reference.shape:
+            print(f"\n{name}: shape mismatch {candidate.shape} != {reference.shape}")
+            failed = True
+            continue
+
+        cosines = np.sum(reference * candidate, axis=1)
+        ok = cosines.min() >= thresholds[name]
+        failed |= not ok
+        print(f"\n{name}: {'PASS' if ok else 'FAIL'}")
+        print(f"  cosine min {cosines.min():.5f}  mean {cosines.mean():.5f}  "
+              f"(threshold {thresholds[name]})")
+
+        if has_docs:
+            agreement = topk_agreement(reference, candidate, len(SAMPLE_TEXTS), args.top_k)
+            print(f"  top-{args.top_k} retrieval agreement {agreement * 100:.1f}%")
+
+    print("\n" + "=" * 60)
+    print("FAIL" if failed else "PASS")
+    print("=" * 60)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="ONNX 임베딩 vs PyTorch 임베딩 정합성 검사")
+    parser.add_argument("--backends", nargs="+", default=[BACKEND_ONNX, BACKEND_ONNX_INT8],
+                        choices=[BACKEND_ONNX, BACKEND_ONNX_INT8])
+    parser.add_argument("--min-cosine", type=float, default=0.999, help="fp32 ONNX 최소 코사인")
+    parser.add_argument("--min-cosine-int8", type=float, default=0.98, help="int8 ONNX 최소 코사인")
+    parser.add_argument("--docs", type=int, default=300, help="비교에 포함할 지식 문서 수")
+    parser.add_argument("--top-k", type=int, default=3)
+    main(parser.parse_args())
@@ -0,0 +1,155 @@
+"""
+엔드포인트별 SQL 실행 수 점검 스크립트
+지출 API를 순서대로 호출하며 요청 1건당 실행된 SQL 수를 세고, 기준(BUDGETS)을 넘으면 exit 1로 종료합니다.
+인증/요금제 캐시가 채워진 상태(두 번째 요청부터)를 측정하며, LLM은 고정 응답으로 대체합니다.
+
+사용법:
+    python scripts/check_query_counts.py
+    python scripts/check_query_counts.py --verbose   # 요청별 SQL 출력
+    python scripts/check_query_counts.py --database-url postgresql+asyncpg://...
+"""
+import argparse
+import os
+import sys
+import io
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+# Windows 콘솔 UTF-8 출력 설정
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+parser = argparse.ArgumentParser(description="지출 API 요청당 SQL 수 점검")
+parser.add_argument("--database-url", default=None, help="측정 대상 DB (기본: 임시 SQLite)")
+parser.add_argument("--verbose", action="store_true", help="요청별 SQL 출력")
+args = parser.parse_args()
+
+# app 모듈 import 전에 설정
+os.environ["DATABASE_URL"] = args.database_url or f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/query_counts.db"
+os.environ["DB_ECHO"] = "false"
+os.environ["AI_WARMUP_ON_STARTUP"] = "false"
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, select
+
+from app.core.database import engine, AsyncSessionLocal
+from app.core.security import create_access_token
+from app.main import app
+from app.models import User, Plan, Subscription
+from app.services import classifier_service as classifier_module
+from app.services.llm_service import LLMResponse
+
+FAKE_CLASSIFICATION = '{"category_code": "EQP", "is_deductible": true, "confidence": 0.9, "reason": "업무용 장비"}'
+
+# 요청당 최대 SQL 수 (캐시 적중 상태 기준)
+BUDGETS = {
+    "POST /expenses": 3,                   # usage upsert, usage log, expense insert
+    "GET /expenses/{id}": 1,
+    "PUT /expenses/{id}": 1,               # UPDATE ... RETURNING
+    "POST /expenses/{id}/classify": 2,     # select, update
+    "GET /expenses": 3,                    # count, sum, page
+    "PATCH /expenses/bulk": 1,
+    "POST /expenses/bulk/confirm": 1,
+    "DELETE /expenses/{id}": 3,            # select, images (cascade), delete
+}
+
+
+async def fake_generate(*_args, **_kwargs) -> LLMResponse:
+    return LLMResponse(
+        content=FAKE_CLASSIFICATION, provider="fake", model="fake",
+        input_tokens=0, output_tokens=0, response_time_ms=0,
+    )
+
+
+async def create_user() -> int:
+    """Premium (unlimited) user so usage limits do not interfere"""
+    async with AsyncSessionLocal() as db:
+        user = User(email="querycount@taxaigent.kr", name="querycount", provider="email")
+        db.add(user)
+        await db.flush()
+        premium = (await db.execute(select(Plan).where(Plan.code == "premium"))).scalar_one()
+        db.add(Subscription(user_id=user.id, plan_id=premium.id, status="active", started_at=datetime.utcnow()))
+        await db.commit()
+        return user.id
+
+
+class StatementLog:
+    """Statements executed between reset() calls"""
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    def record(self, conn, cursor, statement, parameters, context, executemany):  # noqa: ARG002
+        self.statements.append(" ".join(statement.split()))
+
+    def reset(self) -> None:
+        self.statements = []
+
+
+def main() -> int:
+    classifier_module.llm_service.generate = fake_generate
+    log = StatementLog()
+
+    with TestClient(app) as client:
+        user_id = client.portal.call(create_user)
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user_id)})}"}
+
+        def call(method: str, path: str, **kwargs):
+            response = client.request(method, f"/api/v1{path}", headers=headers, **kwargs)
+            if response.status_code >= 400:
+                raise RuntimeError(f"{method} {path} -> {response.status_code}: {response.text}")
+            return response
+
+        # 인증/요금제 캐시 워밍업 (측정 제외)
+        seed = call("POST", "/expenses", json={"date": "2026-10-01", "description": "워밍업", "amount": "1000"}).json()
+        call("GET", f"/expenses/{seed['id']}")
+
+        event.listen(engine.sync_engine, "before_cursor_execute", log.record)
+        results = []
+
+        def measure(name: str, method: str, path: str, **kwargs):
+            log.reset()
+            response = call(method, path, **kwargs)
+            results.append((name, list(log.statements)))
+            return response
+
+        expense = measure("POST /expenses", "POST", "/expenses", json={
+            "date": "2026-10-02", "description": "노트북 구매", "amount": "1500000", "category_id": 1,
+        }).json()
+        expense_id = expense["id"]
+        measure("GET /expenses/{id}", "GET", f"/expenses/{expense_id}")
+        measure("PUT /expenses/{id}", "PUT", f"/expenses/{expense_id}", json={"category_id": 2, "memo": "수정"})
+        measure("POST /expenses/{id}/classify", "POST", f"/expenses/{expense_id}/classify")
+        measure("GET /expenses", "GET", "/expenses", params={"size": 20})
+        measure("PATCH /expenses/bulk", "PATCH", "/expenses/bulk", json={"ids": [seed["id"], expense_id], "is_confirmed": True})
+        measure("POST /expenses/bulk/confirm", "POST", "/expenses/bulk/confirm", json={"ids": [seed["id"], expense_id]})
+        measure("DELETE /expenses/{id}", "DELETE", f"/expenses/{expense_id}")
+
+        event.remove(engine.sync_engine, "before_cursor_execute", log.record)
+
+    print("=" * 60)
+    print(f"요청당 SQL 수 ({engine.dialect.name})")
+    print("=" * 60)
+    failures = 0
+    for name, statements in results:
+        budget = BUDGETS[name]
+        ok = len(statements) <= budget
+        failures += not ok
+        print(f"  {'OK  ' if ok else 'FAIL'} {name:<32} {len(statements):>2} / {budget}")
+        if args.verbose or not ok:
+            for statement in statements:
+                print(f"         {statement[:110]}")
+    print("=" * 60)
+    if failures:
+        print(f"기준 초과: {failures}개 엔드포인트")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
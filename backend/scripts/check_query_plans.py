@@ -0,0 +1,202 @@
+"""
+쿼리 플랜 회귀 검사 스크립트
+서비스 계층의 핫 쿼리가 복합 인덱스를 사용하는지 EXPLAIN으로 확인합니다.
+스키마는 alembic upgrade head로 만들어 배포되는 마이그레이션의 인덱스를 검사합니다.
+
+사용법:
+    python scripts/check_query_plans.py                      # 임시 SQLite
+    python scripts/check_query_plans.py --database-url postgresql+asyncpg://...   # 서버에 임시 DB 생성 후 삭제
+"""
+import argparse
+import asyncio
+import sys
+import io
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 출력 설정
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+
+from app.models import User, Expense, IncomeRecord, ChatHistory, UsageLog
+from scripts.scratch_db import create_scratch_database, drop_scratch_database, upgrade_schema
+
+
+async def _seed(session: AsyncSession) -> int:
+    """검사용 최소 데이터 생성"""
+    user = User(email="plan-check@taxaigent.kr", name="plan-check", provider="email")
+    session.add(user)
+    await session.flush()
+
+    today = date.today()
+    for i in range(50):
+        day = today - timedelta(days=i * 7)
+        session.add(Expense(
+            user_id=user.id, date=day, description=f"지출 {i}",
+            amount=Decimal("10000"), is_deductible=i % 2 == 0,
+        ))
+        session.add(IncomeRecord(
+            user_id=user.id, date=day, description=f"매출 {i}", amount=Decimal("50000"),
+        ))
+        session.add(ChatHistory(
+            user_id=user.id, session_id=f"s{i % 5}", channel="web",
+            question="q", answer="a", created_at=datetime.utcnow() - timedelta(hours=i),
+        ))
+        session.add(UsageLog(
+            user_id=user.id, action_type="chat", year_month=datetime.utcnow().strftime("%Y-%m"),
+        ))
+    await session.commit()
+    return user.id
+
+
+def _build_cases(user_id: int) -> list:
+    """(이름, 서비스 호출, {테이블: 기대 인덱스})"""
+    from app.services.ledger_service import LedgerService
+    from app.services.user_service import UserService
+
+    today = date.today()
+    month_start = today.replace(day=1)
+
+    cases = [
+        (
+            "LedgerService.get_ledger",
+            lambda db: LedgerService(db).get_ledger(user_id, month_start, today),
+            {"expenses": "ix_expenses_user_date", "income_records": "ix_income_records_user_date"},
+        ),
+        (
+            "LedgerService.get_dashboard",
+            lambda db: LedgerService(db).get_dashboard(user_id),
+            {"expenses": "ix_expenses_user_date", "income_records": "ix_income_records_user_date"},
+        ),
+        (
+            "UserService.get_usage_info",
+            lambda db: UserService(db).get_usage_info(user_id),
+            {"usage_logs": "ix_usage_logs_user_month_action"},
+        ),
+    ]
+
+    # AI 서비스 의존성이 있는 모듈은 설치된 경우에만 검사
+    try:
+        from app.services.expense_service import ExpenseService
+        cases.append((
+            "ExpenseService.get_list",
+            lambda db: ExpenseService(db).get_list(user_id, start_date=month_start, end_date=today),
+            {"expenses": "ix_expenses_user_date"},
+        ))
+        cases.append((
+            "ExpenseService.get_list (no filter)",
+            lambda db: ExpenseService(db).get_list(user_id),
+            {"expenses": "ix_expenses_user_date"},
+        ))
+    except ImportError as e:
+        print(f"Skipping ExpenseService checks: {e}")
+
+    try:
+        from app.services.chat_service import ChatService
+        cases.append((
+            "ChatService.get_history",
+            lambda db: ChatService(db).get_history(user_id),
+            {"chat_histories": "ix_chat_histories_user_created"},
+        ))
+        cases.append((
+            "ChatService.get_history (session)",
+            lambda db: ChatService(db).get_history(user_id, session_id="s1"),
+            {"chat_histories": "ix_chat_histories_user_session_created"},
+        ))
+        from app.services.session_memory import SessionMemoryService
+        cases.append((
+            "SessionMemoryService.load",
+            lambda db: SessionMemoryService(db).load(user_id, "s1"),
+            {"chat_histories": "ix_chat_histories_user_session_created"},
+        ))
+    except ImportError as e:
+        print(f"Skipping ChatService checks: {e}")
+
+    return cases
+
+
+async def _explain(conn, statement: str, parameters) -> str:
+    """EXPLAIN 결과를 문자열로 반환"""
+    if conn.dialect.name == "sqlite":
+        result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return "\n".join(str(row[-1]) for row in result.all())
+
+    result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+    return "\n".join(str(row[0]) for row in result.all())
+
+
+async def check(database_url: str) -> int:
+    await asyncio.to_thread(upgrade_schema, database_url)
+
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    async with session_factory() as session:
+        user_id = await _seed(session)
+
+    captured = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    failures = 0
+    for name, call, expected in _build_cases(user_id):
+        captured.clear()
+        event.listen(engine.sync_engine, "before_cursor_execute", _capture)
+        try:
+            async with session_factory() as session:
+                await call(session)
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", _capture)
+
+        statements = list(captured)
+        async with engine.connect() as conn:
+            if conn.dialect.name == "postgresql":
+                # 소량 데이터에서도 인덱스 사용 가능 여부를 확인하기 위해 seq scan 비활성화
+                await conn.exec_driver_sql("SET enable_seqscan = off")
+
+            for statement, parameters in statements:
+                lowered = statement.lower()
+                for table, index_name in expected.items():
+                    if f"from {table}" not in lowered:
+                        continue
+                    plan = await _explain(conn, statement, parameters)
+                    if index_name in plan:
+                        print(f"  ✅ {name}: {table} -> {index_name}")
+                    else:
+                        failures += 1
+                        print(f"  ❌ {name}: {table} does not use {index_name}")
+                        print(f"     SQL: {' '.join(statement.split())}")
+                        print("     PLAN:\n       " + plan.replace("\n", "\n       "))
+
+    await engine.dispose()
+
+    print("\n" + "=" * 60)
+    print("모든 쿼리가 인덱스를 사용합니다" if failures == 0 else f"{failures}개 쿼리 플랜 실패")
+    print("=" * 60)
+    return 1 if failures else 0
+
+
+async def main(server_url: str) -> int:
+    database_url = await create_scratch_database(server_url, "plan_check")
+    try:
+        return await check(database_url)
+    finally:
+        await drop_scratch_database(server_url, database_url)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="핫 쿼리 인덱스 사용 검사")
+    parser.add_argument("--database-url", default=None, help="임시 DB를 만들 PostgreSQL 서버 (기본: 임시 SQLite)")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args.database_url)))
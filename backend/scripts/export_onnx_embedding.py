@@ -0,0 +1,113 @@
+"""
+KoE5 ONNX 내보내기 스크립트
+PyTorch 모델을 ONNX로 내보내고 int8 동적 양자화 모델을 함께 생성합니다.
+(내보내기에는 torch/transformers/onnx/onnxruntime 필요, 서빙에는 onnxruntime/tokenizers만 필요)
+
+사용법:
+    python scripts/export_onnx_embedding.py
+    python scripts/export_onnx_embedding.py --output data/onnx/koe5 --skip-int8
+
+생성 파일:
+    model.onnx (+ model.onnx.data)  - fp32 (EMBEDDING_BACKEND=onnx)
+    model_int8.onnx                 - int8 가중치 (EMBEDDING_BACKEND=onnx-int8)
+    tokenizer.json                  - fast tokenizer
+"""
+import argparse
+import sys
+import io
+from pathlib import Path
+
+# Windows 콘솔 UTF-8 출력 설정
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.config import settings
+from app.services.embedding_backends import (
+    ONNX_MODEL_FILE, ONNX_INT8_MODEL_FILE, onnx_model_dir,
+)
+
+
+def export_fp32(model_name: str, output_dir: Path, opset: int) -> Path:
+    """Export transformer encoder (last_hidden_state) to ONNX"""
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+
+    print(f"Loading {model_name}...")
+    tokenizer = AutoTokenizer.from_pretrained(model_name)
+    model = AutoModel.from_pretrained(model_name)
+    model.eval()
+
+    # tokenizer.json 저장 (서빙 시 tokenizers 라이브러리로 로드)
+    tokenizer.save_pretrained(str(output_dir))
+
+    sample = tokenizer(["노트북 구매 비용 처리", "접대비 한도"], padding=True, return_tensors="pt")
+    input_names = ["input_ids", "attention_mask"]
+    inputs = (sample["input_ids"], sample["attention_mask"])
+
+    model_path = output_dir / ONNX_MODEL_FILE
+    print(f"Exporting fp32 model -> {model_path}")
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            inputs,
+            str(model_path),
+            input_names=input_names,
+            output_names=["last_hidden_state"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "last_hidden_state": {0: "batch", 1: "sequence"},
+            },
+            opset_version=opset,
+            do_constant_folding=True,
+        )
+    return model_path
+
+
+def quantize_int8(model_path: Path, output_dir: Path) -> Path:
+    """Dynamic int8 quantization of MatMul/Gemm weights"""
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    int8_path = output_dir / ONNX_INT8_MODEL_FILE
+    print(f"Quantizing -> {int8_path}")
+    quantize_dynamic(
+        model_input=str(model_path),
+        model_output=str(int8_path),
+        weight_type=QuantType.QInt8,
+        per_channel=True,
+    )
+    return int8_path
+
+
+def main(args):
+    output_dir = Path(args.output) if args.output else onnx_model_dir()
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print("=" * 60)
+    print(f"KoE5 ONNX 내보내기: {args.model}")
+    print("=" * 60)
+
+    model_path = export_fp32(args.model, output_dir, args.opset)
+    if not args.skip_int8:
+        quantize_int8(model_path, output_dir)
+
+    print("\n생성 파일:")
+    for path in sorted(output_dir.iterdir()):
+        print(f"  {path.name:28s} {path.stat().st_size / 1024 / 1024:8.1f} MB")
+
+    print("\n" + "=" * 60)
+    print("완료! 정합성 확인: python scripts/check_embedding_parity.py")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="KoE5 ONNX / int8 내보내기")
+    parser.add_argument("--model", default=settings.EMBEDDING_MODEL)
+    parser.add_argument("--output", default=None, help="출력 디렉터리 (기본: EMBEDDING_ONNX_DIR)")
+    parser.add_argument("--opset", type=int, default=17)
+    parser.add_argument("--skip-int8", action="store_true", help="int8 양자화 생략")
+    main(parser.parse_args())
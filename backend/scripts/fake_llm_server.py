@@ -0,0 +1,165 @@
+"""
+가짜 LLM 서버 (OpenAI Chat Completions 호환)
+부하 테스트에서 실제 Gemini/OpenAI 대신 사용합니다. 지연 시간, 지터, 오류율을 설정할 수 있습니다.
+
+사용법:
+    python scripts/fake_llm_server.py --port 8900 --latency-ms 800 --jitter-ms 200
+    # 앱 설정: OPENAI_API_KEY=fake OPENAI_BASE_URL=http://127.0.0.1:8900/v1 GEMINI_API_KEY=
+"""
+import argparse
+import json
+import random
+import re
+import sys
+import io
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Windows 콘솔 UTF-8 출력 설정
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+parser = argparse.ArgumentParser(description="OpenAI 호환 가짜 LLM 서버")
+parser.add_argument("--host", default="127.0.0.1")
+parser.add_argument("--port", type=int, default=8900)
+parser.add_argument("--latency-ms", type=float, default=500.0, help="평균 응답 지연")
+parser.add_argument("--jitter-ms", type=float, default=100.0, help="지연 편차 (균등 분포 +/-)")
+parser.add_argument("--error-rate", type=float, default=0.0, help="HTTP 500 응답 비율 (0~1)")
+parser.add_argument("--cached-ratio", type=float, default=0.5, help="입력 토큰 중 캐시 적중으로 보고할 비율")
+parser.add_argument("--seed", type=int, default=None)
+
+# 상담/분류 응답 모두에 맞는 JSON (각 Pydantic 모델은 필요한 필드만 사용)
+JSON_ANSWERS = [
+    {
+        "answer": "업무용으로 구매한 노트북은 비품으로 경비 처리가 가능합니다.",
+        "is_deductible": True,
+        "category_code": "EQP",
+        "confidence": 0.9,
+        "legal_basis": "소득세법 제27조",
+        "reason": "업무용 전자기기 구매",
+    },
+    {
+        "answer": "거래처 식대는 접대비 한도 내에서 경비 처리가 가능합니다.",
+        "is_deductible": True,
+        "category_code": "ENT",
+        "confidence": 0.85,
+        "legal_basis": "소득세법 제35조",
+        "reason": "거래처 접대 식사",
+    },
+    {
+        "answer": "개인적인 용도의 지출은 경비로 인정되지 않습니다.",
+        "is_deductible": False,
+        "category_code": "NON",
+        "confidence": 0.8,
+        "legal_basis": "소득세법 제33조",
+        "reason": "사업과 무관한 지출",
+    },
+]
+SUMMARY_TEXT = "사용자는 업무용 지출의 경비 처리 여부를 문의했고, 비품/접대비 기준을 안내받았다."
+
+
+class FakeLLMHandler(BaseHTTPRequestHandler):
+    """Handles /v1/chat/completions and /v1/models"""
+
+    protocol_version = "HTTP/1.1"
+    config: argparse.Namespace = None
+    counter = 0
+    counter_lock = threading.Lock()
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass  # 요청 로그 생략 (부하 테스트 중 출력 비용 방지)
+
+    def _send_json(self, status: int, body: dict) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path.rstrip("/") in ("/v1/models", "/health"):
+            self._send_json(200, {"object": "list", "data": [{"id": "fake-model", "object": "model"}]})
+        else:
+            self._send_json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        request = json.loads(self.rfile.read(length) or b"{}")
+
+        if self.path.rstrip("/") != "/v1/chat/completions":
+            self._send_json(404, {"error": {"message": "not found"}})
+            return
+
+        config = self.config
+        delay = max(0.0, config.latency_ms + random.uniform(-config.jitter_ms, config.jitter_ms)) / 1000
+        time.sleep(delay)
+
+        if random.random() < config.error_rate:
+            self._send_json(500, {"error": {"message": "fake upstream error", "type": "server_error"}})
+            return
+
+        with self.counter_lock:
+            FakeLLMHandler.counter += 1
+            number = FakeLLMHandler.counter
+
+        messages = request.get("messages", [])
+        prompt_chars = sum(len(m.get("content") or "") for m in messages)
+        system = next((m.get("content") or "" for m in messages if m.get("role") == "system"), "")
+
+        if '"results"' in system:
+            # 일괄 분류: 사용자 메시지의 번호 매긴 항목 수만큼
+            user = next((m.get("content") or "" for m in messages if m.get("role") == "user"), "")
+            count = len(re.findall(r"^\d+\. ", user, re.MULTILINE))
+            content = json.dumps({
+                "results": [{"index": i, **random.choice(JSON_ANSWERS)} for i in range(1, count + 1)]
+            }, ensure_ascii=False)
+        elif request.get("response_format", {}).get("type") == "json_object" or "JSON" in system:
+            content = json.dumps(random.choice(JSON_ANSWERS), ensure_ascii=False)
+        else:
+            content = SUMMARY_TEXT
+
+        # 한글 위주 텍스트 기준 대략적인 토큰 수
+        prompt_tokens = max(1, int(prompt_chars * 0.8))
+        completion_tokens = max(1, int(len(content) * 0.8))
+        self._send_json(200, {
+            "id": f"chatcmpl-fake-{number}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": request.get("model", "fake-model"),
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "prompt_tokens_details": {"cached_tokens": int(prompt_tokens * config.cached_ratio)},
+            },
+        })
+
+
+def main():
+    args = parser.parse_args()
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    FakeLLMHandler.config = args
+    server = ThreadingHTTPServer((args.host, args.port), FakeLLMHandler)
+    server.daemon_threads = True
+
+    print(f"Fake LLM server on http://{args.host}:{args.port}/v1 "
+          f"(latency {args.latency_ms:.0f}+/-{args.jitter_ms:.0f}ms, error rate {args.error_rate:.0%})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
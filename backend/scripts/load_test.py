@@ -0,0 +1,367 @@
+"""
+엔드투엔드 부하 테스트
+가짜 LLM 서버(scripts/fake_llm_server.py)와 함께 앱을 띄우고 상담, 지출 등록, 분류, 대시보드, 내보내기 요청을
+섞어 보내 엔드포인트별 처리량과 p50/p95/p99 지연을 측정합니다.
+
+사용법:
+    python scripts/load_test.py --duration 60 --concurrency 20 --output results/load.json
+    python scripts/load_test.py --database-url postgresql+asyncpg://user:pw@localhost/taxaigent_bench
+    python scripts/load_test.py --llm-latency-ms 1500 --llm-jitter-ms 500 --llm-error-rate 0.02
+    python scripts/load_test.py --embedding-model sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2
+    python scripts/load_test.py --in-process --duration 10        # uvicorn 없이 같은 프로세스에서 실행
+    python scripts/load_test.py --base-url http://localhost:8001  # 이미 실행 중인 서버 (LLM 설정은 서버 측 책임)
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import io
+import tempfile
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+# Windows 콘솔 UTF-8 출력 설정
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+
+# 프로젝트 루트를 Python 경로에 추가 (--in-process)
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.bench_stats import percentile
+
+parser = argparse.ArgumentParser(description="TaxAIgent 엔드투엔드 부하 테스트")
+target = parser.add_argument_group("대상 서버")
+target.add_argument("--base-url", default=None, help="이미 실행 중인 서버 (지정 시 앱/가짜 LLM을 띄우지 않음)")
+target.add_argument("--in-process", action="store_true", help="앱을 이 프로세스에서 ASGI로 직접 호출")
+target.add_argument("--port", type=int, default=8011)
+target.add_argument("--workers", type=int, default=1, help="uvicorn 워커 수")
+target.add_argument("--database-url", default=None, help="기본값: 임시 SQLite 파일")
+target.add_argument("--embedding-model", default=None, help="작은 임베딩 모델로 교체 (인덱스는 임시 디렉터리에 새로 빌드)")
+target.add_argument("--ready-timeout", type=float, default=300.0)
+llm = parser.add_argument_group("가짜 LLM")
+llm.add_argument("--llm-port", type=int, default=8900)
+llm.add_argument("--llm-latency-ms", type=float, default=500.0)
+llm.add_argument("--llm-jitter-ms", type=float, default=100.0)
+llm.add_argument("--llm-error-rate", type=float, default=0.0)
+load = parser.add_argument_group("부하")
+load.add_argument("--duration", type=float, default=30.0, help="측정 시간 (초)")
+load.add_argument("--warmup", type=float, default=3.0, help="측정 전 워밍업 시간 (초)")
+load.add_argument("--concurrency", type=int, default=10, help="동시 가상 사용자 수")
+load.add_argument("--mix", default="chat=4,expense=3,classify=1,dashboard=1,export=1", help="엔드포인트 가중치")
+load.add_argument("--seed", type=int, default=42)
+load.add_argument("--email", default="admin@taxaigent.kr", help="무제한 요금제 계정 (기본: 시드 관리자)")
+load.add_argument("--password", default="admin1234!")
+parser.add_argument("--output", default=None, help="결과 JSON 경로")
+
+API = "/api/v1"
+
+QUESTIONS = [
+    "업무용 노트북 구매 비용도 경비 처리가 되나요?",
+    "거래처와 저녁 식사한 비용은 어떻게 처리하나요?",
+    "집에서 일하는데 월세 일부를 경비로 넣을 수 있나요?",
+    "개인 차량 주유비를 경비로 처리할 수 있나요?",
+    "온라인 강의 수강료는 어떤 계정과목인가요?",
+]
+EXPENSES = [
+    ("노트북 구매", 1_500_000, "쿠팡"),
+    ("거래처 식사", 85_000, "한우마을"),
+    ("사무용품", 23_000, "오피스디포"),
+    ("주유", 60_000, "SK주유소"),
+    ("휴대폰 요금", 55_000, "SKT"),
+]
+
+
+def build_request(name: str, rng: random.Random) -> Tuple[str, str, dict]:
+    """(method, path, httpx kwargs) for one request of the given kind"""
+    today = date.today()
+    if name == "chat":
+        return "POST", f"{API}/chat/ask", {"json": {"question": rng.choice(QUESTIONS)}}
+    if name == "expense":
+        description, amount, vendor = rng.choice(EXPENSES)
+        return "POST", f"{API}/expenses", {"json": {
+            "date": str(today - timedelta(days=rng.randint(0, 60))),
+            "description": description,
+            "amount": amount,
+            "vendor": vendor,
+            "evidence_type": "card",
+        }}
+    if name == "classify":
+        description, amount, vendor = rng.choice(EXPENSES)
+        return "POST", f"{API}/expenses/classify", {"json": {
+            "description": description, "amount": amount, "vendor": vendor,
+        }}
+    if name == "dashboard":
+        return "GET", f"{API}/dashboard", {}
+    if name == "export":
+        return "GET", f"{API}/ledger/export", {"params": {"year": today.year, "month": today.month, "format": "excel"}}
+    raise ValueError(f"Unknown endpoint: {name}")
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        weights[name.strip()] = float(weight or 1)
+    for name in weights:
+        build_request(name, random.Random())  # 잘못된 이름 조기 검출
+    return weights
+
+
+# =============================================================================
+# Server processes
+# =============================================================================
+
+def app_env(args, workdir: Path) -> Dict[str, str]:
+    """Environment that points the app at the fake LLM and a scratch database"""
+    env = {
+        "DEBUG": "false",
+        "DATABASE_URL": args.database_url or f"sqlite+aiosqlite:///{workdir / 'loadtest.db'}",
+        "GEMINI_API_KEY": "",
+        "PINECONE_API_KEY": "",
+        "OPENAI_API_KEY": "fake",
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{args.llm_port}/v1",
+        "TRACING_EXPORTER": "none",
+    }
+    if args.embedding_model:
+        env["EMBEDDING_MODEL"] = args.embedding_model
+        env["VECTOR_STORE_DIR"] = str(workdir / "vector_store")
+    return env
+
+
+async def wait_for(url: str, timeout: float, process: Optional[subprocess.Popen] = None) -> None:
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(timeout=5.0) as client:
+        while time.perf_counter() < deadline:
+            if process is not None and process.poll() is not None:
+                raise RuntimeError(f"Process exited with code {process.returncode} before {url} was ready")
+            try:
+                if (await client.get(url)).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.5)
+    raise TimeoutError(f"{url} not ready after {timeout:.0f}s")
+
+
+async def wait_for_ready_in_process(client: httpx.AsyncClient, timeout: float) -> None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if (await client.get("/health/ready")).status_code == 200:
+            return
+        await asyncio.sleep(0.5)
+    raise TimeoutError(f"App not ready after {timeout:.0f}s")
+
+
+def start_fake_llm(args) -> subprocess.Popen:
+    return subprocess.Popen(
+        [
+            sys.executable, str(project_root / "scripts" / "fake_llm_server.py"),
+            "--port", str(args.llm_port),
+            "--latency-ms", str(args.llm_latency_ms),
+            "--jitter-ms", str(args.llm_jitter_ms),
+            "--error-rate", str(args.llm_error_rate),
+            "--seed", str(args.seed),
+        ],
+        cwd=project_root,
+    )
+
+
+def start_app(args, env: Dict[str, str]) -> subprocess.Popen:
+    return subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(args.port),
+            "--workers", str(args.workers), "--log-level", "warning",
+        ],
+        cwd=project_root,
+        env={**os.environ, **env},
+    )
+
+
+# =============================================================================
+# Load generation
+# =============================================================================
+
+async def login(client: httpx.AsyncClient, email: str, password: str) -> str:
+    response = await client.post(f"{API}/auth/login", json={"email": email, "password": password})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def virtual_user(
+    client: httpx.AsyncClient,
+    headers: dict,
+    weights: Dict[str, float],
+    rng: random.Random,
+    measure_from: float,
+    deadline: float,
+    results: Dict[str, list],
+) -> None:
+    names = list(weights)
+    weight_values = list(weights.values())
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights=weight_values)[0]
+        method, path, kwargs = build_request(name, rng)
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, path, headers=headers, **kwargs)
+            status = response.status_code
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+        elapsed = time.perf_counter() - start
+        if start >= measure_from:
+            results[name].append((elapsed, status))
+
+
+async def run_load(client: httpx.AsyncClient, args, weights: Dict[str, float]) -> Tuple[Dict[str, list], float]:
+    token = await login(client, args.email, args.password)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    results: Dict[str, list] = defaultdict(list)
+    start = time.perf_counter()
+    measure_from = start + args.warmup
+    deadline = measure_from + args.duration
+    await asyncio.gather(*[
+        virtual_user(client, headers, weights, random.Random(args.seed + i), measure_from, deadline, results)
+        for i in range(args.concurrency)
+    ])
+    return results, time.perf_counter() - measure_from
+
+
+def summarize(results: Dict[str, list], elapsed: float) -> dict:
+    endpoints = {}
+    total = errors = 0
+    for name in sorted(results):
+        samples = results[name]
+        latencies = sorted(latency * 1000 for latency, _ in samples)
+        failed = [status for _, status in samples if not (isinstance(status, int) and status < 400)]
+        total += len(samples)
+        errors += len(failed)
+        status_counts = defaultdict(int)
+        for _, status in samples:
+            status_counts[str(status)] += 1
+        endpoints[name] = {
+            "requests": len(samples),
+            "errors": len(failed),
+            "throughput_rps": round(len(samples) / elapsed, 2),
+            "mean_ms": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+            "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+            "status": dict(status_counts),
+        }
+    return {
+        "duration_s": round(elapsed, 2),
+        "requests": total,
+        "errors": errors,
+        "throughput_rps": round(total / elapsed, 2),
+        "endpoints": endpoints,
+    }
+
+
+async def server_snapshot(client: httpx.AsyncClient) -> dict:
+    """Loop lag and pool state reported by the server after the run"""
+    snapshot = {}
+    for key, path in (("loop", "/health/loop"), ("db_pool", "/health/db"), ("llm_output", "/health/llm")):
+        try:
+            response = await client.get(path)
+            if response.status_code == 200:
+                snapshot[key] = response.json()
+        except httpx.HTTPError:
+            pass
+    if "loop" in snapshot:
+        snapshot["loop"].pop("recent_blocks", None)
+    return snapshot
+
+
+def print_report(summary: dict) -> None:
+    print("\n" + "=" * 60)
+    print(f"결과 ({summary['duration_s']}s, {summary['requests']} requests, "
+          f"{summary['throughput_rps']} req/s, errors {summary['errors']})")
+    print("=" * 60)
+    print(f"{'endpoint':<10} {'reqs':>6} {'err':>5} {'rps':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}")
+    for name, stats in summary["endpoints"].items():
+        print(
+            f"{name:<10} {stats['requests']:>6} {stats['errors']:>5} {stats['throughput_rps']:>7} "
+            f"{stats['p50_ms']:>8} {stats['p95_ms']:>8} {stats['p99_ms']:>8} {stats['max_ms']:>8}"
+        )
+    print("(ms)")
+
+
+async def main():
+    args = parser.parse_args()
+    weights = parse_mix(args.mix)
+    workdir = Path(tempfile.mkdtemp(prefix="taxaigent-load-"))
+    processes: List[subprocess.Popen] = []
+
+    print("=" * 60)
+    print("TaxAIgent 부하 테스트")
+    print("=" * 60)
+    print(f"mix: {weights}, concurrency {args.concurrency}, duration {args.duration}s")
+
+    try:
+        if not args.base_url:
+            llm_process = start_fake_llm(args)
+            processes.append(llm_process)
+            await wait_for(f"http://127.0.0.1:{args.llm_port}/v1/models", 30, llm_process)
+
+        if args.in_process:
+            # 설정은 import 시점에 읽히므로 app import 전에 환경변수 설정
+            os.environ.update(app_env(args, workdir))
+            from app.main import app
+
+            transport = httpx.ASGITransport(app=app)
+            async with app.router.lifespan_context(app):
+                async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=120.0) as client:
+                    await wait_for_ready_in_process(client, args.ready_timeout)
+                    results, elapsed = await run_load(client, args, weights)
+                    snapshot = await server_snapshot(client)
+        else:
+            base_url = args.base_url
+            if not base_url:
+                app_process = start_app(args, app_env(args, workdir))
+                processes.append(app_process)
+                base_url = f"http://127.0.0.1:{args.port}"
+                await wait_for(f"{base_url}/health/ready", args.ready_timeout, app_process)
+            else:
+                await wait_for(f"{base_url}/health/ready", args.ready_timeout)
+
+            limits = httpx.Limits(max_connections=args.concurrency * 2, max_keepalive_connections=args.concurrency)
+            async with httpx.AsyncClient(base_url=base_url, timeout=120.0, limits=limits) as client:
+                results, elapsed = await run_load(client, args, weights)
+                snapshot = await server_snapshot(client)
+    finally:
+        for process in reversed(processes):
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    summary = summarize(results, elapsed)
+    summary["server"] = snapshot
+    summary["config"] = {
+        key: value for key, value in vars(args).items() if key not in ("password",)
+    }
+    summary["config"]["mode"] = "base-url" if args.base_url else ("in-process" if args.in_process else "uvicorn")
+    print_report(summary)
+
+    if args.output:
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n결과 저장: {output_path}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -35,8 +35,9 @@ def main():
     # 싱글톤 인스턴스 초기화 리셋
     LocalVectorStore._instance = None
 
-    # 새 인스턴스 생성 (자동으로 빌드됨)
+    # 새 인스턴스 생성 후 빌드
     store = LocalVectorStore()
+    store.load()
 
     print("\n" + "=" * 60)
     print(f"완료! 총 {store.document_count}개 문서 인덱싱됨")
@@ -0,0 +1,62 @@
+"""
+Scratch DB - 점검/벤치마크 스크립트용 임시 데이터베이스
+--database-url로 받은 PostgreSQL 서버에 고유한 이름의 DB를 새로 만들고, 끝나면 그 DB만 삭제합니다.
+URL을 주지 않으면 임시 SQLite 파일을 사용합니다. 주어진 DB의 기존 테이블은 건드리지 않습니다.
+"""
+import shutil
+import tempfile
+import uuid
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+
+project_root = Path(__file__).parent.parent
+
+
+async def _execute_autocommit(server_url, statement: str) -> None:
+    engine = create_async_engine(server_url, isolation_level="AUTOCOMMIT")
+    try:
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql(statement)
+    finally:
+        await engine.dispose()
+
+
+async def create_scratch_database(server_url: Optional[str], prefix: str) -> str:
+    """Create an empty, uniquely named database and return its URL"""
+    if server_url is None:
+        return f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/{prefix}.db"
+
+    url = make_url(server_url)
+    if url.get_backend_name() != "postgresql":
+        raise SystemExit(
+            f"--database-url은 PostgreSQL 서버만 지원합니다 ({url.get_backend_name()}). "
+            "SQLite는 생략하면 임시 파일을 사용합니다."
+        )
+
+    name = f"{prefix}_{uuid.uuid4().hex[:8]}"
+    await _execute_autocommit(url, f'CREATE DATABASE "{name}"')
+    print(f"Scratch database: {name}")
+    return url.set(database=name).render_as_string(hide_password=False)
+
+
+async def drop_scratch_database(server_url: Optional[str], scratch_url: str) -> None:
+    """Drop a database made by create_scratch_database (connects through server_url)"""
+    url = make_url(scratch_url)
+    if url.get_backend_name() == "sqlite":
+        shutil.rmtree(Path(url.database).parent, ignore_errors=True)
+        return
+    await _execute_autocommit(make_url(server_url), f'DROP DATABASE IF EXISTS "{url.database}"')
+
+
+def upgrade_schema(database_url: str) -> None:
+    """alembic upgrade head (blocking - env.py runs its own event loop, use asyncio.to_thread)"""
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(str(project_root / "alembic.ini"))
+    config.set_main_option("script_location", str(project_root / "alembic"))
+    config.attributes["database_url"] = database_url
+    command.upgrade(config, "head")